@@ -8,74 +8,80 @@ __version__ = "0.2.0"
 __author__ = "PROMETHEUS Team"
 __description__ = "LangChain-based Multi-Agent Orchestration Framework"
 
+import importlib
+
 # =============================================================================
-# LangChain Agents (새로운 구조)
+# 지연 로딩 (PEP 562)
 # =============================================================================
-from prometheus.agents import (
-    # Base
-    BaseLangChainAgent,
-    SimpleChainAgent,
-    StructuredOutputAgent,
-    AgentConfig,
-    AgentRole,
-    AgentOutput,
-    
-    # Planner
-    PlannerAgent,
-    PlanOutput,
-    PlanStep,
-    create_planner_agent,
-    
-    # Executor
-    ExecutorAgent,
-    ExecutionResult,
-    StepResult,
-    ToolCallResult,
-    create_executor_agent,
-    python_exec,
-    file_write,
-    file_read,
-    web_search,
-    rag_search,
-    DEFAULT_TOOLS,
-    
-    # Writer
-    WriterAgent,
-    ReportOutput,
-    Citation,
-    create_writer_agent,
-    
-    # QA
-    QAAgent,
-    QAResult,
-    QAIssue,
-    create_qa_agent,
-    
-    # Utility
-    create_all_agents,
+
+# 패키지 import 시 LangChain/LangGraph 전체를 로드하지 않도록, 아래 이름은
+# 처음 접근할 때 해당 모듈을 로드합니다 (CLI 시작 시간 단축).
+_AGENT_EXPORTS = (
+    "BaseLangChainAgent",
+    "SimpleChainAgent",
+    "StructuredOutputAgent",
+    "AgentConfig",
+    "AgentRole",
+    "AgentOutput",
+    "PlannerAgent",
+    "PlanOutput",
+    "PlanStep",
+    "create_planner_agent",
+    "ExecutorAgent",
+    "ExecutionResult",
+    "StepResult",
+    "ToolCallResult",
+    "create_executor_agent",
+    "python_exec",
+    "file_write",
+    "file_read",
+    "web_search",
+    "rag_search",
+    "DEFAULT_TOOLS",
+    "WriterAgent",
+    "ReportOutput",
+    "Citation",
+    "create_writer_agent",
+    "QAAgent",
+    "QAResult",
+    "QAIssue",
+    "create_qa_agent",
+    "create_all_agents",
 )
 
-# =============================================================================
-# LangGraph Workflow
-# =============================================================================
-from prometheus.graphs import (
-    # State
-    AgentState,
-    create_initial_state,
-    
-    # Workflow
-    create_workflow,
-    PrometheusWorkflow,
-    run_workflow_cli,
-    
-    # Nodes
-    meta_agent_node,
-    planner_node,
-    executor_node,
-    writer_node,
-    qa_node,
+_GRAPH_EXPORTS = (
+    "AgentState",
+    "create_initial_state",
+    "create_workflow",
+    "PrometheusWorkflow",
+    "run_workflow_cli",
+    "meta_agent_node",
+    "planner_node",
+    "executor_node",
+    "writer_node",
+    "qa_node",
 )
 
+_LAZY_EXPORTS = {
+    **dict.fromkeys(_AGENT_EXPORTS, "prometheus.agents"),
+    **dict.fromkeys(_GRAPH_EXPORTS, "prometheus.graphs"),
+}
+
+
+def __getattr__(name: str):
+    """지연 로딩 대상 조회"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 # =============================================================================
 # Export
 # =============================================================================
@@ -5,6 +5,8 @@ LangChain 기반 Multi-Agent 시스템
 각 Agent는 특정 역할을 수행합니다.
 """
 
+import importlib
+
 # LangChain 기반 Agent
 from prometheus.agents.langchain_base import (
     BaseLangChainAgent,
@@ -68,23 +70,6 @@ from prometheus.agents.gis import (
     create_gis_agent,
 )
 
-from prometheus.agents.swmm import (
-    SWMMAgent,
-    SWMMOutput,
-    RainfallEvent,
-    SubcatchmentResult,
-    NodeResult,
-    LIDPerformance,
-    create_swmm_agent,
-)
-
-from prometheus.agents.visualization import (
-    VisualizationAgent,
-    VisualizationOutput,
-    ChartSpec,
-    create_visualization_agent,
-)
-
 from prometheus.agents.academic_writer import (
     AcademicWriterAgent,
     AcademicPaperOutput,
@@ -168,6 +153,40 @@ __all__ = [
 ]
 
 
+# =============================================================================
+# 지연 로딩 (SWMM / Visualization)
+# =============================================================================
+
+# 사용 빈도가 낮은 도메인 Agent는 처음 접근할 때 모듈을 로드 (PEP 562)
+_LAZY_EXPORTS = {
+    "SWMMAgent": "prometheus.agents.swmm",
+    "SWMMOutput": "prometheus.agents.swmm",
+    "RainfallEvent": "prometheus.agents.swmm",
+    "SubcatchmentResult": "prometheus.agents.swmm",
+    "NodeResult": "prometheus.agents.swmm",
+    "LIDPerformance": "prometheus.agents.swmm",
+    "create_swmm_agent": "prometheus.agents.swmm",
+    "VisualizationAgent": "prometheus.agents.visualization",
+    "VisualizationOutput": "prometheus.agents.visualization",
+    "ChartSpec": "prometheus.agents.visualization",
+    "create_visualization_agent": "prometheus.agents.visualization",
+}
+
+
+def __getattr__(name: str):
+    """지연 로딩 대상 Agent 조회"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 # =============================================================================
 # 편의 함수
 # =============================================================================
@@ -16,6 +16,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from prometheus.llm.base import BaseLLMClient, Message, MessageRole, LLMResponse
+from prometheus.llm.cache import LLMResponseCache
 
 
 class AgentState(str, Enum):
@@ -106,12 +107,23 @@ class BaseAgent(ABC):
         self.config = config or AgentConfig()
         self._llm = llm
         self._tools: Dict[str, Any] = {}
+        self._tools_csv: Optional[str] = None  # Tool 이름 목록 캐시
         self._memory = memory
         self._state = AgentState.IDLE
         self._messages: List[Message] = []
         self._iteration_count = 0
         self._start_time: Optional[datetime] = None
         
+        # 동일 프롬프트에 대한 LLM 응답 캐시 (설정에 response_cache_size가 있는 Agent만)
+        cache_size = getattr(self.config, "response_cache_size", 0)
+        self._response_cache: Optional[LLMResponseCache] = (
+            LLMResponseCache(
+                max_size=cache_size,
+                default_ttl=getattr(self.config, "response_cache_ttl", 3600.0),
+            )
+            if cache_size > 0 else None
+        )
+        
         # Tools 등록
         if tools:
             for tool in tools:
@@ -181,6 +193,7 @@ class BaseAgent(ABC):
         """
         tool_name = getattr(tool, 'name', str(tool.__class__.__name__))
         self._tools[tool_name] = tool
+        self._tools_csv = None
         return self
     
     def bind_tools(
@@ -231,6 +244,7 @@ class BaseAgent(ABC):
         """
         if tool_name in self._tools:
             del self._tools[tool_name]
+            self._tools_csv = None
             return True
         return False
     
@@ -259,6 +273,19 @@ class BaseAgent(ABC):
         """대화 히스토리"""
         return self._messages
     
+    def _get_tools_csv(self) -> str:
+        """
+        바인딩된 Tool 이름 목록 (쉼표 구분)
+        
+        Tool 바인딩/해제 시에만 다시 생성합니다.
+        
+        Returns:
+            Tool 이름 문자열 (Tool이 없으면 빈 문자열)
+        """
+        if self._tools_csv is None:
+            self._tools_csv = ", ".join(self._tools)
+        return self._tools_csv
+    
     def get_system_prompt(self) -> str:
         """
         시스템 프롬프트 조회
@@ -301,6 +328,57 @@ class BaseAgent(ABC):
         
         return await self._llm.generate(messages, **kwargs)
     
+    async def _call_llm_cached(
+        self,
+        method: str,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+    ) -> str:
+        """
+        응답 캐시를 거쳐 LLM 호출
+        
+        응답 텍스트를 캐시하고 호출마다 새로 파싱하므로, 반환된 결과를
+        호출 측에서 수정해도 캐시에 영향을 주지 않습니다.
+        
+        Args:
+            method: 호출 메서드 이름 (캐시 키 구분용)
+            messages: 메시지 목록
+            temperature: LLM 온도 (None이면 설정값 또는 프로바이더 기본값)
+            
+        Returns:
+            LLM 응답 텍스트
+        """
+        if temperature is None:
+            temperature = self.config.temperature
+        kwargs = {} if temperature is None else {"temperature": temperature}
+        
+        cache = self._response_cache
+        max_temperature = getattr(self.config, "response_cache_max_temperature", 0.0)
+        if cache is None or (temperature is not None and temperature > max_temperature):
+            response = await self._call_llm(messages, **kwargs)
+            return response.content
+        
+        key = cache.make_key(
+            provider=self.agent_type,
+            model=getattr(getattr(self._llm, "config", None), "model", ""),
+            temperature=temperature,
+            method=method,
+            system=messages[0].content,
+            prompt=messages[-1].content,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = await self._call_llm(messages, **kwargs)
+        cache.set(key, response.content)
+        return response.content
+    
+    def clear_response_cache(self) -> None:
+        """응답 캐시 초기화"""
+        if self._response_cache is not None:
+            self._response_cache.clear()
+    
     async def _call_llm_with_tools(
         self,
         messages: List[Message],
@@ -238,7 +238,7 @@ class ExecutorAgent(BaseLangChainAgent):
         
         # 프롬프트
         self.prompt = ChatPromptTemplate.from_messages([
-            ("system", self._get_system_prompt()),
+            self._system_message(),
             MessagesPlaceholder(variable_name="messages"),
         ])
         
@@ -18,6 +18,7 @@ from typing import (
 )
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 import logging
 
 from pydantic import BaseModel, Field
@@ -35,6 +36,8 @@ from langchain_core.runnables import (
 )
 from langchain_core.runnables.utils import Input, Output
 
+from prometheus.llm.cache import LLMResponseCache, get_response_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +70,9 @@ class AgentConfig(BaseModel):
     max_tokens: int = Field(default=2000, description="최대 토큰")
     retry_count: int = Field(default=3, description="재시도 횟수")
     timeout: float = Field(default=300.0, description="타임아웃(초)")
+    max_concurrency: Optional[int] = Field(default=None, description="배치 실행 시 최대 동시 호출 수 (None이면 제한 없음)")
+    prompt_caching: bool = Field(default=False, description="시스템 프롬프트에 cache_control 지정 (Anthropic 프롬프트 캐싱)")
+    response_cache: bool = Field(default=False, description="동일 입력의 구조화 출력 재사용 (전역 응답 캐시)")
     
     model_config = {"use_enum_values": True}
 
@@ -153,6 +159,24 @@ class BaseLangChainAgent(Runnable[InputType, OutputType], ABC):
         """시스템 프롬프트 반환 (하위 클래스에서 구현)"""
         pass
     
+    def _system_message(self) -> SystemMessage:
+        """
+        체인 프롬프트의 시스템 메시지
+        
+        템플릿이 아닌 메시지로 전달하므로 스키마 예시 등의 중괄호가 변수로
+        해석되지 않고, 호출마다 다시 포맷하지 않습니다.
+        config.prompt_caching이면 Anthropic 프롬프트 캐싱용 cache_control을 지정합니다.
+        
+        Returns:
+            SystemMessage
+        """
+        prompt = self._get_system_prompt()
+        if self.config.prompt_caching:
+            return SystemMessage(content=[
+                {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}},
+            ])
+        return SystemMessage(content=prompt)
+    
     def _normalize_input(self, input_data: InputType) -> Dict[str, Any]:
         """입력 데이터 정규화"""
         if isinstance(input_data, str):
@@ -290,7 +314,7 @@ class BaseLangChainAgent(Runnable[InputType, OutputType], ABC):
             출력 결과 리스트
         """
         input_dicts = [self._normalize_input(inp) for inp in inputs]
-        return self.chain.batch(input_dicts, config=config, **kwargs)
+        return self.chain.batch(input_dicts, config=self._batch_config(config), **kwargs)
     
     async def abatch(
         self,
@@ -310,7 +334,24 @@ class BaseLangChainAgent(Runnable[InputType, OutputType], ABC):
             출력 결과 리스트
         """
         input_dicts = [self._normalize_input(inp) for inp in inputs]
-        return await self.chain.abatch(input_dicts, config=config, **kwargs)
+        return await self.chain.abatch(input_dicts, config=self._batch_config(config), **kwargs)
+    
+    def _batch_config(
+        self,
+        config: Optional[Union[RunnableConfig, List[RunnableConfig]]],
+    ) -> Optional[Union[RunnableConfig, List[RunnableConfig]]]:
+        """
+        배치 설정에 Agent의 최대 동시 호출 수 적용
+        
+        Args:
+            config: 호출 측 Runnable 설정 (지정되면 그대로 사용)
+        
+        Returns:
+            Runnable 설정
+        """
+        if config is None and self.config.max_concurrency:
+            return {"max_concurrency": self.config.max_concurrency}
+        return config
     
     # =========================================================================
     # LCEL 유틸리티 메서드
@@ -471,7 +512,7 @@ class SimpleChainAgent(BaseLangChainAgent):
     def _build_chain(self) -> Runnable:
         """LCEL Chain 구성"""
         prompt = ChatPromptTemplate.from_messages([
-            ("system", self._get_system_prompt()),
+            self._system_message(),
             MessagesPlaceholder(variable_name="history", optional=True),
             ("human", "{input}"),
         ])
@@ -487,6 +528,20 @@ class SimpleChainAgent(BaseLangChainAgent):
 # StructuredOutputAgent
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def _schema_info(schema: Type[BaseModel]) -> str:
+    """
+    시스템 프롬프트에 붙일 출력 스키마 설명 (스키마 클래스별로 한 번만 생성)
+    
+    Args:
+        schema: Pydantic 출력 스키마
+    
+    Returns:
+        스키마 설명 문자열
+    """
+    return f"\n\n[Output Schema]\n{schema.model_json_schema()}"
+
+
 class StructuredOutputAgent(BaseLangChainAgent, Generic[OutputType]):
     """
     구조화된 출력 Agent
@@ -526,10 +581,78 @@ class StructuredOutputAgent(BaseLangChainAgent, Generic[OutputType]):
         self._output_schema = output_schema  # _로 변경 (Runnable.output_schema property 충돌 방지)
         super().__init__(llm, config, **kwargs)
     
+    def invoke_cached(self, input: str) -> Any:
+        """
+        응답 캐시를 거쳐 동기 실행
+        
+        config.response_cache가 켜져 있으면 같은 입력에 대한 스키마 출력을
+        전역 응답 캐시(모든 Agent 공유)에서 재사용합니다.
+        
+        Args:
+            input: 입력 텍스트
+        
+        Returns:
+            출력 결과 (캐시 히트 시 복사본)
+        """
+        key = self._response_cache_key(input)
+        if key is None:
+            return self.invoke(input)
+        
+        cache = get_response_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+        
+        result = self.invoke(input)
+        self._store_response(cache, key, result)
+        return result
+    
+    async def ainvoke_cached(self, input: str) -> Any:
+        """
+        응답 캐시를 거쳐 비동기 실행
+        
+        Args:
+            input: 입력 텍스트
+        
+        Returns:
+            출력 결과 (캐시 히트 시 복사본)
+        """
+        key = self._response_cache_key(input)
+        if key is None:
+            return await self.ainvoke(input)
+        
+        cache = get_response_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+        
+        result = await self.ainvoke(input)
+        self._store_response(cache, key, result)
+        return result
+    
+    def _response_cache_key(self, input: str) -> Optional[str]:
+        """응답 캐시 키 (캐시 비활성화 시 None)"""
+        if not self.config.response_cache:
+            return None
+        return get_response_cache().make_key(
+            provider=type(self.llm).__name__,
+            model=str(getattr(self.llm, "model_name", None) or getattr(self.llm, "model", "")),
+            prompt=input,
+            temperature=self.config.temperature,
+            agent=self.config.name,
+            system=self.config.system_prompt,
+            schema=self._output_schema.__name__,
+        )
+    
+    def _store_response(self, cache: LLMResponseCache, key: str, result: Any) -> None:
+        """스키마에 맞는 결과만 캐시 (dict 등 검증 전 결과는 제외)"""
+        if isinstance(result, self._output_schema):
+            cache.set(key, result.model_copy(deep=True))
+    
     def _build_chain(self) -> Runnable:
         """LCEL Chain 구성 (구조화된 출력)"""
         prompt = ChatPromptTemplate.from_messages([
-            ("system", self._get_system_prompt()),
+            self._system_message(),
             MessagesPlaceholder(variable_name="history", optional=True),
             ("human", "{input}"),
         ])
@@ -545,8 +668,7 @@ class StructuredOutputAgent(BaseLangChainAgent, Generic[OutputType]):
         
         # 스키마 정보 추가
         if self._output_schema:
-            schema_info = f"\n\n[Output Schema]\n{self._output_schema.model_json_schema()}"
-            return base_prompt + schema_info
+            return base_prompt + _schema_info(self._output_schema)
         
         return base_prompt
 
@@ -586,7 +708,7 @@ class ToolCallingAgent(BaseLangChainAgent):
     def _build_chain(self) -> Runnable:
         """LCEL Chain 구성 (Tool 바인딩)"""
         prompt = ChatPromptTemplate.from_messages([
-            ("system", self._get_system_prompt()),
+            self._system_message(),
             MessagesPlaceholder(variable_name="history", optional=True),
             ("human", "{input}"),
         ])
@@ -136,25 +136,24 @@ class LiteratureAgent(StructuredOutputAgent):
                 input_text += f"\n\n이미 확보한 논문: {context['existing_papers']}"
         
         try:
+            # with_structured_output이 스키마 타입을 보장하므로 재검증하지 않음
             result = self.invoke(input_text)
-            
             if isinstance(result, LiteratureReviewOutput):
                 return result
-            elif isinstance(result, dict):
-                return LiteratureReviewOutput(**result)
-            else:
-                raise ValueError(f"Unexpected result type: {type(result)}")
-                
+            error: Any = TypeError(f"Unexpected result type: {type(result)}")
         except Exception as e:
-            # 폴백 결과
-            return LiteratureReviewOutput(
-                topic=topic,
-                search_keywords=[topic],
-                papers=[],
-                summary=f"문헌 조사 중 오류 발생: {e}",
-                research_gaps=[],
-                recommended_citations=[],
-            )
+            error = e
+        
+        return self._fallback_output(topic, error)
+    
+    @staticmethod
+    def _fallback_output(topic: str, error: Any) -> LiteratureReviewOutput:
+        """실패 시 폴백 결과 생성"""
+        return LiteratureReviewOutput(
+            topic=topic,
+            search_keywords=[topic],
+            summary=f"문헌 조사 중 오류 발생: {error}",
+        )
 
 
 # =============================================================================
@@ -138,30 +138,32 @@ class PlannerAgent(StructuredOutputAgent):
         
         try:
             # 새 Runnable 구조: invoke가 직접 결과 반환
+            # (with_structured_output이 PlanOutput 타입을 보장하므로 재검증하지 않음)
             result = self.invoke(input_text)
-            
             if isinstance(result, PlanOutput):
                 return result
-            elif isinstance(result, dict):
-                return PlanOutput(**result)
-            else:
-                raise ValueError(f"Unexpected result type: {type(result)}")
-                
+            error: Any = TypeError(f"Unexpected result type: {type(result)}")
         except Exception as e:
-            # 실패 시 기본 계획 반환
-            return PlanOutput(
-                task_summary=request[:100],
-                analysis="계획 수립 실패",
-                steps=[
-                    PlanStep(
-                        step_id=1,
-                        action="요청 직접 처리",
-                        expected_output="처리 결과"
-                    )
-                ],
-                total_steps=1,
-                notes=f"오류: {str(e)}"
-            )
+            error = e
+        
+        return self._fallback_plan(request, error)
+    
+    @staticmethod
+    def _fallback_plan(request: str, error: Any) -> PlanOutput:
+        """실패 시 기본 계획 생성"""
+        return PlanOutput(
+            task_summary=request[:100],
+            analysis="계획 수립 실패",
+            steps=[
+                PlanStep(
+                    step_id=1,
+                    action="요청 직접 처리",
+                    expected_output="처리 결과"
+                )
+            ],
+            total_steps=1,
+            notes=f"오류: {str(error)}"
+        )
 
 
 # =============================================================================
@@ -8,10 +8,14 @@ PlannerAgent - 계획 수립 Agent
 - 의존성 분석
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+import asyncio
+import heapq
 import json
+import re
+import time
 
 from prometheus.agents.base import (
     BaseAgent,
@@ -21,6 +25,102 @@ from prometheus.agents.base import (
     AgentState,
 )
 from prometheus.llm.base import Message, MessageRole
+from prometheus.llm.cache import LLMResponseCache
+from prometheus.utils.serialization import dumps_cached
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    _json_loads = json.loads
+
+
+# LLM 응답 JSON 추출 패턴
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_JSON_CLOSERS = {"{": "}", "[": "]"}
+
+
+def _scan_json(text: str) -> Optional[str]:
+    """
+    텍스트에서 첫 번째로 완결된 JSON 객체/배열 추출
+    
+    괄호 깊이와 문자열 상태를 추적하며 한 번만 순회하므로
+    앞뒤에 설명 문장이 붙은 응답도 정규식 백트래킹 없이 처리합니다.
+    
+    Args:
+        text: 원본 텍스트
+        
+    Returns:
+        JSON 문자열 (없으면 None)
+    """
+    start = -1
+    for i, char in enumerate(text):
+        if char in _JSON_CLOSERS:
+            start = i
+            break
+    if start < 0:
+        return None
+    
+    stack = []
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _JSON_CLOSERS:
+            stack.append(_JSON_CLOSERS[char])
+        elif stack and char == stack[-1]:
+            stack.pop()
+            if not stack:
+                return text[start:i + 1]
+    
+    # 닫히지 않은 JSON은 그대로 반환하여 파싱 단계에서 실패 처리
+    return text[start:]
+
+# 순환 의존성 검사용 DFS 방문 상태
+_WHITE, _GRAY, _BLACK = 0, 1, 2
+
+# 작업 템플릿화 대상 (URL, 인용 문자열, 경로)
+# 숫자는 단계 설명의 무관한 값("3-day" 등)과 우연히 일치하기 쉬워 슬롯으로 쓰지 않음
+_SLOT_PATTERN = re.compile(
+    r"https?://\S+"
+    r"|\"[^\"]*\"|'[^']*'"
+    r"|(?:[\w.-]*/)+[\w.-]+"
+)
+
+
+def _templatize_task(task: str) -> Tuple[str, List[str]]:
+    """
+    작업 설명을 템플릿으로 정규화
+    
+    구체적인 값(URL, 경로, 인용 문자열)을 <SLOT_i> 자리표시자로 치환합니다.
+    
+    Args:
+        task: 작업 설명
+        
+    Returns:
+        (템플릿 문자열, 슬롯 값 목록)
+    """
+    slots: List[str] = []
+    
+    def _replace(match: "re.Match[str]") -> str:
+        slots.append(match.group(0).strip("\"'"))
+        return f"<SLOT_{len(slots) - 1}>"
+    
+    return _SLOT_PATTERN.sub(_replace, " ".join(task.split())), slots
+
+
+def _slot_value_pattern(value: str) -> "re.Pattern[str]":
+    """단어 경계를 지키는 슬롯 값 검색 패턴"""
+    return re.compile(r"(?<![\w<])" + re.escape(value) + r"(?![\w>])")
 
 
 class TaskPriority(str, Enum):
@@ -41,6 +141,14 @@ class TaskStatus(str, Enum):
     SKIPPED = "skipped"
 
 
+# 완료로 간주하는 상태 (의존성 해소 기준)
+_DONE_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.SKIPPED})
+
+# LLM 응답 정규화용 조회 테이블
+_PRIORITY_BY_VALUE: Dict[str, TaskPriority] = {p.value: p for p in TaskPriority}
+_AGENT_TYPES = frozenset({"planner", "executor", "writer", "qa"})
+
+
 class PlanStep(BaseModel):
     """계획 단계"""
     
@@ -51,11 +159,59 @@ class PlanStep(BaseModel):
     tools_required: List[str] = Field(default_factory=list)
     dependencies: List[str] = Field(default_factory=list)
     priority: TaskPriority = TaskPriority.MEDIUM
+    # ExecutionPlan에 포함된 단계의 상태는 update_step_status로 변경
+    # (직접 할당하면 스케줄링 인덱스가 갱신되지 않으므로 rebuild_index() 호출 필요)
     status: TaskStatus = TaskStatus.PENDING
     estimated_time: Optional[float] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+# 스케줄링 시 우선순위 정렬 순서 (작을수록 먼저 실행)
+_PRIORITY_RANK: Dict[str, int] = {
+    TaskPriority.HIGH: 0,
+    TaskPriority.MEDIUM: 1,
+    TaskPriority.LOW: 2,
+}
+
+
+def _topo_critical_path(
+    successors: List[List[int]],
+    indegree: List[int],
+    weights: List[float],
+) -> Tuple[List[int], List[float]]:
+    """
+    위상 순서와 임계 경로 길이 계산 (정수 인덱스 기반)
+    
+    Args:
+        successors: 단계별 후속 단계 인덱스 목록
+        indegree: 단계별 선행 단계 수 (호출 후 변경됨)
+        weights: 단계별 소요 시간
+        
+    Returns:
+        (위상 순서, 임계 경로 길이) - 순환에 포함된 단계는 위상 순서에서
+        제외되고 임계 경로 길이는 자신의 소요 시간으로 설정됨
+    """
+    # Kahn 알고리즘
+    order = [i for i, n in enumerate(indegree) if n == 0]
+    for u in order:
+        for v in successors[u]:
+            indegree[v] -= 1
+            if indegree[v] == 0:
+                order.append(v)
+    
+    # 해당 단계부터 마지막 단계까지의 최장 경로 (역위상 순서 DP)
+    cp = list(weights)
+    visited = [False] * len(weights)
+    for u in reversed(order):
+        longest = 0.0
+        for v in successors[u]:
+            if visited[v] and cp[v] > longest:
+                longest = cp[v]
+        cp[u] = weights[u] + longest
+        visited[u] = True
+    return order, cp
+
+
 class ExecutionPlan(BaseModel):
     """실행 계획"""
     
@@ -67,55 +223,224 @@ class ExecutionPlan(BaseModel):
     estimated_total_time: Optional[float] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
+    # 스케줄링 인덱스 (Kahn 알고리즘)
+    # 단계 ID → 정수 인덱스 매핑 외의 스케줄링 상태는 정수 인덱스 기반 병렬 배열로 보관
+    _seq: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _nodes: List[PlanStep] = PrivateAttr(default_factory=list)
+    _indegree: List[int] = PrivateAttr(default_factory=list)
+    _successors: List[List[int]] = PrivateAttr(default_factory=list)
+    _critical_path: List[float] = PrivateAttr(default_factory=list)
+    _topo_order: List[int] = PrivateAttr(default_factory=list)
+    _ready: List[Tuple[float, int, int]] = PrivateAttr(default_factory=list)
+    _dirty: bool = PrivateAttr(default=True)
+    _indexed_steps: Optional[List[PlanStep]] = PrivateAttr(default=None)
+    _step_count: int = PrivateAttr(default=0)
+    _completed_count: int = PrivateAttr(default=0)
+    
     def model_post_init(self, __context: Any) -> None:
         """초기화 후 처리"""
         self.total_steps = len(self.steps)
+        self._build_schedule()
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "ExecutionPlan":
+        """
+        계획 복사
+        
+        복사본의 스케줄링 인덱스가 원본 단계 객체를 가리키지 않도록
+        복사된 steps 기준으로 인덱스를 재구성합니다.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied.rebuild_index()
+        return copied
+    
+    def _build_schedule(self) -> None:
+        """
+        스케줄링 인덱스 구성
+        
+        단계 ID별 정수 인덱스와 이에 맞춘 진입 차수(미완료 의존성 수),
+        후속 단계 목록, 위상 순서, 임계 경로 길이, 실행 가능 단계 힙을
+        O(V+E)로 만듭니다.
+        """
+        # 중복 ID는 첫 단계로 조회되지만 모든 단계를 스케줄링 대상에 포함
+        seq: Dict[str, int] = {}
+        nodes: List[PlanStep] = list(self.steps)
+        for i, step in enumerate(nodes):
+            seq.setdefault(step.step_id, i)
+        
+        indegree: List[int] = [0] * len(nodes)
+        total_deps: List[int] = [0] * len(nodes)
+        successors: List[List[int]] = [[] for _ in nodes]
+        
+        for i, step in enumerate(nodes):
+            for dep_id in step.dependencies:
+                dep_idx = seq.get(dep_id)
+                if dep_idx is None:
+                    # 존재하지 않는 의존성은 무시
+                    continue
+                successors[dep_idx].append(i)
+                total_deps[i] += 1
+                if nodes[dep_idx].status not in _DONE_STATUSES:
+                    indegree[i] += 1
+        
+        weights = [step.estimated_time or 1.0 for step in nodes]
+        topo_order, critical_path = _topo_critical_path(successors, total_deps, weights)
+        
+        self._completed_count = sum(1 for step in nodes if step.status in _DONE_STATUSES)
+        self._indexed_steps = self.steps
+        self._step_count = len(nodes)
+        self._seq = seq
+        self._nodes = nodes
+        self._indegree = indegree
+        self._successors = successors
+        self._topo_order = topo_order
+        self._critical_path = critical_path
+        
+        ready = [
+            self._ready_key(i)
+            for i, step in enumerate(nodes)
+            if indegree[i] == 0 and step.status == TaskStatus.PENDING
+        ]
+        heapq.heapify(ready)
+        self._ready = ready
+        self._dirty = False
+    
+    def _ready_key(self, i: int) -> Tuple[float, int, int]:
+        """실행 가능 힙 정렬 키 (임계 경로가 긴 단계 → 우선순위 → 정의 순서)"""
+        return (
+            -self._critical_path[i],
+            _PRIORITY_RANK.get(self._nodes[i].priority, 1),
+            i,
+        )
+    
+    def _ensure_schedule(self) -> None:
+        """steps 목록이 교체/추가/삭제되었으면 인덱스 재구성"""
+        steps = self.steps
+        if self._dirty or steps is not self._indexed_steps or len(steps) != self._step_count:
+            self._build_schedule()
+    
+    def rebuild_index(self) -> None:
+        """
+        인덱스 재구성
+        
+        steps 목록이나 단계 상태를 직접 수정한 경우 호출합니다.
+        """
+        self.total_steps = len(self.steps)
+        self._build_schedule()
+    
+    def append_step(self, step: PlanStep) -> None:
+        """단계 추가 (인덱스는 다음 조회 시 재구성)"""
+        self.steps.append(step)
+        self.total_steps = len(self.steps)
+        self._dirty = True
+    
+    def remove_step(self, step_id: str) -> bool:
+        """단계 제거"""
+        for i, step in enumerate(self.steps):
+            if step.step_id == step_id:
+                del self.steps[i]
+                self.total_steps = len(self.steps)
+                self._dirty = True
+                return True
+        return False
+    
+    def _push_ready(self, i: int) -> None:
+        """실행 가능 힙에 단계 추가"""
+        heapq.heappush(self._ready, self._ready_key(i))
     
     def get_next_step(self) -> Optional[PlanStep]:
-        """다음 실행 단계 조회"""
-        for step in self.steps:
-            if step.status == TaskStatus.PENDING:
-                # 의존성 확인
-                deps_completed = all(
-                    self.get_step(dep_id).status == TaskStatus.COMPLETED
-                    for dep_id in step.dependencies
-                    if self.get_step(dep_id) is not None
-                )
-                if deps_completed:
-                    return step
+        """다음 실행 단계 조회 (임계 경로 → 우선순위 → 정의 순서)"""
+        self._ensure_schedule()
+        
+        while self._ready:
+            i = self._ready[0][-1]
+            step = self._nodes[i]
+            if step.status == TaskStatus.PENDING and self._indegree[i] == 0:
+                return step
+            # 이미 실행 중이거나 종료된 단계는 힙에서 제거
+            heapq.heappop(self._ready)
         return None
     
+    def get_all_ready_steps(self, limit: Optional[int] = None) -> List[PlanStep]:
+        """
+        실행 가능한 모든 단계 조회
+        
+        의존성이 모두 완료된 대기 단계를 반환하고, 중복 실행을 막기 위해
+        반환된 단계는 IN_PROGRESS로 표시합니다.
+        
+        Args:
+            limit: 최대 반환 개수 (None이면 전체)
+            
+        Returns:
+            동시에 실행 가능한 단계 목록
+        """
+        self._ensure_schedule()
+        
+        ready = []
+        while self._ready and (limit is None or len(ready) < limit):
+            i = heapq.heappop(self._ready)[-1]
+            step = self._nodes[i]
+            if step.status == TaskStatus.PENDING and self._indegree[i] == 0:
+                step.status = TaskStatus.IN_PROGRESS
+                ready.append(step)
+        return ready
+    
+    def get_topological_order(self) -> List[PlanStep]:
+        """위상 정렬된 단계 목록 (순환에 포함된 단계는 제외)"""
+        self._ensure_schedule()
+        return [self._nodes[i] for i in self._topo_order]
+    
+    def get_critical_path_length(self, step_id: str) -> Optional[float]:
+        """해당 단계부터 계획 끝까지의 임계 경로 길이"""
+        self._ensure_schedule()
+        i = self._seq.get(step_id)
+        return None if i is None else self._critical_path[i]
+    
     def get_step(self, step_id: str) -> Optional[PlanStep]:
         """단계 조회"""
-        for step in self.steps:
-            if step.step_id == step_id:
-                return step
-        return None
+        self._ensure_schedule()
+        i = self._seq.get(step_id)
+        return None if i is None else self._nodes[i]
     
     def update_step_status(self, step_id: str, status: TaskStatus) -> bool:
         """단계 상태 업데이트"""
-        step = self.get_step(step_id)
-        if step:
-            step.status = status
-            return True
-        return False
+        self._ensure_schedule()
+        i = self._seq.get(step_id)
+        if i is None:
+            return False
+        
+        step = self._nodes[i]
+        was_done = step.status in _DONE_STATUSES
+        previous = step.status
+        step.status = status
+        
+        if status in _DONE_STATUSES and not was_done:
+            self._completed_count += 1
+            # 후속 단계의 진입 차수 감소
+            indegree = self._indegree
+            for j in self._successors[i]:
+                indegree[j] -= 1
+                if indegree[j] == 0 and self._nodes[j].status == TaskStatus.PENDING:
+                    self._push_ready(j)
+        elif was_done and status not in _DONE_STATUSES:
+            self._completed_count -= 1
+            # 완료 → 미완료 전환은 드물기 때문에 다음 조회 시 재구성
+            self._dirty = True
+        elif status == TaskStatus.PENDING and previous != TaskStatus.PENDING:
+            if self._indegree[i] == 0:
+                self._push_ready(i)
+        return True
     
     def is_completed(self) -> bool:
         """계획 완료 여부"""
-        return all(
-            step.status in [TaskStatus.COMPLETED, TaskStatus.SKIPPED]
-            for step in self.steps
-        )
+        self._ensure_schedule()
+        return self._completed_count == len(self.steps)
     
     def get_progress(self) -> float:
         """진행률 (0.0 ~ 1.0)"""
         if not self.steps:
             return 1.0
-        completed = sum(
-            1 for step in self.steps
-            if step.status in [TaskStatus.COMPLETED, TaskStatus.SKIPPED]
-        )
-        return completed / len(self.steps)
+        self._ensure_schedule()
+        return self._completed_count / len(self.steps)
 
 
 class PlannerConfig(AgentConfig):
@@ -125,6 +450,11 @@ class PlannerConfig(AgentConfig):
     max_steps: int = 20
     include_dependencies: bool = True
     include_time_estimates: bool = False
+    plan_cache_size: int = 128  # 0이면 계획 캐시 비활성화
+    plan_cache_ttl: float = 3600.0
+    template_cache_size: int = 128  # 0이면 작업 분해 템플릿 캐시 비활성화
+    dependency_window_size: int = 12  # 초과 시 의존성 분석을 윈도우별로 병렬 호출
+    strict_plan_validation: bool = False  # True면 LLM 계획도 Pydantic 검증 수행
 
 
 class PlannerAgent(BaseAgent):
@@ -170,6 +500,15 @@ User Request: {request}
 
 Context: {context}"""
 
+    DEFAULT_SYSTEM_PROMPT = """You are an expert planning agent. Your role is to:
+1. Analyze user requests thoroughly
+2. Create detailed, actionable execution plans
+3. Break complex tasks into manageable steps
+4. Identify dependencies and optimal execution order
+5. Select appropriate tools and agents for each step
+
+Always respond with valid JSON when creating plans."""
+
     def __init__(
         self,
         config: Optional[PlannerConfig] = None,
@@ -183,17 +522,27 @@ Context: {context}"""
             **kwargs: 추가 인자
         """
         super().__init__(config=config or PlannerConfig(), **kwargs)
+        
+        # 동일 요청에 대한 계획 캐시 (LLM 호출 생략)
+        cache_size = getattr(self.config, "plan_cache_size", 0)
+        self._plan_cache: Optional[LLMResponseCache] = (
+            LLMResponseCache(
+                max_size=cache_size,
+                default_ttl=getattr(self.config, "plan_cache_ttl", 3600.0),
+            )
+            if cache_size > 0 else None
+        )
+        
+        # 반복되는 작업 유형에 대한 분해 결과 템플릿 캐시
+        template_cache_size = getattr(self.config, "template_cache_size", 0)
+        self._template_cache: Optional[LLMResponseCache] = (
+            LLMResponseCache(max_size=template_cache_size, default_ttl=0)
+            if template_cache_size > 0 else None
+        )
     
     def _default_system_prompt(self) -> str:
         """기본 시스템 프롬프트"""
-        return """You are an expert planning agent. Your role is to:
-1. Analyze user requests thoroughly
-2. Create detailed, actionable execution plans
-3. Break complex tasks into manageable steps
-4. Identify dependencies and optimal execution order
-5. Select appropriate tools and agents for each step
-
-Always respond with valid JSON when creating plans."""
+        return self.DEFAULT_SYSTEM_PROMPT
     
     async def run(
         self,
@@ -208,7 +557,6 @@ Always respond with valid JSON when creating plans."""
         Returns:
             Agent 출력 (ExecutionPlan 포함)
         """
-        import time
         start_time = time.time()
         
         self._set_state(AgentState.RUNNING)
@@ -252,34 +600,81 @@ Always respond with valid JSON when creating plans."""
         Returns:
             실행 계획
         """
-        # 사용 가능한 Tool 목록
-        available_tools = list(self._tools.keys()) if self._tools else ["none"]
+        # 사용 가능한 Tool 목록 (바인딩 변경 시에만 재생성)
+        available_tools = self._get_tools_csv() or "none"
+        
+        # 컨텍스트 직렬화 (프롬프트와 캐시 키에서 공유)
+        context_json = dumps_cached(context or {})
+        
+        # 캐시 확인 (반환된 계획은 호출 측에서 상태가 변경되므로 복사본 사용)
+        cache_key = None
+        if self._plan_cache is not None:
+            cache_key = self._plan_cache_key(request, available_tools, context_json)
+            cached_plan = self._plan_cache.get(cache_key)
+            if cached_plan is not None:
+                return cached_plan.model_copy(deep=True)
         
         # 프롬프트 생성
         prompt = self.PLANNING_PROMPT.format(
             request=request,
-            context=json.dumps(context or {}, ensure_ascii=False),
-            available_tools=", ".join(available_tools),
+            context=context_json,
+            available_tools=available_tools,
         )
         
-        # 메시지 구성
-        messages = [
-            Message.system(self.get_system_prompt()),
-            Message.user(prompt),
-        ]
+        # 메시지 구성 (사용자 메시지는 히스토리와 같은 객체를 공유)
+        sys_msg = Message.system(self.get_system_prompt())
+        user_msg = Message.user(prompt)
         
         # LLM 호출
-        response = await self._call_llm(messages, temperature=0.3)
+        response = await self._call_llm([sys_msg, user_msg], temperature=0.3)
         
         # 응답 저장
-        self._add_message(Message.user(prompt))
+        self._add_message(user_msg)
         self._add_message(Message.assistant(response.content))
         
         # JSON 파싱
         plan_data = self._parse_plan_response(response.content)
         
         # ExecutionPlan 생성
-        return self._create_execution_plan(plan_data)
+        plan = self._create_execution_plan(plan_data)
+        
+        # 파싱 실패로 생성된 폴백 계획은 캐시하지 않음
+        if cache_key is not None and plan.plan_id != "plan_fallback":
+            self._plan_cache.set(cache_key, plan.model_copy(deep=True))
+        
+        return plan
+    
+    def _plan_cache_key(
+        self,
+        request: str,
+        available_tools: str,
+        context_json: str,
+    ) -> str:
+        """
+        계획 캐시 키 생성 (바인딩된 LLM 클라이언트/모델 포함)
+        
+        Args:
+            request: 사용자 요청
+            available_tools: 사용 가능한 Tool 목록 (쉼표 구분)
+            context_json: 직렬화된 추가 컨텍스트
+            
+        Returns:
+            캐시 키
+        """
+        return self._plan_cache.make_key(
+            provider=self.agent_type,
+            model=getattr(getattr(self._llm, "config", None), "model", ""),
+            client=type(self._llm).__name__,
+            prompt=" ".join(request.split()),
+            system=self.get_system_prompt(),
+            tools=available_tools,
+            context=context_json,
+        )
+    
+    def clear_plan_cache(self) -> None:
+        """계획 캐시 초기화"""
+        if self._plan_cache is not None:
+            self._plan_cache.clear()
     
     async def decompose_task(
         self,
@@ -296,6 +691,22 @@ Always respond with valid JSON when creating plans."""
         Returns:
             분해된 단계 목록
         """
+        # 템플릿 캐시 확인
+        template_key = None
+        slots: List[str] = []
+        if self._template_cache is not None:
+            template, slots = _templatize_task(task)
+            template_key = self._template_cache.make_key(
+                provider=self.agent_type,
+                model=getattr(getattr(self._llm, "config", None), "model", ""),
+                client=type(self._llm).__name__,
+                prompt=template,
+                system=self.get_system_prompt(),
+            )
+            cached_steps = self._template_cache.get(template_key)
+            if cached_steps is not None:
+                return self._instantiate_template_steps(cached_steps, slots)
+        
         prompt = f"""Break down the following task into smaller, actionable steps.
 Each step should be specific and executable.
 
@@ -320,8 +731,8 @@ Respond with a JSON array of steps:
         
         # JSON 파싱
         try:
-            steps_data = json.loads(self._extract_json(response.content))
-            return [
+            steps_data = _json_loads(self._extract_json(response.content))
+            steps = [
                 PlanStep(
                     step_id=s.get("step_id", f"step_{i}"),
                     title=s.get("title", ""),
@@ -332,6 +743,69 @@ Respond with a JSON array of steps:
             ]
         except json.JSONDecodeError:
             return []
+        
+        if template_key is not None and steps:
+            self._template_cache.set(template_key, self._to_template_steps(steps, slots))
+        
+        return steps
+    
+    @staticmethod
+    def _to_template_steps(
+        steps: List[PlanStep],
+        slots: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        분해 결과를 슬롯 자리표시자가 포함된 템플릿으로 변환
+        
+        Args:
+            steps: 분해된 단계 목록
+            slots: 원본 작업의 슬롯 값 목록
+            
+        Returns:
+            템플릿 단계 데이터 목록
+        """
+        # 긴 값부터 치환하여 부분 문자열 충돌 방지
+        ordered = sorted(enumerate(slots), key=lambda item: len(item[1]), reverse=True)
+        patterns = [(i, _slot_value_pattern(value)) for i, value in ordered]
+        
+        template_steps = []
+        for step in steps:
+            data = step.model_dump(include={"step_id", "title", "description", "agent_type"})
+            for field in ("title", "description"):
+                for i, pattern in patterns:
+                    data[field] = pattern.sub(f"<SLOT_{i}>", data[field])
+            template_steps.append(data)
+        return template_steps
+    
+    @staticmethod
+    def _instantiate_template_steps(
+        template_steps: List[Dict[str, Any]],
+        slots: List[str],
+    ) -> List[PlanStep]:
+        """
+        템플릿 단계에 현재 작업의 슬롯 값을 채워 PlanStep 생성
+        
+        Args:
+            template_steps: 템플릿 단계 데이터 목록
+            slots: 현재 작업의 슬롯 값 목록
+            
+        Returns:
+            PlanStep 목록
+        """
+        def _fill(text: str) -> str:
+            for i, value in enumerate(slots):
+                text = text.replace(f"<SLOT_{i}>", value)
+            return text
+        
+        return [
+            PlanStep(
+                step_id=data["step_id"],
+                title=_fill(data["title"]),
+                description=_fill(data["description"]),
+                agent_type=data["agent_type"],
+            )
+            for data in template_steps
+        ]
     
     async def analyze_dependencies(
         self,
@@ -349,6 +823,58 @@ Respond with a JSON array of steps:
         if len(steps) <= 1:
             return steps
         
+        window_size = max(2, getattr(self.config, "dependency_window_size", len(steps)))
+        if len(steps) <= window_size:
+            windows = [steps]
+        else:
+            # 윈도우 간 의존성을 잡기 위해 1/4씩 겹치도록 분할
+            stride = window_size - window_size // 4
+            windows = []
+            for start in range(0, len(steps), stride):
+                windows.append(steps[start:start + window_size])
+                if start + window_size >= len(steps):
+                    break
+        
+        # 윈도우별 LLM 호출을 병렬 실행
+        responses = await asyncio.gather(*[
+            self._call_llm(self._dependency_messages(window), temperature=0.2)
+            for window in windows
+        ])
+        
+        # 결과 병합 (윈도우 간 합집합, 존재하지 않는 단계 제거)
+        step_ids = {s.step_id for s in steps}
+        merged: Dict[str, List[str]] = {}
+        for response in responses:
+            try:
+                deps_data = _json_loads(self._extract_json(response.content))
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(deps_data, dict):
+                continue
+            for step_id, dep_ids in deps_data.items():
+                if step_id not in step_ids:
+                    continue
+                deps = merged.setdefault(step_id, [])
+                for dep_id in dep_ids:
+                    if dep_id in step_ids and dep_id != step_id and dep_id not in deps:
+                        deps.append(dep_id)
+        
+        for step in steps:
+            if step.step_id in merged:
+                step.dependencies = merged[step.step_id]
+        
+        return steps
+    
+    def _dependency_messages(self, steps: List[PlanStep]) -> List[Message]:
+        """
+        의존성 분석 메시지 구성
+        
+        Args:
+            steps: 분석할 단계 목록
+            
+        Returns:
+            메시지 목록
+        """
         steps_info = [
             {"step_id": s.step_id, "title": s.title, "description": s.description}
             for s in steps
@@ -367,22 +893,10 @@ Respond with a JSON object mapping step_id to list of dependency step_ids:
     "step_3": ["step_1", "step_2"]
 }}"""
         
-        messages = [
+        return [
             Message.system(self.get_system_prompt()),
             Message.user(prompt),
         ]
-        
-        response = await self._call_llm(messages, temperature=0.2)
-        
-        try:
-            deps_data = json.loads(self._extract_json(response.content))
-            for step in steps:
-                if step.step_id in deps_data:
-                    step.dependencies = deps_data[step.step_id]
-        except json.JSONDecodeError:
-            pass
-        
-        return steps
     
     def _parse_plan_response(self, response: str) -> Dict[str, Any]:
         """
@@ -397,7 +911,7 @@ Respond with a JSON object mapping step_id to list of dependency step_ids:
         json_str = self._extract_json(response)
         
         try:
-            return json.loads(json_str)
+            return _json_loads(json_str)
         except json.JSONDecodeError as e:
             # 기본 계획 반환
             return {
@@ -424,23 +938,15 @@ Respond with a JSON object mapping step_id to list of dependency step_ids:
         Returns:
             JSON 문자열
         """
-        # JSON 블록 추출 시도
-        import re
-        
         # ```json ... ``` 패턴
-        json_match = re.search(r'```(?:json)?\s*([\s\S]*?)```', text)
+        json_match = _JSON_FENCE.search(text)
         if json_match:
             return json_match.group(1).strip()
         
-        # { ... } 패턴
-        brace_match = re.search(r'(\{[\s\S]*\})', text)
-        if brace_match:
-            return brace_match.group(1)
-        
-        # [ ... ] 패턴
-        bracket_match = re.search(r'(\[[\s\S]*\])', text)
-        if bracket_match:
-            return bracket_match.group(1)
+        # { ... } / [ ... ] 패턴
+        scanned = _scan_json(text)
+        if scanned is not None:
+            return scanned
         
         return text
     
@@ -454,25 +960,52 @@ Respond with a JSON object mapping step_id to list of dependency step_ids:
         Returns:
             ExecutionPlan 인스턴스
         """
+        # LLM 응답은 신뢰할 수 있는 형태로 정규화한 뒤 검증 없이 생성
+        strict = getattr(self.config, "strict_plan_validation", False)
+        step_cls = PlanStep if strict else PlanStep.model_construct
+        plan_cls = ExecutionPlan if strict else ExecutionPlan.model_construct
+        
         steps = []
+        step_ids: Set[str] = set()
         for i, step_data in enumerate(data.get("steps", [])):
-            steps.append(PlanStep(
-                step_id=step_data.get("step_id", f"step_{i+1}"),
-                title=step_data.get("title", f"Step {i+1}"),
-                description=step_data.get("description", ""),
-                agent_type=step_data.get("agent_type", "executor"),
-                tools_required=step_data.get("tools_required", []),
-                dependencies=step_data.get("dependencies", []),
-                priority=TaskPriority(step_data.get("priority", "medium")),
-                metadata=step_data.get("metadata", {}),
+            step_id = str(step_data.get("step_id", f"step_{i+1}"))
+            if step_id in step_ids:
+                # 중복 ID는 조회/상태 갱신이 첫 단계로만 향하므로 고유 ID로 변경
+                base_id, n = step_id, 2
+                while f"{base_id}_{n}" in step_ids:
+                    n += 1
+                step_id = f"{base_id}_{n}"
+            step_ids.add(step_id)
+            
+            priority = step_data.get("priority", "medium")
+            if priority not in _PRIORITY_BY_VALUE:
+                raise ValueError(f"'{priority}' is not a valid TaskPriority")
+            
+            agent_type = step_data.get("agent_type", "executor")
+            if agent_type not in _AGENT_TYPES:
+                agent_type = "executor"
+            
+            steps.append(step_cls(
+                step_id=step_id,
+                title=str(step_data.get("title", f"Step {i+1}")),
+                description=str(step_data.get("description", "")),
+                agent_type=agent_type,
+                tools_required=[str(t) for t in step_data.get("tools_required") or []],
+                dependencies=[str(d) for d in step_data.get("dependencies") or []],
+                priority=_PRIORITY_BY_VALUE[priority],
+                status=TaskStatus.PENDING,
+                estimated_time=None,
+                metadata=dict(step_data.get("metadata") or {}),
             ))
         
-        return ExecutionPlan(
-            plan_id=data.get("plan_id", "plan_default"),
-            title=data.get("title", "Execution Plan"),
-            description=data.get("description", ""),
+        return plan_cls(
+            plan_id=str(data.get("plan_id", "plan_default")),
+            title=str(data.get("title", "Execution Plan")),
+            description=str(data.get("description", "")),
             steps=steps,
-            metadata=data.get("metadata", {}),
+            total_steps=len(steps),
+            estimated_total_time=None,
+            metadata=dict(data.get("metadata") or {}),
         )
     
     def validate_plan(self, plan: ExecutionPlan) -> List[str]:
@@ -487,41 +1020,85 @@ Respond with a JSON object mapping step_id to list of dependency step_ids:
         """
         errors = []
         
-        # 단계 ID 중복 검사
-        step_ids = [s.step_id for s in plan.steps]
-        if len(step_ids) != len(set(step_ids)):
-            errors.append("Duplicate step IDs found")
+        # 단계 ID 중복 검사 (단일 순회)
+        seen: Dict[str, int] = {}
+        for i, step in enumerate(plan.steps):
+            if step.step_id in seen:
+                errors.append(f"Duplicate step ID found: {step.step_id}")
+            else:
+                seen[step.step_id] = i
         
         # 순환 의존성 검사
-        for step in plan.steps:
-            visited = set()
-            if self._has_circular_dependency(step.step_id, plan, visited):
-                errors.append(f"Circular dependency detected for step: {step.step_id}")
+        errors.extend(self._detect_cycles(plan))
         
         # 존재하지 않는 의존성 검사
         for step in plan.steps:
             for dep_id in step.dependencies:
-                if dep_id not in step_ids:
+                if dep_id not in seen:
                     errors.append(f"Step {step.step_id} depends on non-existent step: {dep_id}")
         
         return errors
     
-    def _has_circular_dependency(
-        self,
-        step_id: str,
-        plan: ExecutionPlan,
-        visited: set,
-    ) -> bool:
-        """순환 의존성 검사"""
-        if step_id in visited:
-            return True
-        
-        visited.add(step_id)
-        step = plan.get_step(step_id)
-        
-        if step:
-            for dep_id in step.dependencies:
-                if self._has_circular_dependency(dep_id, plan, visited.copy()):
-                    return True
+    def _detect_cycles(self, plan: ExecutionPlan) -> List[str]:
+        """
+        순환 의존성 검사 (3색 DFS)
         
-        return False
+        WHITE(미방문) / GRAY(탐색 중) / BLACK(완료) 마킹으로
+        전체 그래프를 한 번만 순회하며 back-edge를 찾습니다.
+        
+        Args:
+            plan: 검사할 계획
+            
+        Returns:
+            오류 메시지 목록
+        """
+        index: Dict[str, PlanStep] = {}
+        for step in plan.steps:
+            index.setdefault(step.step_id, step)
+        
+        color = dict.fromkeys(index, _WHITE)
+        errors = []
+        for step_id in index:
+            if color[step_id] == _WHITE:
+                errors.extend(self._detect_cycle_iter(step_id, index, color))
+        return errors
+    
+    @staticmethod
+    def _detect_cycle_iter(
+        start: str,
+        index: Dict[str, PlanStep],
+        color: Dict[str, int],
+    ) -> List[str]:
+        """
+        단일 시작점에서의 반복(iterative) DFS
+        
+        재귀 대신 (단계 ID, 의존성 iterator) 스택을 사용하므로
+        의존성 체인 깊이가 재귀 한도를 넘어도 동작합니다.
+        
+        Args:
+            start: 시작 단계 ID
+            index: 단계 ID → 단계
+            color: 방문 상태 (호출 간 공유)
+            
+        Returns:
+            오류 메시지 목록
+        """
+        errors = []
+        color[start] = _GRAY
+        stack = [(start, iter(index[start].dependencies))]
+        while stack:
+            step_id, deps = stack[-1]
+            dep_id = next(deps, None)
+            if dep_id is None:
+                color[step_id] = _BLACK
+                stack.pop()
+                continue
+            
+            dep_color = color.get(dep_id)
+            if dep_color == _GRAY:
+                errors.append(f"Circular dependency detected for step: {step_id}")
+            elif dep_color == _WHITE:
+                color[dep_id] = _GRAY
+                stack.append((dep_id, iter(index[dep_id].dependencies)))
+        
+        return errors
@@ -15,6 +15,7 @@ from prometheus.agents.langchain_base import (
     AgentRole,
     StructuredOutputAgent,
 )
+from prometheus.utils.serialization import dumps_cached
 
 
 # =============================================================================
@@ -135,17 +136,15 @@ class QAAgent(StructuredOutputAgent):
         Returns:
             QAResult
         """
-        import json
-        
         input_text = f"""## 원본 요청
 {request}
 
 ## 검토 대상 보고서
-{json.dumps(report, ensure_ascii=False, indent=2)}
+{dumps_cached(report, indent=True)}
 """
         
         if execution_result:
-            input_text += f"\n## 실행 결과 (참고)\n{json.dumps(execution_result, ensure_ascii=False, indent=2)}"
+            input_text += f"\n## 실행 결과 (참고)\n{dumps_cached(execution_result, indent=True)}"
         
         input_text += "\n\n위 보고서의 품질을 검토하고 평가해주세요."
         
@@ -8,10 +8,15 @@ QAAgent - 품질 검증 Agent
 - 품질 보고서 생성
 """
 
-from typing import Any, Dict, List, Optional
+from bisect import bisect_right
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+import asyncio
 import json
+import math
+import re
 import time
 
 from prometheus.agents.base import (
@@ -23,6 +28,52 @@ from prometheus.agents.base import (
 )
 from prometheus.llm.base import Message, MessageRole
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    _json_loads = json.loads
+
+
+# 보조 작업용 고정 시스템 메시지
+_SUGGEST_SYSTEM_MESSAGE = Message.system("You are an expert at providing constructive improvement suggestions.")
+_COMPARE_SYSTEM_MESSAGE = Message.system("You are an expert at analyzing content changes.")
+
+# 검증/비교 결과 기본값 (응답에 없는 키를 채움)
+_VALIDATION_DEFAULTS: Dict[str, Any] = {
+    "passed": False,
+    "score": 0.0,
+    "matched_requirements": [],
+    "missing_requirements": [],
+    "feedback": "",
+}
+_COMPARISON_DEFAULTS: Dict[str, Any] = {
+    "improved": False,
+    "changes": [],
+    "improvement_score": 0.0,
+    "summary": "",
+}
+
+# LLM 응답 JSON 추출 패턴
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+_JSON_ARRAY = re.compile(r"\[.*\]", re.DOTALL)
+_JSON_OPENERS = {"{": "}", "[": "]"}
+
+
+# 보고서 통과 여부 표시 (passed → 라벨)
+_STATUS_LABELS = {True: "✅ Passed", False: "❌ Failed"}
+
+
+def _clamp_score(value: Any) -> float:
+    """점수를 0.0 ~ 1.0 범위의 float로 변환"""
+    return max(0.0, min(1.0, float(value)))
+
+
+def _mean_score(scores: List["QualityScore"]) -> float:
+    """차원 점수 평균"""
+    return math.fsum(s.score for s in scores) / len(scores)
+
 
 class QualityLevel(str, Enum):
     """품질 수준"""
@@ -45,68 +96,106 @@ class QualityDimension(str, Enum):
     FORMAT = "format"
 
 
+# 품질 수준 경계 점수 (이상이면 다음 수준)와 구간별 품질 수준
+_LEVEL_THRESHOLDS = (0.4, 0.6, 0.75, 0.9)
+_LEVELS_BY_THRESHOLD = (
+    QualityLevel.POOR,
+    QualityLevel.NEEDS_IMPROVEMENT,
+    QualityLevel.ACCEPTABLE,
+    QualityLevel.GOOD,
+    QualityLevel.EXCELLENT,
+)
+
+
 class QualityScore(BaseModel):
     """품질 점수"""
     
-    dimension: QualityDimension
-    score: float = Field(ge=0.0, le=1.0)
-    feedback: str = ""
-    suggestions: List[str] = Field(default_factory=list)
+    model_config = ConfigDict(extra="ignore")
+    
+    dimension: QualityDimension = Field(description="Evaluated quality dimension")
+    score: float = Field(ge=0.0, le=1.0, description="Score for this dimension (0.0 - 1.0)")
+    feedback: str = Field(default="", description="Short assessment for this dimension")
+    suggestions: List[str] = Field(default_factory=list, description="Concrete suggestions for this dimension")
 
 
 class QualityIssue(BaseModel):
     """품질 이슈"""
     
-    severity: str = "medium"  # low, medium, high, critical
-    category: str
-    description: str
-    location: Optional[str] = None
-    suggestion: Optional[str] = None
+    model_config = ConfigDict(extra="ignore")
+    
+    severity: str = Field(default="medium", description="One of: low, medium, high, critical")
+    category: str = Field(description="Quality dimension or area the issue belongs to")
+    description: str = Field(description="What is wrong")
+    location: Optional[str] = Field(default=None, description="Where the issue occurs in the content")
+    suggestion: Optional[str] = Field(default=None, description="How to fix the issue")
+
+
+# LLM 응답 목록 일괄 검증용 (항목별 생성 대신 한 번의 검증기 호출)
+_SCORES_ADAPTER = TypeAdapter(List[QualityScore])
+_ISSUES_ADAPTER = TypeAdapter(List[QualityIssue])
 
 
 class QualityReport(BaseModel):
     """품질 보고서"""
     
+    model_config = ConfigDict(extra="ignore")
+    
     overall_level: QualityLevel = QualityLevel.GOOD
-    overall_score: float = Field(default=0.0, ge=0.0, le=1.0)
-    dimension_scores: List[QualityScore] = Field(default_factory=list)
-    issues: List[QualityIssue] = Field(default_factory=list)
-    strengths: List[str] = Field(default_factory=list)
-    improvements: List[str] = Field(default_factory=list)
+    overall_score: float = Field(default=0.0, ge=0.0, le=1.0, description="Overall quality score (0.0 - 1.0)")
+    dimension_scores: List[QualityScore] = Field(default_factory=list, description="One entry per requested dimension")
+    issues: List[QualityIssue] = Field(default_factory=list, description="Problems found in the content")
+    strengths: List[str] = Field(default_factory=list, description="What the content does well")
+    improvements: List[str] = Field(default_factory=list, description="Most important improvements, in priority order")
     passed: bool = True
-    summary: str = ""
+    summary: str = Field(default="", description="One or two sentence overall assessment")
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
     def model_post_init(self, __context: Any) -> None:
         """초기화 후 처리 - 전체 점수 계산"""
         if self.dimension_scores and self.overall_score == 0.0:
-            self.overall_score = sum(s.score for s in self.dimension_scores) / len(self.dimension_scores)
+            self.overall_score = _mean_score(self.dimension_scores)
             self.overall_level = self._score_to_level(self.overall_score)
     
-    def _score_to_level(self, score: float) -> QualityLevel:
+    @staticmethod
+    def _score_to_level(score: float) -> QualityLevel:
         """점수를 품질 수준으로 변환"""
-        if score >= 0.9:
-            return QualityLevel.EXCELLENT
-        elif score >= 0.75:
-            return QualityLevel.GOOD
-        elif score >= 0.6:
-            return QualityLevel.ACCEPTABLE
-        elif score >= 0.4:
-            return QualityLevel.NEEDS_IMPROVEMENT
-        else:
-            return QualityLevel.POOR
+        return _LEVELS_BY_THRESHOLD[bisect_right(_LEVEL_THRESHOLDS, score)]
     
     def get_critical_issues(self) -> List[QualityIssue]:
         """심각한 이슈 목록"""
         return [i for i in self.issues if i.severity in ["critical", "high"]]
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        """필드 변경 시 캐시된 Markdown 무효화"""
+        super().__setattr__(name, value)
+        self.__dict__.pop("markdown", None)
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "QualityReport":
+        """복사 (update는 __setattr__를 거치지 않으므로 캐시된 Markdown 제거)"""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("markdown", None)
+        return copied
+    
     def to_markdown(self) -> str:
-        """Markdown 형식으로 변환"""
+        """Markdown 형식으로 변환 (캐시된 결과 반환)"""
+        return self.markdown
+    
+    @cached_property
+    def markdown(self) -> str:
+        """
+        Markdown 형식 보고서
+        
+        처음 접근할 때 한 번만 생성합니다. 필드를 다시 할당하면 새로 생성하지만,
+        리스트 필드 내용을 직접 수정한 경우에는 del report.markdown으로 무효화해야 합니다.
+        
+        Returns:
+            Markdown 문자열
+        """
         lines = [
             "# Quality Report\n",
             f"**Overall Level**: {self.overall_level.value}",
             f"**Overall Score**: {self.overall_score:.2f}",
-            f"**Status**: {'✅ Passed' if self.passed else '❌ Failed'}\n",
+            f"**Status**: {_STATUS_LABELS[self.passed]}\n",
             "## Summary",
             self.summary or "No summary provided.",
             "",
@@ -114,31 +203,95 @@ class QualityReport(BaseModel):
         
         if self.dimension_scores:
             lines.append("## Dimension Scores")
-            for score in self.dimension_scores:
-                lines.append(f"- **{score.dimension.value}**: {score.score:.2f} - {score.feedback}")
+            lines.extend(
+                f"- **{score.dimension.value}**: {score.score:.2f} - {score.feedback}"
+                for score in self.dimension_scores
+            )
             lines.append("")
         
         if self.strengths:
             lines.append("## Strengths")
-            for s in self.strengths:
-                lines.append(f"- {s}")
+            lines.extend(f"- {s}" for s in self.strengths)
             lines.append("")
         
         if self.improvements:
             lines.append("## Improvements Needed")
-            for i in self.improvements:
-                lines.append(f"- {i}")
+            lines.extend(f"- {i}" for i in self.improvements)
             lines.append("")
         
         if self.issues:
             lines.append("## Issues")
-            for issue in self.issues:
-                lines.append(f"- [{issue.severity.upper()}] {issue.category}: {issue.description}")
+            lines.extend(
+                f"- [{issue.severity.upper()}] {issue.category}: {issue.description}"
+                for issue in self.issues
+            )
             lines.append("")
         
         return "\n".join(lines)
 
 
+# LLM이 작성하는 보고서 필드 (overall_level, passed, metadata는 Agent가 결정)
+_REVIEW_RESPONSE_FIELDS = (
+    "overall_score",
+    "dimension_scores",
+    "issues",
+    "strengths",
+    "improvements",
+    "summary",
+)
+
+
+def _review_response_schema() -> str:
+    """
+    리뷰 응답 JSON 스키마 (필드 설명 포함)
+    
+    QualityReport 스키마에서 LLM이 작성하는 필드만 남깁니다.
+    
+    Returns:
+        JSON 스키마 문자열
+    """
+    schema = QualityReport.model_json_schema()
+    schema["properties"] = {name: schema["properties"][name] for name in _REVIEW_RESPONSE_FIELDS}
+    schema.get("$defs", {}).pop("QualityLevel", None)
+    schema.pop("required", None)
+    return json.dumps(schema, ensure_ascii=False)
+
+
+def _review_response_example() -> str:
+    """
+    리뷰 응답 예시 JSON
+    
+    QualityReport 모델로 생성하므로 필드가 바뀌면 예시도 함께 바뀝니다.
+    
+    Returns:
+        JSON 문자열
+    """
+    example = QualityReport(
+        overall_score=0.85,
+        dimension_scores=[
+            QualityScore(
+                dimension=QualityDimension.ACCURACY,
+                score=0.9,
+                feedback="Accurate and correct",
+                suggestions=["Consider adding more details"],
+            ),
+        ],
+        issues=[
+            QualityIssue(
+                severity="medium",
+                category="completeness",
+                description="Missing section on X",
+                suggestion="Add a section covering X",
+            ),
+        ],
+        strengths=["Well organized", "Clear language"],
+        improvements=["Add more examples", "Include references"],
+        summary="Overall good quality with minor improvements needed",
+    )
+    data = example.model_dump(mode="json", include=set(_REVIEW_RESPONSE_FIELDS), exclude_none=True)
+    return json.dumps(data, ensure_ascii=False)
+
+
 class QAConfig(AgentConfig):
     """QA 설정"""
     
@@ -151,6 +304,12 @@ class QAConfig(AgentConfig):
         QualityDimension.RELEVANCE,
     ])
     strict_mode: bool = False
+    response_cache_size: int = 256  # 0이면 응답 캐시 비활성화
+    response_cache_ttl: float = 3600.0
+    response_cache_max_temperature: float = 0.3  # 이보다 높은 temperature 호출은 캐시하지 않음
+    parallel_dimensions: bool = False  # True면 run()이 차원별 병렬 리뷰(review_parallel) 사용
+    max_parallel_dimensions: int = 4  # 차원별 리뷰 동시 호출 수
+    min_content_length: int = 10  # 공백 제외 길이가 이보다 짧으면 LLM 호출 없이 불합격 처리
 
 
 class QAAgent(BaseAgent):
@@ -163,7 +322,18 @@ class QAAgent(BaseAgent):
     
     agent_type: str = "qa"
     
-    REVIEW_PROMPT = """You are a quality assurance expert. Review the following content against the original request.
+    # 고정 지시문은 system 메시지에, 요청별 내용은 user 메시지 끝에 배치
+    # (프로바이더 프롬프트 캐싱이 동일한 접두부를 재사용하도록)
+    REVIEW_SYSTEM_PROMPT = """You are a quality assurance expert. Review the content given by the user against the original request, evaluating it on the dimensions the user lists.
+
+Provide your review as a single JSON object that follows this JSON schema (field descriptions explain what each field must contain):
+""" + _review_response_schema() + """
+
+Example:
+""" + _review_response_example()
+
+    REVIEW_USER_PROMPT = """Evaluate the content on these dimensions:
+{dimensions}
 
 Original Request:
 {original_request}
@@ -171,36 +341,28 @@ Original Request:
 Content to Review:
 {content}
 
-Evaluate the content on these dimensions:
-{dimensions}
+Provide your quality review:"""
 
-Provide your review as a JSON object with this structure:
-{{
-    "overall_score": 0.85,
-    "dimension_scores": [
-        {{
-            "dimension": "accuracy",
-            "score": 0.9,
-            "feedback": "Accurate and correct",
-            "suggestions": ["Consider adding more details"]
-        }}
-    ],
-    "issues": [
-        {{
-            "severity": "medium",
-            "category": "completeness",
-            "description": "Missing section on X",
-            "suggestion": "Add a section covering X"
-        }}
-    ],
-    "strengths": ["Well organized", "Clear language"],
-    "improvements": ["Add more examples", "Include references"],
-    "summary": "Overall good quality with minor improvements needed"
-}}
+    VALIDATION_SYSTEM_PROMPT = """You are a validation expert. Check if the content given by the user meets the requirements specified in the original request, using the listed validation criteria.
 
-Provide your quality review:"""
+Respond with a single JSON object with these fields:
+- "passed" (boolean): true if the content satisfies the request
+- "score" (number, 0.0 - 1.0): degree to which the requirements are met
+- "matched_requirements" (array of strings): requirements the content satisfies
+- "missing_requirements" (array of strings): requirements the content does not satisfy
+- "feedback" (string): short explanation of the result
 
-    VALIDATION_PROMPT = """You are a validation expert. Check if the content meets the requirements specified in the original request.
+Example:
+{
+    "passed": true,
+    "score": 0.85,
+    "matched_requirements": ["req1", "req2"],
+    "missing_requirements": ["req3"],
+    "feedback": "Content meets most requirements"
+}"""
+
+    VALIDATION_USER_PROMPT = """Validation Criteria:
+{criteria}
 
 Original Request:
 {original_request}
@@ -208,19 +370,36 @@ Original Request:
 Content to Validate:
 {content}
 
-Validation Criteria:
-{criteria}
+Validate now:"""
 
-Respond with a JSON object:
-{{
-    "passed": true,
-    "score": 0.85,
-    "matched_requirements": ["req1", "req2"],
-    "missing_requirements": ["req3"],
-    "feedback": "Content meets most requirements"
-}}
+    DIMENSION_SYSTEM_PROMPT = """You are a quality assurance expert. Evaluate the content given by the user against the original request on the single quality dimension the user names.
 
-Validate now:"""
+Respond with a single JSON object:
+{
+    "score": 0.9,
+    "feedback": "Short assessment for this dimension",
+    "suggestions": ["Concrete suggestion for this dimension"],
+    "issues": [
+        {
+            "severity": "medium",
+            "description": "What is wrong",
+            "suggestion": "How to fix the issue"
+        }
+    ]
+}
+
+"score" is a number between 0.0 and 1.0. "severity" is one of: low, medium, high, critical."""
+
+    DIMENSION_USER_PROMPT = """Dimension:
+{dimension}
+
+Original Request:
+{original_request}
+
+Content to Review:
+{content}
+
+Provide your evaluation:"""
 
     def __init__(
         self,
@@ -235,6 +414,30 @@ Validate now:"""
             **kwargs: 추가 인자
         """
         super().__init__(config=config or QAConfig(), **kwargs)
+        
+        # 작업별 시스템 메시지 캐시: 지시문 → (기반 시스템 프롬프트, 메시지)
+        self._system_messages: Dict[str, Tuple[str, Message]] = {}
+        
+        # 구조화 출력 LLM 캐시: (원본 LLM, 스키마 바인딩된 LLM)
+        self._structured_llm: Optional[Tuple[Any, Any]] = None
+    
+    def _get_structured_llm(self) -> Optional[Any]:
+        """
+        구조화 출력 LLM 조회
+        
+        현재 LLM이 구조화 출력을 지원하면(LangChain 채팅 모델) QualityReport
+        스키마를 바인딩한 LLM을 반환합니다. bind_llm으로 LLM이 바뀌면 다시 만듭니다.
+        
+        Returns:
+            스키마 바인딩된 LLM 또는 None
+        """
+        llm = self._llm
+        cached = self._structured_llm
+        if cached is None or cached[0] is not llm:
+            with_structured_output = getattr(llm, "with_structured_output", None)
+            cached = (llm, with_structured_output(QualityReport) if with_structured_output else None)
+            self._structured_llm = cached
+        return cached[1]
     
     def _default_system_prompt(self) -> str:
         """기본 시스템 프롬프트"""
@@ -268,8 +471,32 @@ Always provide your reviews in the requested JSON format."""
             original_request = input.context.get("original_request", "")
             content = input.task
             
+            # 검토할 내용이 없으면 LLM 호출 없이 불합격
+            if self._is_too_short(content):
+                self._set_state(AgentState.COMPLETED)
+                report = QualityReport.model_construct(
+                    overall_level=QualityLevel.POOR,
+                    overall_score=0.0,
+                    passed=False,
+                    summary="Content too short for review",
+                    dimension_scores=[],
+                )
+                return AgentOutput(
+                    result=report,
+                    success=False,
+                    messages=self._messages,
+                    execution_time=time.time() - start_time,
+                    metadata={
+                        "overall_score": 0.0,
+                        "passed": False,
+                        "issues_count": 0,
+                        "skipped": "content_too_short",
+                    },
+                )
+            
             # 리뷰 수행
-            report = await self.review(
+            review = self.review_parallel if self.config.parallel_dimensions else self.review
+            report = await review(
                 content=content,
                 original_request=original_request,
             )
@@ -280,7 +507,7 @@ Always provide your reviews in the requested JSON format."""
             return AgentOutput(
                 result=report,
                 success=report.passed,
-                messages=self._messages.copy(),
+                messages=self._messages,  # AgentOutput 검증 시 새 리스트로 복사됨
                 execution_time=execution_time,
                 metadata={
                     "overall_score": report.overall_score,
@@ -293,7 +520,7 @@ Always provide your reviews in the requested JSON format."""
             self._set_state(AgentState.FAILED)
             return AgentOutput.error_output(
                 error=str(e),
-                messages=self._messages.copy(),
+                messages=self._messages,  # AgentOutput 검증 시 새 리스트로 복사됨
             )
     
     async def review(
@@ -314,33 +541,155 @@ Always provide your reviews in the requested JSON format."""
             품질 보고서
         """
         dims = dimensions or self.config.dimensions
-        dims_str = ", ".join(d.value for d in dims)
+        # 동일한 차원 조합이면 항상 같은 프롬프트가 되도록 정렬
+        dims_str = ", ".join(sorted({d.value for d in dims}))
         
-        prompt = self.REVIEW_PROMPT.format(
+        prompt = self.REVIEW_USER_PROMPT.format(
             original_request=original_request or "Not provided",
             content=content,
             dimensions=dims_str,
         )
         
         messages = [
-            Message.system(self.get_system_prompt()),
-            Message.user(prompt),
+            self._system_message(self.REVIEW_SYSTEM_PROMPT),
+            Message.model_construct(role=MessageRole.USER, content=prompt),
         ]
         
-        response = await self._call_llm(messages, temperature=0.3)
+        report = None
+        structured_llm = self._get_structured_llm()
+        if structured_llm is not None:
+            # 스키마로 검증된 응답은 JSON 추출/파싱 없이 바로 보고서로 변환
+            try:
+                result = await structured_llm.ainvoke(
+                    [(m.role.value, m.content) for m in messages]
+                )
+                data = result.model_dump(include=set(_REVIEW_RESPONSE_FIELDS))
+                content_text = json.dumps(data, ensure_ascii=False, default=str)
+                report = self._report_from_data(data)
+            except Exception:
+                # 스키마 검증/파싱 실패 시 텍스트 응답 경로로 대체
+                report = None
+        
+        if report is None:
+            content_text = await self._call_llm_cached("review", messages, temperature=0.3)
+            report = self._parse_review_response(content_text)
+        
+        self._add_message(messages[1])
+        self._add_message(Message.model_construct(role=MessageRole.ASSISTANT, content=content_text))
+        
+        self._apply_pass_criteria(report)
+        return report
+    
+    async def review_parallel(
+        self,
+        content: str,
+        original_request: str = "",
+        dimensions: Optional[List[QualityDimension]] = None,
+    ) -> QualityReport:
+        """
+        차원별 병렬 품질 리뷰
         
-        self._add_message(Message.user(prompt))
-        self._add_message(Message.assistant(response.content))
+        평가 차원마다 작은 프롬프트로 동시에 LLM을 호출하고 결과를
+        하나의 보고서로 합칩니다. 전체 응답 시간이 가장 느린 차원의
+        호출 시간 수준으로 줄어드는 대신, 보고서에 강점/요약은 포함되지
+        않습니다.
         
-        # 응답 파싱
-        report = self._parse_review_response(response.content)
+        Args:
+            content: 검토할 내용
+            original_request: 원래 요청
+            dimensions: 평가 차원
+            
+        Returns:
+            품질 보고서
+        """
+        dims = sorted(set(dimensions or self.config.dimensions), key=lambda d: d.value)
+        semaphore = asyncio.Semaphore(max(1, self.config.max_parallel_dimensions))
+        
+        async def score_dimension(dimension: QualityDimension) -> Tuple[QualityScore, List[QualityIssue]]:
+            async with semaphore:
+                return await self._review_dimension(content, original_request, dimension)
+        
+        results = await asyncio.gather(*(score_dimension(d) for d in dims))
+        
+        dimension_scores = [score for score, _ in results]
+        issues = [issue for _, dim_issues in results for issue in dim_issues]
+        improvements = list(dict.fromkeys(s for score in dimension_scores for s in score.suggestions))
+        overall_score = _mean_score(dimension_scores) if dimension_scores else 0.5
+        
+        report = QualityReport.model_construct(
+            overall_level=QualityReport._score_to_level(overall_score),
+            overall_score=overall_score,
+            dimension_scores=dimension_scores,
+            issues=issues,
+            improvements=improvements,
+        )
+        self._apply_pass_criteria(report)
+        return report
+    
+    async def _review_dimension(
+        self,
+        content: str,
+        original_request: str,
+        dimension: QualityDimension,
+    ) -> Tuple[QualityScore, List[QualityIssue]]:
+        """
+        단일 차원 리뷰
+        
+        Args:
+            content: 검토할 내용
+            original_request: 원래 요청
+            dimension: 평가 차원
+            
+        Returns:
+            (차원 점수, 해당 차원의 이슈 목록)
+        """
+        prompt = self.DIMENSION_USER_PROMPT.format(
+            dimension=dimension.value,
+            original_request=original_request or "Not provided",
+            content=content,
+        )
+        messages = [
+            self._system_message(self.DIMENSION_SYSTEM_PROMPT),
+            Message.model_construct(role=MessageRole.USER, content=prompt),
+        ]
+        
+        content_text = await self._call_llm_cached(
+            f"review:{dimension.value}", messages, temperature=0.3
+        )
+        
+        try:
+            data = _json_loads(self._extract_json(content_text))
+            score = QualityScore.model_construct(
+                dimension=dimension,
+                score=_clamp_score(data.get("score", 0.5)),
+                feedback=str(data.get("feedback") or ""),
+                suggestions=list(data.get("suggestions") or []),
+            )
+            issues = [
+                QualityIssue.model_construct(
+                    severity=str(issue.get("severity") or "medium"),
+                    category=dimension.value,
+                    description=str(issue.get("description") or ""),
+                    location=issue.get("location"),
+                    suggestion=issue.get("suggestion"),
+                )
+                for issue in data.get("issues") or []
+            ]
+            return score, issues
+        except (ValueError, AttributeError, TypeError):
+            # 파싱 실패 시 중간 점수와 원문 피드백
+            return QualityScore(dimension=dimension, score=0.5, feedback=content_text[:500]), []
+    
+    def _apply_pass_criteria(self, report: QualityReport) -> None:
+        """
+        통과 여부 결정
         
-        # 통과 여부 결정
+        Args:
+            report: 품질 보고서 (passed가 갱신됨)
+        """
         report.passed = report.overall_score >= self.config.pass_threshold
         if self.config.strict_mode and report.get_critical_issues():
             report.passed = False
-        
-        return report
     
     async def validate_against_request(
         self,
@@ -359,30 +708,31 @@ Always provide your reviews in the requested JSON format."""
         Returns:
             검증 결과
         """
+        if not original_request or not original_request.strip():
+            return self._with_defaults(_VALIDATION_DEFAULTS, {"feedback": "Original request is empty"})
+        if self._is_too_short(content):
+            return self._with_defaults(_VALIDATION_DEFAULTS, {"feedback": "Content too short for validation"})
+        
         criteria_str = "\n".join(f"- {c}" for c in (criteria or [])) or "Match the original request"
         
-        prompt = self.VALIDATION_PROMPT.format(
+        prompt = self.VALIDATION_USER_PROMPT.format(
             original_request=original_request,
             content=content,
             criteria=criteria_str,
         )
         
         messages = [
-            Message.system(self.get_system_prompt()),
-            Message.user(prompt),
+            self._system_message(self.VALIDATION_SYSTEM_PROMPT),
+            Message.model_construct(role=MessageRole.USER, content=prompt),
         ]
         
-        response = await self._call_llm(messages, temperature=0.2)
+        content_text = await self._call_llm_cached("validate", messages, temperature=0.2)
         
-        try:
-            json_str = self._extract_json(response.content)
-            return json.loads(json_str)
-        except json.JSONDecodeError:
-            return {
-                "passed": False,
-                "score": 0.0,
-                "feedback": "Failed to parse validation response",
-            }
+        return self._parse_result(
+            content_text,
+            _VALIDATION_DEFAULTS,
+            {"feedback": "Failed to parse validation response"},
+        )
     
     async def suggest_improvements(
         self,
@@ -397,8 +747,11 @@ Always provide your reviews in the requested JSON format."""
             focus_areas: 집중 영역
             
         Returns:
-            개선점 목록
+            개선점 목록 (내용이 너무 짧으면 빈 리스트)
         """
+        if self._is_too_short(content):
+            return []
+        
         focus_str = ", ".join(focus_areas) if focus_areas else "general quality"
         
         prompt = f"""Review the following content and suggest specific improvements.
@@ -411,17 +764,17 @@ Provide 3-5 specific, actionable improvements as a JSON array:
 ["improvement 1", "improvement 2", ...]"""
         
         messages = [
-            Message.system("You are an expert at providing constructive improvement suggestions."),
-            Message.user(prompt),
+            _SUGGEST_SYSTEM_MESSAGE,
+            Message.model_construct(role=MessageRole.USER, content=prompt),
         ]
         
-        response = await self._call_llm(messages, temperature=0.4)
+        content_text = await self._call_llm_cached("suggest", messages, temperature=0.4)
         
         try:
-            json_str = self._extract_json(response.content)
-            return json.loads(json_str)
+            json_str = self._extract_json(content_text)
+            return _json_loads(json_str)
         except json.JSONDecodeError:
-            return [response.content]
+            return [content_text]
     
     async def compare_versions(
         self,
@@ -456,21 +809,88 @@ Respond with a JSON object:
 }}"""
         
         messages = [
-            Message.system("You are an expert at analyzing content changes."),
-            Message.user(prompt),
+            _COMPARE_SYSTEM_MESSAGE,
+            Message.model_construct(role=MessageRole.USER, content=prompt),
         ]
         
-        response = await self._call_llm(messages, temperature=0.3)
+        content_text = await self._call_llm_cached("compare", messages, temperature=0.3)
+        
+        return self._parse_result(content_text, _COMPARISON_DEFAULTS, {"summary": content_text})
+    
+    @staticmethod
+    def classify_batch(scores: List[float]) -> List[QualityLevel]:
+        """
+        점수 목록을 품질 수준으로 일괄 변환
         
+        여러 결과물을 채점한 뒤 수준별로 분류할 때 사용합니다.
+        QualityReport._score_to_level과 같은 경계 규칙을 따릅니다.
+        
+        Args:
+            scores: 전체 점수 목록 (0.0 - 1.0)
+            
+        Returns:
+            점수 순서와 같은 품질 수준 목록
+        """
+        levels = _LEVELS_BY_THRESHOLD
+        thresholds = _LEVEL_THRESHOLDS
+        return [levels[bisect_right(thresholds, score)] for score in scores]
+    
+    def _is_too_short(self, content: Optional[str]) -> bool:
+        """LLM 검토가 의미 없을 만큼 내용이 짧은지 여부"""
+        return not content or len(content.strip()) < self.config.min_content_length
+    
+    def _parse_result(
+        self,
+        response: str,
+        defaults: Dict[str, Any],
+        on_error: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        JSON 객체 응답을 기본값이 채워진 dict로 변환
+        
+        Args:
+            response: LLM 응답
+            defaults: 누락된 키의 기본값
+            on_error: 파싱 실패 시 기본값에 덮어쓸 값
+            
+        Returns:
+            항상 defaults의 모든 키를 포함하는 dict
+        """
         try:
-            json_str = self._extract_json(response.content)
-            return json.loads(json_str)
+            data = _json_loads(self._extract_json(response))
         except json.JSONDecodeError:
-            return {
-                "improved": False,
-                "changes": [],
-                "summary": response.content,
-            }
+            data = None
+        
+        return self._with_defaults(defaults, data if isinstance(data, dict) else on_error)
+    
+    @staticmethod
+    def _with_defaults(defaults: Dict[str, Any], values: Dict[str, Any]) -> Dict[str, Any]:
+        """기본값 dict에 값을 덮어쓴 새 dict"""
+        # 기본값의 리스트는 호출마다 새로 생성 (반환값 수정이 기본값에 영향 없도록)
+        result = {k: v.copy() if isinstance(v, list) else v for k, v in defaults.items()}
+        result.update(values)
+        return result
+    
+    def _system_message(self, instructions: str) -> Message:
+        """
+        작업별 고정 지시문을 붙인 시스템 메시지 (재사용)
+        
+        Args:
+            instructions: 작업별 고정 지시문
+            
+        Returns:
+            시스템 메시지 (시스템 프롬프트가 바뀌면 다시 생성)
+        """
+        base_prompt = self.get_system_prompt()
+        cached = self._system_messages.get(instructions)
+        if cached is None or cached[0] != base_prompt:
+            message = Message.model_construct(
+                role=MessageRole.SYSTEM,
+                content=f"{base_prompt}\n\n{instructions}",
+            )
+            cached = (base_prompt, message)
+            self._system_messages[instructions] = cached
+        return cached[1]
     
     def _parse_review_response(self, response: str) -> QualityReport:
         """
@@ -484,62 +904,118 @@ Respond with a JSON object:
         """
         try:
             json_str = self._extract_json(response)
-            data = json.loads(json_str)
-            
-            # dimension_scores 파싱
-            dimension_scores = []
-            for ds in data.get("dimension_scores", []):
-                dimension_scores.append(QualityScore(
-                    dimension=QualityDimension(ds.get("dimension", "accuracy")),
-                    score=ds.get("score", 0.5),
-                    feedback=ds.get("feedback", ""),
-                    suggestions=ds.get("suggestions", []),
-                ))
-            
-            # issues 파싱
-            issues = []
-            for issue in data.get("issues", []):
-                issues.append(QualityIssue(
-                    severity=issue.get("severity", "medium"),
-                    category=issue.get("category", "general"),
-                    description=issue.get("description", ""),
-                    location=issue.get("location"),
-                    suggestion=issue.get("suggestion"),
-                ))
-            
-            return QualityReport(
-                overall_score=data.get("overall_score", 0.5),
-                dimension_scores=dimension_scores,
-                issues=issues,
-                strengths=data.get("strengths", []),
-                improvements=data.get("improvements", []),
-                summary=data.get("summary", ""),
-            )
-            
-        except (json.JSONDecodeError, KeyError):
-            # 파싱 실패 시 기본 보고서
+            return self._report_from_data(_json_loads(json_str))
+        except (ValueError, KeyError, AttributeError, TypeError):
+            # 파싱 실패(JSONDecodeError 포함) 또는 잘못된 값이면 기본 보고서
             return QualityReport(
                 overall_score=0.5,
                 summary=response[:500] if response else "Review parsing failed",
             )
     
+    def _report_from_data(self, data: Dict[str, Any]) -> QualityReport:
+        """
+        리뷰 응답 dict를 품질 보고서로 변환
+        
+        Args:
+            data: 리뷰 응답 dict
+            
+        Returns:
+            품질 보고서
+            
+        Raises:
+            ValueError: 알 수 없는 차원 등 잘못된 값
+            TypeError, AttributeError: 예상과 다른 구조
+        """
+        dimension_scores = self._parse_items(
+            data.get("dimension_scores", []), _SCORES_ADAPTER, self._normalize_score,
+        )
+        issues = self._parse_items(
+            data.get("issues", []), _ISSUES_ADAPTER, self._normalize_issue,
+        )
+        
+        # 전체 점수가 없으면 차원 점수 평균 사용 (model_post_init과 같은 규칙)
+        overall_score = _clamp_score(data.get("overall_score", 0.5))
+        overall_level = QualityLevel.GOOD
+        if dimension_scores and overall_score == 0.0:
+            overall_score = _mean_score(dimension_scores)
+            overall_level = QualityReport._score_to_level(overall_score)
+        
+        return QualityReport.model_construct(
+            overall_level=overall_level,
+            overall_score=overall_score,
+            dimension_scores=dimension_scores,
+            issues=issues,
+            strengths=list(data.get("strengths") or []),
+            improvements=list(data.get("improvements") or []),
+            summary=str(data.get("summary") or ""),
+        )
+    
+    @staticmethod
+    def _parse_items(
+        items: Any,
+        adapter: TypeAdapter,
+        normalize: Callable[[Dict[str, Any]], Any],
+    ) -> List[Any]:
+        """
+        응답 목록을 모델 리스트로 변환
+        
+        형식이 맞는 목록은 한 번에 검증하고, 범위를 벗어난 점수나 빈 값이 있으면
+        항목별로 정규화합니다.
+        
+        Args:
+            items: 응답의 dict 목록
+            adapter: 목록 검증용 TypeAdapter
+            normalize: 항목 하나를 정규화해 모델로 만드는 함수
+            
+        Returns:
+            모델 리스트
+        """
+        try:
+            return adapter.validate_python(items)
+        except ValidationError:
+            return [normalize(item) for item in items]
+    
+    @staticmethod
+    def _normalize_score(ds: Dict[str, Any]) -> QualityScore:
+        """차원 점수 항목 정규화 (검증 없이 모델 생성)"""
+        return QualityScore.model_construct(
+            dimension=QualityDimension(ds.get("dimension", "accuracy")),
+            score=_clamp_score(ds.get("score", 0.5)),
+            feedback=str(ds.get("feedback") or ""),
+            suggestions=list(ds.get("suggestions") or []),
+        )
+    
+    @staticmethod
+    def _normalize_issue(issue: Dict[str, Any]) -> QualityIssue:
+        """이슈 항목 정규화 (검증 없이 모델 생성)"""
+        return QualityIssue.model_construct(
+            severity=str(issue.get("severity") or "medium"),
+            category=str(issue.get("category") or "general"),
+            description=str(issue.get("description") or ""),
+            location=issue.get("location"),
+            suggestion=issue.get("suggestion"),
+        )
+    
     def _extract_json(self, text: str) -> str:
         """텍스트에서 JSON 추출"""
-        import re
+        # 응답 전체가 JSON이면 정규식 없이 그대로 사용
+        stripped = text.strip()
+        if stripped[:1] in _JSON_OPENERS and stripped[-1:] == _JSON_OPENERS[stripped[:1]]:
+            return stripped
         
         # ```json ... ``` 패턴
-        json_match = re.search(r'```(?:json)?\s*([\s\S]*?)```', text)
+        json_match = _JSON_FENCE.search(text)
         if json_match:
             return json_match.group(1).strip()
         
         # { ... } 패턴
-        brace_match = re.search(r'(\{[\s\S]*\})', text)
+        brace_match = _JSON_OBJECT.search(text)
         if brace_match:
-            return brace_match.group(1)
+            return brace_match.group(0)
         
         # [ ... ] 패턴
-        bracket_match = re.search(r'(\[[\s\S]*\])', text)
+        bracket_match = _JSON_ARRAY.search(text)
         if bracket_match:
-            return bracket_match.group(1)
+            return bracket_match.group(0)
         
         return text
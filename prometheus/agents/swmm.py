@@ -131,6 +131,13 @@ SWMM_SYSTEM_PROMPT = """당신은 EPA-SWMM 우수관리 시뮬레이션 전문
 SWMM INP 파일 형식과 분석 코드를 포함하세요.
 """
 
+# 입력 컨텍스트 키별 섹션 제목 (출력 순서대로)
+_CONTEXT_SECTIONS = (
+    ("typhoon", "태풍 정보"),
+    ("existing_inp", "기존 INP 파일"),
+)
+_SIMULATE_REQUEST = "\n\nSWMM 시뮬레이션을 수행하고 결과를 분석해주세요."
+
 
 # =============================================================================
 # SWMMAgent 클래스
@@ -191,7 +198,7 @@ class SWMMAgent(StructuredOutputAgent):
         Returns:
             SWMMOutput
         """
-        input_text = f"""## 프로젝트
+        parts = [f"""## 프로젝트
 {project_name}
 
 ## 연구 지역
@@ -201,21 +208,23 @@ class SWMMAgent(StructuredOutputAgent):
 - 지속시간: {rainfall.get('duration', 60)}분
 - 강우량: {rainfall.get('depth', 100)}mm
 - 재현기간: {rainfall.get('return_period', 30)}년
-"""
+"""]
         
         if network_data:
-            input_text += f"\n## 배수관망 데이터\n{network_data}"
+            parts.append(f"\n## 배수관망 데이터\n{network_data}")
         
         if lid_scenarios:
-            input_text += f"\n## LID 시나리오\n{lid_scenarios}"
+            parts.append(f"\n## LID 시나리오\n{lid_scenarios}")
         
         if context:
-            if context.get("typhoon"):
-                input_text += f"\n## 태풍 정보\n{context['typhoon']}"
-            if context.get("existing_inp"):
-                input_text += f"\n## 기존 INP 파일\n{context['existing_inp']}"
+            parts.extend(
+                f"\n## {title}\n{context[key]}"
+                for key, title in _CONTEXT_SECTIONS
+                if context.get(key)
+            )
         
-        input_text += "\n\nSWMM 시뮬레이션을 수행하고 결과를 분석해주세요."
+        parts.append(_SIMULATE_REQUEST)
+        input_text = "".join(parts)
         
         try:
             result = self.invoke(input_text)
@@ -223,7 +232,7 @@ class SWMMAgent(StructuredOutputAgent):
             if isinstance(result, SWMMOutput):
                 return result
             elif isinstance(result, dict):
-                return SWMMOutput(**result)
+                return SWMMOutput.model_validate(result)
             else:
                 raise ValueError(f"Unexpected result type: {type(result)}")
                 
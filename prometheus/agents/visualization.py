@@ -14,6 +14,7 @@ from prometheus.agents.langchain_base import (
     AgentConfig,
     AgentRole,
 )
+from prometheus.llm.factory import create_llm
 
 
 # =============================================================================
@@ -88,6 +89,14 @@ VISUALIZATION_SYSTEM_PROMPT = """당신은 데이터 시각화 전문가입니
 실행 가능한 Python 코드를 포함하세요.
 """
 
+# 입력 컨텍스트 키별 섹션 제목 (출력 순서대로)
+_CONTEXT_SECTIONS = (
+    ("data_file", "데이터 파일"),
+    ("output_dir", "출력 디렉토리"),
+    ("language", "언어"),
+)
+_VISUALIZE_REQUEST = "\n\n시각화 코드를 생성해주세요."
+
 
 # =============================================================================
 # VisualizationAgent 클래스
@@ -144,27 +153,26 @@ class VisualizationAgent(StructuredOutputAgent):
         Returns:
             VisualizationOutput
         """
-        input_text = f"""## 데이터 설명
+        parts = [f"""## 데이터 설명
 {data_description}
 
 ## 스타일
 - 학술 스타일: {'예' if academic_style else '아니오'}
-"""
+"""]
         
         if chart_types:
-            input_text += f"\n## 원하는 차트 유형\n"
-            for ct in chart_types:
-                input_text += f"- {ct}\n"
+            parts.append("\n## 원하는 차트 유형\n")
+            parts.extend(f"- {ct}\n" for ct in chart_types)
         
         if context:
-            if context.get("data_file"):
-                input_text += f"\n## 데이터 파일\n{context['data_file']}"
-            if context.get("output_dir"):
-                input_text += f"\n## 출력 디렉토리\n{context['output_dir']}"
-            if context.get("language"):
-                input_text += f"\n## 언어\n{context['language']}"
+            parts.extend(
+                f"\n## {title}\n{context[key]}"
+                for key, title in _CONTEXT_SECTIONS
+                if context.get(key)
+            )
         
-        input_text += "\n\n시각화 코드를 생성해주세요."
+        parts.append(_VISUALIZE_REQUEST)
+        input_text = "".join(parts)
         
         try:
             result = self.invoke(input_text)
@@ -172,7 +180,7 @@ class VisualizationAgent(StructuredOutputAgent):
             if isinstance(result, VisualizationOutput):
                 return result
             elif isinstance(result, dict):
-                return VisualizationOutput(**result)
+                return VisualizationOutput.model_validate(result)
             else:
                 raise ValueError(f"Unexpected result type: {type(result)}")
                 
@@ -189,6 +197,14 @@ class VisualizationAgent(StructuredOutputAgent):
 # Agent 생성 함수
 # =============================================================================
 
+# 프로바이더별 기본 모델
+_DEFAULT_MODELS = {
+    "anthropic": "claude-sonnet-4-20250514",
+    "openai": "gpt-4o",
+    "google": "gemini-2.0-flash",
+}
+
+
 def create_visualization_agent(
     llm: BaseChatModel = None,
     provider: str = "google",
@@ -198,25 +214,9 @@ def create_visualization_agent(
     VisualizationAgent 생성
     """
     if llm is None:
-        if provider == "anthropic":
-            from langchain_anthropic import ChatAnthropic
-            llm = ChatAnthropic(
-                model=model or "claude-sonnet-4-20250514",
-                temperature=0.5,
-            )
-        elif provider == "openai":
-            from langchain_openai import ChatOpenAI
-            llm = ChatOpenAI(
-                model=model or "gpt-4o",
-                temperature=0.5,
-            )
-        elif provider == "google":
-            from langchain_google_genai import ChatGoogleGenerativeAI
-            llm = ChatGoogleGenerativeAI(
-                model=model or "gemini-2.0-flash",
-                temperature=0.5,
-            )
-        else:
+        if provider not in _DEFAULT_MODELS:
             raise ValueError(f"Unknown provider: {provider}")
+        # 프로바이더 SDK import와 LLM 인스턴스는 팩토리 캐시에서 재사용
+        llm = create_llm(provider, model=model or _DEFAULT_MODELS[provider], temperature=0.5)
     
     return VisualizationAgent(llm=llm)
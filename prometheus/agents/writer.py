@@ -5,8 +5,13 @@ PROMETHEUS WriterAgent (LangChain)
 실행 결과를 바탕으로 Markdown 형식의 보고서를 생성합니다.
 """
 
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from collections import deque
+from functools import cached_property
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+import asyncio
+import re
+import time
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate
@@ -18,6 +23,12 @@ from prometheus.agents.langchain_base import (
     AgentRole,
     StructuredOutputAgent,
 )
+from prometheus.llm.factory import create_llm
+from prometheus.utils.serialization import dumps_cached
+
+
+# 단어 (공백으로 구분된 토큰)
+_WORD = re.compile(r"\S+")
 
 
 # =============================================================================
@@ -26,6 +37,8 @@ from prometheus.agents.langchain_base import (
 
 class Citation(BaseModel):
     """인용/근거"""
+    model_config = ConfigDict(frozen=True)
+    
     source: str = Field(description="출처 (URL, 문서명 등)")
     content: str = Field(description="인용 내용")
     relevance: str = Field(default="", description="관련성 설명")
@@ -39,8 +52,102 @@ class ReportOutput(BaseModel):
     conclusions: List[str] = Field(default_factory=list, description="주요 결론들")
     recommendations: List[str] = Field(default_factory=list, description="권장 사항")
     citations: List[Citation] = Field(default_factory=list, description="인용/참고 자료")
-    word_count: int = Field(default=0, description="단어 수")
     language: str = Field(default="ko", description="언어 코드")
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """본문 변경 시 캐시된 단어 수 무효화"""
+        super().__setattr__(name, value)
+        if name == "content":
+            self.__dict__.pop("word_count", None)
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "ReportOutput":
+        """복사 (update는 __setattr__를 거치지 않으므로 캐시된 단어 수 제거)"""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("word_count", None)
+        return copied
+    
+    @computed_field
+    @cached_property
+    def word_count(self) -> int:
+        """본문 단어 수 (처음 접근할 때 한 번만 계산)"""
+        return sum(1 for _ in _WORD.finditer(self.content))
+
+
+# =============================================================================
+# 요청 속도 제한
+# =============================================================================
+
+class RateLimiter:
+    """
+    분당 요청/토큰 수 제한 (슬라이딩 윈도우)
+    
+    최근 window초 동안 허용한 요청과 예상 토큰 수를 기록하고, 새 요청이
+    한도를 넘기면 가장 오래된 기록이 윈도우를 벗어날 때까지 기다립니다.
+    동시에 많은 보고서를 요청해도 429 응답과 재시도 대기 없이 한도 안에서
+    최대한 빠르게 호출합니다.
+    
+    Example:
+        ```python
+        limiter = RateLimiter(requests_per_minute=50)
+        await limiter.acquire(tokens=1200)
+        ```
+    """
+    
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        window: float = 60.0,
+    ):
+        """
+        초기화
+        
+        Args:
+            requests_per_minute: 윈도우당 최대 요청 수 (None이면 제한 없음)
+            tokens_per_minute: 윈도우당 최대 토큰 수 (None이면 제한 없음)
+            window: 윈도우 길이 (초)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self._events: Deque[Tuple[float, int]] = deque()
+        self._tokens = 0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        요청 하나를 보낼 수 있을 때까지 대기 후 기록
+        
+        윈도우가 비어 있으면 토큰 한도보다 큰 요청도 바로 허용합니다.
+        
+        Args:
+            tokens: 요청의 예상 토큰 수
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._evict(now)
+                if self._has_capacity(tokens):
+                    break
+                await asyncio.sleep(self._events[0][0] + self.window - now)
+            
+            self._events.append((now, tokens))
+            self._tokens += tokens
+    
+    def _evict(self, now: float) -> None:
+        """윈도우를 벗어난 기록 제거"""
+        while self._events and self._events[0][0] <= now - self.window:
+            self._tokens -= self._events.popleft()[1]
+    
+    def _has_capacity(self, tokens: int) -> bool:
+        """현재 윈도우에 요청 하나를 더 허용할 수 있는지"""
+        if not self._events:
+            return True
+        if self.requests_per_minute is not None and len(self._events) >= self.requests_per_minute:
+            return False
+        if self.tokens_per_minute is not None and self._tokens + tokens > self.tokens_per_minute:
+            return False
+        return True
 
 
 # =============================================================================
@@ -87,6 +194,8 @@ class WriterAgent(StructuredOutputAgent):
         self,
         llm: BaseChatModel,
         config: Optional[AgentConfig] = None,
+        prompt_caching: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
         **kwargs,
     ):
         """
@@ -95,12 +204,17 @@ class WriterAgent(StructuredOutputAgent):
         Args:
             llm: LangChain LLM (Gemini 추천)
             config: Agent 설정
+            prompt_caching: 기본 설정 사용 시 시스템 프롬프트 캐싱 여부 (Anthropic)
+            rate_limiter: 비동기 LLM 호출 속도 제한 (None이면 제한 없음)
         """
+        self._rate_limiter = rate_limiter
         if config is None:
             config = AgentConfig(
                 name="WriterAgent",
                 role=AgentRole.WRITER,
                 system_prompt=WRITER_SYSTEM_PROMPT,
+                prompt_caching=prompt_caching,
+                response_cache=True,  # 재시도/평가 반복 시 같은 입력이면 LLM 호출 생략
             )
         
         super().__init__(
@@ -114,6 +228,13 @@ class WriterAgent(StructuredOutputAgent):
         """시스템 프롬프트"""
         return self.config.system_prompt or WRITER_SYSTEM_PROMPT
     
+    async def ainvoke(self, input: Any, config: Optional[Any] = None, **kwargs) -> Any:
+        """비동기 실행 (rate_limiter가 있으면 호출 전에 한도 확인)"""
+        if self._rate_limiter is not None:
+            # 입력 토큰 근사치 (보수적으로 3자당 1토큰)
+            await self._rate_limiter.acquire(len(str(input)) // 3 + 1)
+        return await super().ainvoke(input, config, **kwargs)
+    
     def write_report(
         self,
         request: str,
@@ -133,43 +254,168 @@ class WriterAgent(StructuredOutputAgent):
         Returns:
             ReportOutput
         """
-        import json
+        input_text = self._build_report_input(request, plan, execution_result, additional_context)
+        
+        try:
+            # 새 Runnable 구조: invoke가 직접 결과 반환
+            return self._to_report(self.invoke_cached(input_text))
+        except Exception:
+            return self._fallback_report(plan, execution_result)
+    
+    async def awrite_report(
+        self,
+        request: str,
+        plan: Dict[str, Any],
+        execution_result: Dict[str, Any],
+        additional_context: Optional[str] = None,
+    ) -> ReportOutput:
+        """
+        보고서 작성 (비동기)
+        
+        Args:
+            request: 원본 사용자 요청
+            plan: 실행 계획
+            execution_result: 실행 결과
+            additional_context: 추가 컨텍스트
+        
+        Returns:
+            ReportOutput
+        """
+        input_text = self._build_report_input(request, plan, execution_result, additional_context)
         
-        input_text = f"""## 원본 요청
+        try:
+            return self._to_report(await self.ainvoke_cached(input_text))
+        except Exception:
+            return self._fallback_report(plan, execution_result)
+    
+    async def astream_report(
+        self,
+        request: str,
+        plan: Dict[str, Any],
+        execution_result: Dict[str, Any],
+        additional_context: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        보고서 작성 (스트리밍)
+        
+        구조화 출력이 생성되는 동안 지금까지 채워진 필드를 순서대로 전달하므로,
+        호출 측에서 전체 응답을 기다리지 않고 제목/요약부터 표시할 수 있습니다.
+        
+        Args:
+            request: 원본 사용자 요청
+            plan: 실행 계획
+            execution_result: 실행 결과
+            additional_context: 추가 컨텍스트
+        
+        Yields:
+            부분 보고서 dict (마지막 값이 완성된 보고서)
+        """
+        input_text = self._build_report_input(request, plan, execution_result, additional_context)
+        
+        async for chunk in self.astream(input_text):
+            yield chunk.model_dump() if isinstance(chunk, BaseModel) else chunk
+    
+    def write_reports(self, items: List[Dict[str, Any]]) -> List[ReportOutput]:
+        """
+        여러 보고서 일괄 작성
+        
+        체인의 batch로 한 번에 실행하며, 동시 호출 수는 config.max_concurrency를 따릅니다.
+        
+        Args:
+            items: write_report 인자 dict 목록
+                (request, plan, execution_result, additional_context)
+        
+        Returns:
+            items 순서와 같은 ReportOutput 목록 (실패한 항목은 기본 보고서)
+        """
+        inputs = [self._build_report_input_from(item) for item in items]
+        results = self.batch(inputs, return_exceptions=True)
+        return [self._report_or_fallback(result, item) for result, item in zip(results, items)]
+    
+    async def abatch_reports(self, items: List[Dict[str, Any]]) -> List[ReportOutput]:
+        """
+        여러 보고서 일괄 작성 (비동기)
+        
+        Args:
+            items: awrite_report 인자 dict 목록
+                (request, plan, execution_result, additional_context)
+        
+        Returns:
+            items 순서와 같은 ReportOutput 목록 (실패한 항목은 기본 보고서)
+        """
+        inputs = [self._build_report_input_from(item) for item in items]
+        if self._rate_limiter is None:
+            results = await self.abatch(inputs, return_exceptions=True)
+        else:
+            # 호출마다 속도 제한을 거치도록 개별 실행
+            results = await asyncio.gather(
+                *(self.ainvoke(input_text) for input_text in inputs),
+                return_exceptions=True,
+            )
+        return [self._report_or_fallback(result, item) for result, item in zip(results, items)]
+    
+    def _build_report_input_from(self, item: Dict[str, Any]) -> str:
+        """write_report 인자 dict로 입력 텍스트 생성"""
+        return self._build_report_input(
+            item["request"],
+            item["plan"],
+            item["execution_result"],
+            item.get("additional_context"),
+        )
+    
+    def _report_or_fallback(self, result: Any, item: Dict[str, Any]) -> ReportOutput:
+        """배치 결과 하나를 ReportOutput으로 변환 (실패 시 기본 보고서)"""
+        if not isinstance(result, Exception):
+            try:
+                return self._to_report(result)
+            except Exception:
+                pass
+        return self._fallback_report(item["plan"], item["execution_result"])
+    
+    def _build_report_input(
+        self,
+        request: str,
+        plan: Dict[str, Any],
+        execution_result: Dict[str, Any],
+        additional_context: Optional[str],
+    ) -> str:
+        """보고서 작성 입력 텍스트 생성"""
+        # 같은 계획/결과를 반복 직렬화하지 않도록 캐시된 직렬화 사용
+        parts = [f"""## 원본 요청
 {request}
 
 ## 실행 계획
-{json.dumps(plan, ensure_ascii=False, indent=2)}
+{dumps_cached(plan, indent=True)}
 
 ## 실행 결과
-{json.dumps(execution_result, ensure_ascii=False, indent=2)}
-"""
+{dumps_cached(execution_result, indent=True)}
+"""]
         
         if additional_context:
-            input_text += f"\n## 추가 컨텍스트\n{additional_context}"
+            parts.append(f"\n## 추가 컨텍스트\n{additional_context}")
         
-        input_text += "\n\n위 정보를 바탕으로 전문적인 보고서를 작성해주세요."
-        
-        try:
-            # 새 Runnable 구조: invoke가 직접 결과 반환
-            result = self.invoke(input_text)
-            
-            if isinstance(result, ReportOutput):
-                return result
-            elif isinstance(result, dict):
-                return ReportOutput(**result)
-            else:
-                raise ValueError(f"Unexpected result type: {type(result)}")
-                
-        except Exception as e:
-            # 실패 시 기본 보고서 반환
-            return ReportOutput(
-                title="실행 결과 보고서",
-                summary=plan.get("task_summary", "작업 완료"),
-                content=f"# 실행 결과\n\n{str(execution_result)}",
-                conclusions=["작업이 완료되었습니다."],
-                word_count=100,
-            )
+        parts.append("\n\n위 정보를 바탕으로 전문적인 보고서를 작성해주세요.")
+        return "".join(parts)
+    
+    @staticmethod
+    def _to_report(result: Any) -> ReportOutput:
+        """체인 결과를 ReportOutput으로 변환"""
+        if isinstance(result, ReportOutput):
+            return result
+        elif isinstance(result, dict):
+            return ReportOutput.model_validate(result)
+        else:
+            raise ValueError(f"Unexpected result type: {type(result)}")
+    
+    @staticmethod
+    def _fallback_report(plan: Dict[str, Any], execution_result: Dict[str, Any]) -> ReportOutput:
+        """실패 시 기본 보고서"""
+        return ReportOutput(
+            title="실행 결과 보고서",
+            summary=plan.get("task_summary", "작업 완료"),
+            content=f"# 실행 결과\n\n{str(execution_result)}",
+            conclusions=["작업이 완료되었습니다."],
+        )
     
     def write_markdown(
         self,
@@ -190,71 +436,94 @@ class WriterAgent(StructuredOutputAgent):
         """
         report = self.write_report(request, plan, execution_result)
         
-        md = f"# {report.title}\n\n"
-        md += f"## 요약\n{report.summary}\n\n"
-        md += f"## 상세 내용\n{report.content}\n\n"
+        parts = [
+            f"# {report.title}\n\n",
+            f"## 요약\n{report.summary}\n\n",
+            f"## 상세 내용\n{report.content}\n\n",
+        ]
         
         if report.conclusions:
-            md += "## 결론\n"
-            for c in report.conclusions:
-                md += f"- {c}\n"
-            md += "\n"
+            parts.append("## 결론\n")
+            parts.extend(f"- {c}\n" for c in report.conclusions)
+            parts.append("\n")
         
         if report.recommendations:
-            md += "## 권장 사항\n"
-            for r in report.recommendations:
-                md += f"- {r}\n"
-            md += "\n"
+            parts.append("## 권장 사항\n")
+            parts.extend(f"- {r}\n" for r in report.recommendations)
+            parts.append("\n")
         
         if report.citations:
-            md += "## 참고 자료\n"
-            for c in report.citations:
-                md += f"- [{c.source}] {c.content}\n"
-            md += "\n"
+            parts.append("## 참고 자료\n")
+            parts.extend(f"- [{c.source}] {c.content}\n" for c in report.citations)
+            parts.append("\n")
         
-        return md
+        return "".join(parts)
 
 
 # =============================================================================
 # 팩토리 함수
 # =============================================================================
 
+# 프로바이더별 기본 모델
+_DEFAULT_MODELS = {
+    "google": "gemini-2.0-flash",
+    "anthropic": "claude-sonnet-4-20250514",
+    "openai": "gpt-4o",
+}
+
+# 프로바이더별 기본 분당 요청 수 (기본 요금제 기준)
+_DEFAULT_REQUESTS_PER_MINUTE = {
+    "google": 500,
+    "anthropic": 50,
+    "openai": 3500,
+}
+
+# LangChain 채팅 모델 패키지 → 프로바이더 (전달받은 LLM의 프로바이더 판별용)
+_PROVIDER_BY_MODULE = {
+    "langchain_google_genai": "google",
+    "langchain_anthropic": "anthropic",
+    "langchain_openai": "openai",
+}
+
+
+def _detect_provider(llm: Any) -> Optional[str]:
+    """LLM 인스턴스의 클래스 모듈로 프로바이더 판별 (알 수 없으면 None)"""
+    return _PROVIDER_BY_MODULE.get(type(llm).__module__.split(".", 1)[0])
+
+
 def create_writer_agent(
     llm: Optional[BaseChatModel] = None,
     provider: str = "google",
     model: Optional[str] = None,
+    requests_per_minute: Optional[int] = None,
 ) -> WriterAgent:
     """
     WriterAgent 생성 팩토리
     
     Args:
-        llm: LLM 인스턴스 (없으면 생성)
+        llm: LLM 인스턴스 (없으면 생성, 있으면 속도 제한/프롬프트 캐싱은 LLM 클래스 기준)
         provider: LLM 프로바이더 (google, anthropic, openai)
         model: 모델명
+        requests_per_minute: 비동기 호출의 분당 최대 요청 수 (None이면 프로바이더 기본값)
     
     Returns:
         WriterAgent
     """
     if llm is None:
-        if provider == "google":
-            from langchain_google_genai import ChatGoogleGenerativeAI
-            llm = ChatGoogleGenerativeAI(
-                model=model or "gemini-2.0-flash",
-                temperature=0.7,
-            )
-        elif provider == "anthropic":
-            from langchain_anthropic import ChatAnthropic
-            llm = ChatAnthropic(
-                model=model or "claude-sonnet-4-20250514",
-                temperature=0.7,
-            )
-        elif provider == "openai":
-            from langchain_openai import ChatOpenAI
-            llm = ChatOpenAI(
-                model=model or "gpt-4o",
-                temperature=0.7,
-            )
-        else:
+        if provider not in _DEFAULT_MODELS:
             raise ValueError(f"Unknown provider: {provider}")
+        # 프로바이더 SDK import와 LLM 인스턴스는 팩토리 캐시에서 재사용
+        llm = create_llm(provider, model=model or _DEFAULT_MODELS[provider], temperature=0.7)
+    else:
+        provider = _detect_provider(llm)
     
-    return WriterAgent(llm=llm)
+    rate_limiter = RateLimiter(
+        requests_per_minute=requests_per_minute or _DEFAULT_REQUESTS_PER_MINUTE.get(provider),
+    )
+    return WriterAgent(
+        llm=llm,
+        # 고정된 시스템 프롬프트를 Anthropic 프롬프트 캐시에 올림
+        # (OpenAI/Gemini는 동일 접두부를 자동으로 캐싱)
+        prompt_caching=provider == "anthropic",
+        rate_limiter=rate_limiter,
+    )
@@ -8,9 +8,13 @@ WriterAgent - 문서 작성 Agent
 - 다국어 지원
 """
 
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+import asyncio
+import html
+import re
 import time
 
 from prometheus.agents.base import (
@@ -23,6 +27,89 @@ from prometheus.agents.base import (
 from prometheus.llm.base import Message, MessageRole
 
 
+# 템플릿 플레이스홀더 ({{key}})
+_PLACEHOLDER = re.compile(r"\{\{(.+?)\}\}")
+
+# 단어 (공백으로 구분된 토큰)
+_WORD = re.compile(r"\S+")
+
+# to_html 문서 틀 (제목, 제목, 본문)
+_HTML_DOCUMENT = """<!DOCTYPE html>
+<html>
+<head><title>%s</title></head>
+<body>
+<h1>%s</h1>
+%s
+</body>
+</html>"""
+
+# 문단 경계 (빈 줄)
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def _compile_template(template: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    템플릿을 (리터럴, 플레이스홀더 이름) 목록으로 미리 분해
+    
+    마지막 항목의 플레이스홀더 이름은 None입니다.
+    """
+    parts: List[Tuple[str, Optional[str]]] = []
+    pos = 0
+    for match in _PLACEHOLDER.finditer(template):
+        parts.append((template[pos:match.start()], match.group(1)))
+        pos = match.end()
+    parts.append((template[pos:], None))
+    return parts
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    토큰 수 근사치 (보수적으로 3자당 1토큰)
+    
+    프로바이더 토크나이저는 원격 호출이나 인코딩 다운로드가 필요할 수 있어
+    청크 분할에는 로컬 근사치를 사용합니다.
+    """
+    return len(text) // 3 + 1
+
+
+def _paragraph_spans(content: str):
+    """(문단 끝 위치, 다음 문단 시작 위치) 순회"""
+    for match in _PARAGRAPH_BREAK.finditer(content):
+        yield match.start(), match.end()
+    yield len(content), len(content)
+
+
+def _split_into_chunks(content: str, max_tokens: int) -> List[str]:
+    """
+    문단 경계를 기준으로 내용을 토큰 예산 이하의 청크로 분할
+    
+    연속된 문단을 max_tokens를 넘지 않는 범위에서 하나의 청크로 묶습니다.
+    한 문단이 max_tokens보다 크면 그 문단만으로 청크를 만듭니다.
+    
+    Args:
+        content: 분할할 내용
+        max_tokens: 청크당 최대 토큰 수 (0 이하이면 분할하지 않음)
+        
+    Returns:
+        청크 목록 (원문 순서)
+    """
+    if max_tokens <= 0 or _estimate_tokens(content) <= max_tokens:
+        return [content]
+    
+    chunks: List[str] = []
+    start = end = 0
+    budget = 0
+    for paragraph_end, next_start in _paragraph_spans(content):
+        tokens = _estimate_tokens(content[end:paragraph_end])
+        if budget and budget + tokens > max_tokens:
+            chunks.append(content[start:end].strip("\n"))
+            start, budget = end, 0
+        budget += tokens
+        end = next_start
+    chunks.append(content[start:].strip("\n"))
+    return [c for c in chunks if c]
+
+
 class DocumentFormat(str, Enum):
     """문서 형식"""
     
@@ -36,6 +123,8 @@ class DocumentFormat(str, Enum):
 class DocumentSection(BaseModel):
     """문서 섹션"""
     
+    model_config = ConfigDict(frozen=True)
+    
     title: str
     content: str
     level: int = 1
@@ -43,19 +132,36 @@ class DocumentSection(BaseModel):
 
 
 class GeneratedDocument(BaseModel):
-    """생성된 문서"""
+    """생성된 문서 (생성 후 변경 불가)"""
+    
+    model_config = ConfigDict(frozen=True)
     
     title: str
     content: str
     format: DocumentFormat = DocumentFormat.MARKDOWN
-    sections: List[DocumentSection] = Field(default_factory=list)
+    sections: Tuple[DocumentSection, ...] = ()
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    word_count: int = 0
     language: str = "en"
     
-    def model_post_init(self, __context: Any) -> None:
-        """초기화 후 처리"""
-        self.word_count = len(self.content.split())
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "GeneratedDocument":
+        """복사 (update로 필드가 바뀔 수 있으므로 캐시된 단어 수/HTML 제거)"""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in ("word_count", "html"):
+            copied.__dict__.pop(name, None)
+        return copied
+    
+    @computed_field
+    @cached_property
+    def word_count(self) -> int:
+        """
+        본문 단어 수
+        
+        처음 접근할 때 한 번만 계산합니다 (토큰 리스트를 만들지 않고 셈).
+        
+        Returns:
+            공백으로 구분된 단어 수
+        """
+        return sum(1 for _ in _WORD.finditer(self.content))
     
     def to_markdown(self) -> str:
         """Markdown 형식으로 변환"""
@@ -72,20 +178,25 @@ class GeneratedDocument(BaseModel):
         return "\n".join(lines)
     
     def to_html(self) -> str:
-        """HTML 형식으로 변환"""
+        """HTML 형식으로 변환 (캐시된 결과 반환)"""
+        return self.html
+    
+    @cached_property
+    def html(self) -> str:
+        """
+        HTML 형식 문서
+        
+        처음 접근할 때 한 번만 생성합니다 (문서는 변경 불가).
+        
+        Returns:
+            HTML 문자열 (제목은 이스케이프)
+        """
         if self.format == DocumentFormat.HTML:
             return self.content
         
         # 간단한 변환
-        html_content = self.content.replace("\n", "<br>\n")
-        return f"""<!DOCTYPE html>
-<html>
-<head><title>{self.title}</title></head>
-<body>
-<h1>{self.title}</h1>
-{html_content}
-</body>
-</html>"""
+        title = html.escape(self.title)
+        return _HTML_DOCUMENT % (title, title, self.content.replace("\n", "<br>\n"))
 
 
 class WriterConfig(AgentConfig):
@@ -96,6 +207,11 @@ class WriterConfig(AgentConfig):
     default_language: str = "ko"
     max_length: Optional[int] = None
     include_toc: bool = False
+    response_cache_size: int = 128  # 0이면 응답 캐시 비활성화
+    response_cache_ttl: float = 3600.0
+    response_cache_max_temperature: float = 2.0  # 재시도/평가 반복 시 같은 입력이면 temperature와 무관하게 재사용
+    chunk_max_tokens: int = 2000  # 번역/요약/개선 시 청크당 최대 토큰 수 (0이면 분할하지 않음)
+    max_parallel_chunks: int = 4  # 청크별 LLM 동시 호출 수
 
 
 class WriterAgent(BaseAgent):
@@ -153,6 +269,8 @@ Generate the completed document:"""
         """
         super().__init__(config=config or WriterConfig(), **kwargs)
         self._templates: Dict[str, str] = {}
+        self._compiled_templates: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+        self._template_defaults: Dict[str, Any] = {}
     
     def _default_system_prompt(self) -> str:
         """기본 시스템 프롬프트"""
@@ -223,6 +341,21 @@ Always produce professional, readable content."""
                 messages=self._messages.copy(),
             )
     
+    async def run_batch(
+        self,
+        inputs: List[AgentInput],
+    ) -> List[AgentOutput]:
+        """
+        여러 문서 작성 동시 실행
+        
+        Args:
+            inputs: Agent 입력 목록
+            
+        Returns:
+            inputs 순서와 같은 Agent 출력 목록 (실패한 입력은 오류 출력)
+        """
+        return list(await asyncio.gather(*(self.run(input) for input in inputs)))
+    
     async def generate_document(
         self,
         title: str,
@@ -260,14 +393,14 @@ Always produce professional, readable content."""
             Message.user(prompt),
         ]
         
-        response = await self._call_llm(messages)
+        content = await self._call_llm_cached("generate", messages)
         
         self._add_message(Message.user(prompt))
-        self._add_message(Message.assistant(response.content))
+        self._add_message(Message.assistant(content))
         
         return GeneratedDocument(
             title=title,
-            content=response.content,
+            content=content,
             format=format_type,
             language=language,
             metadata={
@@ -284,6 +417,9 @@ Always produce professional, readable content."""
         """
         템플릿 적용
         
+        플레이스홀더는 data, 등록된 기본값(set_template_default) 순으로 채웁니다.
+        둘 다 없는 플레이스홀더가 남은 경우에만 LLM으로 완성합니다.
+        
         Args:
             template_name: 템플릿 이름
             data: 채울 데이터
@@ -295,17 +431,28 @@ Always produce professional, readable content."""
         if not template:
             raise ValueError(f"Template not found: {template_name}")
         
-        # 간단한 변수 치환 먼저 시도
-        filled_template = template
-        for key, value in data.items():
-            placeholder = "{{" + key + "}}"
-            filled_template = filled_template.replace(placeholder, str(value))
+        # 간단한 변수 치환 먼저 시도 (등록 시 분해해 둔 조각을 이어 붙임)
+        unresolved = False
+        pieces: List[str] = []
+        for literal, key in self._compiled_templates[template_name]:
+            pieces.append(literal)
+            if key is None:
+                continue
+            if key in data:
+                pieces.append(str(data[key]))
+            elif key in self._template_defaults:
+                pieces.append(str(self._template_defaults[key]))
+            else:
+                unresolved = True
+                pieces.append(f"{{{{{key}}}}}")
+        
+        filled_template = "".join(pieces)
         
         # 아직 플레이스홀더가 남아있으면 LLM 사용
-        if "{{" in filled_template:
+        if unresolved:
             prompt = self.TEMPLATE_PROMPT.format(
                 template=template,
-                data=str(data),
+                data=str({**self._template_defaults, **data}),
             )
             
             messages = [
@@ -323,7 +470,7 @@ Always produce professional, readable content."""
             title=data.get("title", template_name),
             content=filled_template,
             format=DocumentFormat.MARKDOWN,
-            metadata={"template": template_name},
+            metadata={"template": template_name, "llm_filled": unresolved},
         )
     
     async def translate(
@@ -343,21 +490,18 @@ Always produce professional, readable content."""
         Returns:
             번역된 내용
         """
-        prompt = f"""Translate the following text from {source_lang} to {target_lang}.
+        results = await self._map_chunks(
+            content,
+            "You are a professional translator. Provide accurate, natural translations.",
+            lambda chunk: f"""Translate the following text from {source_lang} to {target_lang}.
 Maintain the original formatting and structure.
 
 Text to translate:
-{content}
+{chunk}
 
-Translation:"""
-        
-        messages = [
-            Message.system("You are a professional translator. Provide accurate, natural translations."),
-            Message.user(prompt),
-        ]
-        
-        response = await self._call_llm(messages)
-        return response.content
+Translation:""",
+        )
+        return "\n\n".join(results)
     
     async def summarize(
         self,
@@ -376,22 +520,27 @@ Translation:"""
         Returns:
             요약된 내용
         """
+        system = "You are an expert at creating clear, accurate summaries."
         length_instruction = f"Keep it under {max_length} words." if max_length else ""
         
-        prompt = f"""Summarize the following content in a {style} manner.
+        def build_prompt(chunk: str) -> str:
+            return f"""Summarize the following content in a {style} manner.
 {length_instruction}
 
 Content:
-{content}
+{chunk}
 
 Summary:"""
         
-        messages = [
-            Message.system("You are an expert at creating clear, accurate summaries."),
-            Message.user(prompt),
-        ]
+        # 청크별 요약 후 (여러 개면) 요약들을 다시 요약
+        summaries = await self._map_chunks(content, system, build_prompt)
+        if len(summaries) == 1:
+            return summaries[0]
         
-        response = await self._call_llm(messages)
+        response = await self._call_llm([
+            Message.system(system),
+            Message.user(build_prompt("\n\n".join(summaries))),
+        ])
         return response.content
     
     async def improve_writing(
@@ -409,21 +558,50 @@ Summary:"""
         Returns:
             개선된 내용
         """
-        prompt = f"""Improve the following text with focus on {focus}.
+        results = await self._map_chunks(
+            content,
+            "You are an expert editor who improves writing while preserving meaning.",
+            lambda chunk: f"""Improve the following text with focus on {focus}.
 Maintain the original meaning and intent.
 
 Original text:
-{content}
+{chunk}
 
-Improved text:"""
+Improved text:""",
+        )
+        return "\n\n".join(results)
+    
+    async def _map_chunks(
+        self,
+        content: str,
+        system_prompt: str,
+        build_prompt: Callable[[str], str],
+    ) -> List[str]:
+        """
+        내용을 청크로 나눠 청크별 LLM 호출을 동시에 실행
         
-        messages = [
-            Message.system("You are an expert editor who improves writing while preserving meaning."),
-            Message.user(prompt),
-        ]
+        동시 호출 수는 config.max_parallel_chunks로 제한합니다.
         
-        response = await self._call_llm(messages)
-        return response.content
+        Args:
+            content: 처리할 내용
+            system_prompt: 시스템 프롬프트
+            build_prompt: 청크로 사용자 프롬프트를 만드는 함수
+            
+        Returns:
+            청크별 응답 (원문 순서)
+        """
+        chunks = _split_into_chunks(content, self.config.chunk_max_tokens)
+        semaphore = asyncio.Semaphore(max(1, self.config.max_parallel_chunks))
+        
+        async def process(chunk: str) -> str:
+            async with semaphore:
+                response = await self._call_llm([
+                    Message.system(system_prompt),
+                    Message.user(build_prompt(chunk)),
+                ])
+            return response.content
+        
+        return list(await asyncio.gather(*(process(c) for c in chunks)))
     
     def register_template(
         self,
@@ -438,6 +616,24 @@ Improved text:"""
             template: 템플릿 내용
         """
         self._templates[name] = template
+        self._compiled_templates[name] = _compile_template(template)
+    
+    def set_template_default(
+        self,
+        name: str,
+        value: Any,
+    ) -> None:
+        """
+        플레이스홀더 기본값 등록
+        
+        apply_template의 data에 없는 플레이스홀더를 이 값으로 채워
+        LLM 호출 없이 템플릿을 완성할 수 있게 합니다.
+        
+        Args:
+            name: 플레이스홀더 이름
+            value: 기본값 (빈 문자열 가능)
+        """
+        self._template_defaults[name] = value
     
     def get_template(
         self,
@@ -478,5 +674,6 @@ Improved text:"""
         """
         if name in self._templates:
             del self._templates[name]
+            del self._compiled_templates[name]
             return True
         return False
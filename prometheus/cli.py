@@ -12,89 +12,203 @@ import argparse
 import asyncio
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import prometheus
-from prometheus import (
-    ConfigLoader,
-    MetaAgent,
-    ExecutionMode,
-    AgentType,
-    LLMProvider,
-)
 
+try:
+    import uvloop
+except ImportError:  # uvloop 미설치 (Windows 등) 시 표준 asyncio 사용
+    uvloop = None
 
-def create_parser() -> argparse.ArgumentParser:
-    """CLI 파서 생성"""
-    parser = argparse.ArgumentParser(
-        prog="prometheus",
-        description="PROMETHEUS - Multi-Agent Orchestration Framework",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  prometheus new my_project --request "데이터 분석 보고서 작성"
-  prometheus run my_project "추가 분석 요청"
-  prometheus list
-  prometheus status my_project
-  prometheus version
-        """,
-    )
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+# list --verbose에서 프로젝트 설정을 동시에 로드할 최대 스레드 수
+_LIST_MAX_WORKERS = 8
+
+# run --mode 선택지 (ExecutionMode 값, meta_agent는 실행할 때만 import)
+_RUN_MODES = ("auto", "sequential", "plan_based")
+
+# run 결과 미리보기 최대 글자 수
+_RESULT_PREVIEW_CHARS = 1000
+
+
+def _run_coroutine(coro):
+    """
+    코루틴 실행 (uvloop가 있으면 uvloop 이벤트 루프 사용)
     
-    parser.add_argument(
-        "--version", "-v",
-        action="version",
-        version=f"PROMETHEUS v{prometheus.__version__}",
-    )
+    Args:
+        coro: 실행할 코루틴
+        
+    Returns:
+        코루틴 결과
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def _json_preview(value, limit: int) -> str:
+    """
+    들여쓰기된 JSON의 앞부분 (최대 limit 글자)
     
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    orjson이 있으면 C에서 바이트로 바로 직렬화하고, 없으면 표준 json을
+    조각 단위로 인코딩하다가 limit 글자에 도달하면 중단해 전체 문자열을 만들지 않습니다.
     
-    # new - 새 프로젝트 생성
+    Args:
+        value: 직렬화할 데이터
+        limit: 최대 글자 수
+        
+    Returns:
+        JSON 문자열 앞부분
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(
+                value,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # 64비트 범위를 넘는 정수 등은 표준 json으로 처리
+            pass
+        else:
+            # UTF-8 한 글자는 최대 4바이트, 잘린 마지막 글자는 버림
+            return data[:limit * 4].decode('utf-8', errors='ignore')[:limit]
+    
+    parts = []
+    size = 0
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=str)
+    for chunk in encoder.iterencode(value):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return ''.join(parts)[:limit]
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """여러 번 재사용할 이벤트 루프 생성 (uvloop 우선)"""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _add_new_parser(subparsers) -> None:
+    """new - 새 프로젝트 생성"""
     new_parser = subparsers.add_parser("new", help="Create a new project")
     new_parser.add_argument("name", help="Project name")
     new_parser.add_argument("--request", "-r", help="Initial request")
     new_parser.add_argument("--description", "-d", default="", help="Project description")
-    
-    # run - 프로젝트 실행
+
+
+def _add_run_parser(subparsers) -> None:
+    """run - 프로젝트 실행"""
     run_parser = subparsers.add_parser("run", help="Run a project with request")
     run_parser.add_argument("project", nargs="?", help="Project name")
     run_parser.add_argument("request", nargs="?", help="Request to execute")
     run_parser.add_argument("--mode", "-m", 
-                           choices=["auto", "sequential", "plan_based"],
+                           choices=_RUN_MODES,
                            default="auto", help="Execution mode")
     run_parser.add_argument("--interactive", "-i", action="store_true",
                            help="Interactive mode")
-    
-    # list - 프로젝트 목록
+
+
+def _add_list_parser(subparsers) -> None:
+    """list - 프로젝트 목록"""
     list_parser = subparsers.add_parser("list", help="List all projects")
     list_parser.add_argument("--verbose", "-v", action="store_true",
                             help="Show detailed info")
-    
-    # status - 프로젝트 상태
+
+
+def _add_status_parser(subparsers) -> None:
+    """status - 프로젝트 상태"""
     status_parser = subparsers.add_parser("status", help="Show project status")
     status_parser.add_argument("project", help="Project name")
-    
-    # config - 설정 관리
+
+
+def _add_config_parser(subparsers) -> None:
+    """config - 설정 관리"""
     config_parser = subparsers.add_parser("config", help="Manage configuration")
     config_parser.add_argument("action", choices=["show", "set", "reset"],
                               help="Config action")
     config_parser.add_argument("--key", "-k", help="Config key")
     config_parser.add_argument("--value", "-v", help="Config value")
+
+
+# 명령 -> 서브파서 구성 함수 (인자가 없는 명령은 None)
+_SUBPARSERS = {
+    "new": _add_new_parser,
+    "run": _add_run_parser,
+    "list": _add_list_parser,
+    "status": _add_status_parser,
+    "config": _add_config_parser,
+    "init": None,
+    "agents": None,
+    "tools": None,
+}
+
+# 인자 없는 명령의 도움말
+_SIMPLE_COMMAND_HELP = {
+    "init": "Initialize PROMETHEUS in current directory",
+    "agents": "List available agents",
+    "tools": "List available tools",
+}
+
+
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    CLI 파서 생성
     
-    # init - 초기화
-    init_parser = subparsers.add_parser("init", help="Initialize PROMETHEUS in current directory")
+    Args:
+        command: 지정하면 해당 명령의 서브파서만 구성 (None이면 전체 명령)
+        
+    Returns:
+        ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="prometheus",
+        description="PROMETHEUS - Multi-Agent Orchestration Framework",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  prometheus new my_project --request "데이터 분석 보고서 작성"
+  prometheus run my_project "추가 분석 요청"
+  prometheus list
+  prometheus status my_project
+  prometheus version
+        """,
+    )
     
-    # agents - Agent 정보
-    agents_parser = subparsers.add_parser("agents", help="List available agents")
+    parser.add_argument(
+        "--version", "-v",
+        action="version",
+        version=f"PROMETHEUS v{prometheus.__version__}",
+    )
     
-    # tools - Tool 정보
-    tools_parser = subparsers.add_parser("tools", help="List available tools")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    
+    for name, add_parser in _SUBPARSERS.items():
+        if command is not None and name != command:
+            continue
+        if add_parser is None:
+            subparsers.add_parser(name, help=_SIMPLE_COMMAND_HELP[name])
+        else:
+            add_parser(subparsers)
     
     return parser
 
 
 def cmd_new(args) -> int:
     """새 프로젝트 생성"""
+    from prometheus.config.loader import ConfigLoader
+    
     try:
         loader = ConfigLoader()
         path = loader.create_project(
@@ -121,22 +235,19 @@ def cmd_run(args) -> int:
     if args.interactive:
         return cmd_run_interactive(args)
     
+    from prometheus.controller.meta_agent import MetaAgent, ExecutionMode
+    
     if not args.request:
         print("❌ Request is required. Use: prometheus run [project] \"request\"", file=sys.stderr)
         return 1
     
-    mode_map = {
-        "auto": ExecutionMode.AUTO,
-        "sequential": ExecutionMode.SEQUENTIAL,
-        "plan_based": ExecutionMode.PLAN_BASED,
-    }
-    
     async def run_async():
         meta = MetaAgent()
         result = await meta.process_request(
             request=args.request,
             project_name=args.project,
-            mode=mode_map[args.mode],
+            # --mode 선택지는 ExecutionMode 값과 동일
+            mode=ExecutionMode(args.mode),
         )
         return result
     
@@ -147,7 +258,7 @@ def cmd_run(args) -> int:
         print(f"   Mode: {args.mode}")
         print("-" * 50)
         
-        result = asyncio.run(run_async())
+        result = _run_coroutine(run_async())
         
         if result.success:
             print("\n✅ Execution completed successfully!")
@@ -158,7 +269,7 @@ def cmd_run(args) -> int:
             
             if result.result:
                 print(f"\n📄 Result:")
-                print(json.dumps(result.result, indent=2, ensure_ascii=False, default=str)[:1000])
+                print(_json_preview(result.result, _RESULT_PREVIEW_CHARS))
         else:
             print(f"\n❌ Execution failed: {result.error}")
             return 1
@@ -171,6 +282,8 @@ def cmd_run(args) -> int:
 
 def cmd_run_interactive(args) -> int:
     """대화형 모드 실행"""
+    from prometheus.controller.meta_agent import MetaAgent, ExecutionMode
+    
     print("=" * 60)
     print("🤖 PROMETHEUS Interactive Mode")
     print("=" * 60)
@@ -188,19 +301,24 @@ def cmd_run_interactive(args) -> int:
             mode=ExecutionMode.AUTO,
         )
     
-    while True:
-        try:
-            user_input = input("\n📝 Request > ").strip()
-            
-            if not user_input:
-                continue
-            
-            if user_input.lower() in ["quit", "exit", "q"]:
-                print("👋 Goodbye!")
-                break
-            
-            if user_input.lower() == "help":
-                print("""
+    # 대화 동안 하나의 이벤트 루프를 재사용 (HTTP 클라이언트 등 연결 유지)
+    loop = _new_event_loop()
+    asyncio.set_event_loop(loop)
+    
+    try:
+        while True:
+            try:
+                user_input = input("\n📝 Request > ").strip()
+                
+                if not user_input:
+                    continue
+                
+                if user_input.lower() in ["quit", "exit", "q"]:
+                    print("👋 Goodbye!")
+                    break
+                
+                if user_input.lower() == "help":
+                    print("""
 Available commands:
   quit, exit, q  - Exit interactive mode
   help          - Show this help
@@ -208,34 +326,40 @@ Available commands:
   
 Or enter any request to execute.
                 """)
-                continue
-            
-            if user_input.lower() == "status":
-                stats = meta._lifecycle.get_stats() if hasattr(meta, '_lifecycle') else {}
-                print(f"Projects: {len(meta._project_agents)}")
-                continue
-            
-            print(f"\n⏳ Processing: {user_input}")
-            result = asyncio.run(process(user_input))
-            
-            if result.success:
-                print(f"✅ Done! ({result.execution_time:.2f}s)")
-                if result.result:
-                    print(f"Result: {str(result.result)[:500]}")
-            else:
-                print(f"❌ Failed: {result.error}")
+                    continue
                 
-        except KeyboardInterrupt:
-            print("\n👋 Interrupted. Goodbye!")
-            break
-        except Exception as e:
-            print(f"❌ Error: {e}")
+                if user_input.lower() == "status":
+                    stats = meta._lifecycle.get_stats() if hasattr(meta, '_lifecycle') else {}
+                    print(f"Projects: {len(meta._project_agents)}")
+                    continue
+                
+                print(f"\n⏳ Processing: {user_input}")
+                result = loop.run_until_complete(process(user_input))
+                
+                if result.success:
+                    print(f"✅ Done! ({result.execution_time:.2f}s)")
+                    if result.result:
+                        print(f"Result: {str(result.result)[:500]}")
+                else:
+                    print(f"❌ Failed: {result.error}")
+                    
+            except KeyboardInterrupt:
+                print("\n👋 Interrupted. Goodbye!")
+                break
+            except Exception as e:
+                print(f"❌ Error: {e}")
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        asyncio.set_event_loop(None)
+        loop.close()
     
     return 0
 
 
 def cmd_list(args) -> int:
     """프로젝트 목록"""
+    from prometheus.config.loader import ConfigLoader
+    
     loader = ConfigLoader()
     projects = loader.list_projects()
     
@@ -247,24 +371,48 @@ def cmd_list(args) -> int:
     print(f"📂 Projects ({len(projects)}):")
     print("-" * 40)
     
-    for name in projects:
-        if args.verbose:
-            try:
-                config = loader.load_project(name)
-                print(f"  📁 {name}")
-                print(f"     Description: {config.metadata.description or 'N/A'}")
-                print(f"     Agents: {len(config.agents)}")
-                print(f"     Created: {config.metadata.created_at}")
-            except:
-                print(f"  📁 {name} (error loading)")
-        else:
+    if not args.verbose:
+        for name in projects:
             print(f"  📁 {name}")
+        return 0
+    
+    # 프로젝트 설정 파일 읽기/파싱은 여러 스레드에서 겹쳐 수행하고 출력은 순서대로
+    with ThreadPoolExecutor(max_workers=min(_LIST_MAX_WORKERS, len(projects))) as executor:
+        configs = list(executor.map(lambda name: _load_project_or_none(loader, name), projects))
+    
+    for name, config in zip(projects, configs):
+        if config is None:
+            print(f"  📁 {name} (error loading)")
+            continue
+        print(f"  📁 {name}")
+        print(f"     Description: {config.metadata.description or 'N/A'}")
+        print(f"     Agents: {len(config.agents)}")
+        print(f"     Created: {config.metadata.created_at}")
     
     return 0
 
 
+def _load_project_or_none(loader, name: str):
+    """
+    프로젝트 설정 로드 (실패 시 None)
+    
+    Args:
+        loader: ConfigLoader
+        name: 프로젝트 이름
+        
+    Returns:
+        프로젝트 설정 또는 None
+    """
+    try:
+        return loader.load_project(name)
+    except Exception:
+        return None
+
+
 def cmd_status(args) -> int:
     """프로젝트 상태"""
+    from prometheus.config.loader import ConfigLoader
+    
     loader = ConfigLoader()
     
     try:
@@ -297,6 +445,8 @@ def cmd_status(args) -> int:
 def cmd_config(args) -> int:
     """설정 관리"""
     if args.action == "show":
+        from prometheus.config.loader import ConfigLoader
+        
         loader = ConfigLoader()
         print(f"📁 Base directory: {loader.base_dir}")
         print(f"📁 Projects directory: {loader.projects_dir}")
@@ -374,27 +524,32 @@ def cmd_tools(args) -> int:
     return 0
 
 
+# 명령 이름 -> 처리 함수
+_COMMANDS = {
+    "new": cmd_new,
+    "run": cmd_run,
+    "list": cmd_list,
+    "status": cmd_status,
+    "config": cmd_config,
+    "init": cmd_init,
+    "agents": cmd_agents,
+    "tools": cmd_tools,
+}
+
+
 def main() -> int:
     """메인 진입점"""
-    parser = create_parser()
-    args = parser.parse_args()
+    # 실행할 명령의 서브파서만 구성 (알 수 없는 명령/도움말은 전체 파서)
+    argv = sys.argv[1:]
+    command = argv[0] if argv and argv[0] in _SUBPARSERS else None
+    parser = create_parser(command)
+    args = parser.parse_args(argv)
     
     if args.command is None:
         parser.print_help()
         return 0
     
-    commands = {
-        "new": cmd_new,
-        "run": cmd_run,
-        "list": cmd_list,
-        "status": cmd_status,
-        "config": cmd_config,
-        "init": cmd_init,
-        "agents": cmd_agents,
-        "tools": cmd_tools,
-    }
-    
-    handler = commands.get(args.command)
+    handler = _COMMANDS.get(args.command)
     if handler:
         return handler(args)
     
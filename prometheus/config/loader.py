@@ -9,15 +9,80 @@ ConfigLoader - 설정 로더
 - 다양한 설정 소스 지원 (YAML, JSON, ENV)
 """
 
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 from pathlib import Path
 from pydantic import BaseModel
 import os
 import json
+import re
 import yaml
 from dotenv import load_dotenv
 
-from prometheus.config.project_schema import ProjectConfig, LLMProviderConfig, MemoryConfig
+from prometheus.config.project_schema import (
+    ProjectConfig,
+    ProjectMetadata,
+    AgentConfig,
+    AgentType,
+    ToolConfig,
+    LLMProviderConfig,
+    MemoryConfig,
+)
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml 없이 설치된 PyYAML은 순수 Python 로더 사용
+    from yaml import SafeLoader as _YamlLoader
+
+
+# 새 프로젝트에 기본으로 포함되는 Agent
+_DEFAULT_AGENT_TYPES = (
+    AgentType.PLANNER,
+    AgentType.EXECUTOR,
+    AgentType.WRITER,
+    AgentType.QA,
+)
+
+# 프로젝트 설정 파일 이름 (우선순위 순)
+_PROJECT_FILE_NAMES = ("project.yaml", "project.yml")
+
+# 프로바이더별 API 키 환경 변수
+_PROVIDER_ENV_KEYS = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "gemini": "GOOGLE_API_KEY",
+}
+
+# 환경 변수 참조: ${VAR_NAME} 또는 $VAR_NAME (대문자/숫자/밑줄)
+_ENV_RE = re.compile(r'\$\{([^}]+)\}|\$([A-Z_][A-Z0-9_]*)')
+
+
+def _replace_env_var(match: "re.Match[str]") -> str:
+    """매치된 환경 변수 참조를 값으로 치환 (없으면 원문 유지)"""
+    return os.environ.get(match.group(1) or match.group(2), match.group(0))
+
+
+def _substitute_env(value: Any) -> Any:
+    """
+    설정 트리의 문자열 값에서 환경 변수 참조 치환
+    
+    YAML 설정의 대부분을 차지하는 문자열/스칼라 값을 먼저 처리하고,
+    '$'가 없는 문자열은 정규식 검사 없이 그대로 반환합니다.
+    """
+    if type(value) is str:
+        return _ENV_RE.sub(_replace_env_var, value) if '$' in value else value
+    if isinstance(value, dict):
+        return {k: _substitute_env(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_substitute_env(item) for item in value]
+    return value
 
 
 class LoaderConfig(BaseModel):
@@ -26,6 +91,7 @@ class LoaderConfig(BaseModel):
     projects_dir: str = "./projects"
     env_file: str = ".env"
     default_config_file: str = "default_config.yaml"
+    cache_size: int = 128  # 캐시할 최대 프로젝트 수
 
 
 class ConfigLoadError(Exception):
@@ -59,9 +125,9 @@ class ConfigLoader:
             auto_load_env: 자동으로 .env 파일 로드 여부
         """
         self.config = config or LoaderConfig()
-        self._env_vars: Dict[str, str] = {}
         self._default_config: Optional[ProjectConfig] = None
-        self._loaded_projects: Dict[str, ProjectConfig] = {}
+        # 경로 -> (설정 파일 mtime_ns, 설정, validate_all 통과 여부), 최근 사용 순서 유지
+        self._loaded_projects: "OrderedDict[str, Tuple[int, ProjectConfig, bool]]" = OrderedDict()
         
         if auto_load_env:
             self.load_env()
@@ -74,6 +140,9 @@ class ConfigLoader:
         """
         프로젝트 설정 로드
         
+        설정 파일의 수정 시각이 캐시 시점과 같으면 캐시된 설정을 반환하고,
+        파일이 바뀌었으면 다시 로드합니다.
+        
         Args:
             project_path: 프로젝트 디렉토리 경로 또는 프로젝트 이름
             use_cache: 캐시 사용 여부
@@ -91,18 +160,27 @@ class ConfigLoader:
             if not path.exists():
                 path = Path(self.config.projects_dir) / project_path
         
-        # 캐시 확인
-        cache_key = str(path.resolve())
-        if use_cache and cache_key in self._loaded_projects:
-            return self._loaded_projects[cache_key]
-        
         # project.yaml 파일 찾기
-        config_file = path / "project.yaml"
-        if not config_file.exists():
-            config_file = path / "project.yml"
-        if not config_file.exists():
+        config_file = self._find_project_config(path)
+        if config_file is None:
             raise ConfigLoadError(f"Project config file not found in {path}")
         
+        # 캐시 확인 (파일이 바뀌지 않은 경우만)
+        cache_key = self._cache_key(path)
+        mtime_ns = config_file.stat().st_mtime_ns
+        cached = self._loaded_projects.get(cache_key)
+        if use_cache and cached is not None and cached[0] == mtime_ns:
+            _, project_config, validated = cached
+            if not validated:
+                # create_project가 기록한 미검증 설정은 처음 사용할 때 한 번만 검증
+                if not project_config.validate_all():
+                    raise ConfigLoadError(
+                        f"Failed to load project config: Project config validation failed: {path}"
+                    )
+                self._remember_project(cache_key, mtime_ns, project_config, validated=True)
+            self._loaded_projects.move_to_end(cache_key)
+            return project_config
+        
         try:
             # YAML 로드
             yaml_data = self.load_yaml(str(config_file))
@@ -117,15 +195,13 @@ class ConfigLoader:
             if not project_config.validate_all():
                 raise ConfigValidationError(f"Project config validation failed: {path}")
             
-            # 캐시 저장
-            self._loaded_projects[cache_key] = project_config
+            self._remember_project(cache_key, mtime_ns, project_config, validated=True)
             
             return project_config
             
-        except yaml.YAMLError as e:
-            raise ConfigLoadError(f"Failed to parse YAML: {e}")
         except Exception as e:
-            raise ConfigLoadError(f"Failed to load project config: {e}")
+            # load_yaml이 YAML 오류를 이미 ConfigLoadError로 변환하므로 한 곳에서 처리
+            raise ConfigLoadError(f"Failed to load project config: {e}") from e
     
     def load_yaml(
         self,
@@ -148,13 +224,13 @@ class ConfigLoader:
             raise ConfigLoadError(f"YAML file not found: {file_path}")
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                return data if data else {}
+            # 바이트 그대로 전달 (UTF-8 디코딩은 libyaml이 처리)
+            data = yaml.load(path.read_bytes(), Loader=_YamlLoader)
+            return data if data else {}
         except yaml.YAMLError as e:
-            raise ConfigLoadError(f"Failed to parse YAML file {file_path}: {e}")
+            raise ConfigLoadError(f"Failed to parse YAML file {file_path}: {e}") from e
         except IOError as e:
-            raise ConfigLoadError(f"Failed to read file {file_path}: {e}")
+            raise ConfigLoadError(f"Failed to read file {file_path}: {e}") from e
     
     def load_json(
         self,
@@ -177,17 +253,18 @@ class ConfigLoader:
             raise ConfigLoadError(f"JSON file not found: {file_path}")
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # 바이트를 그대로 파싱 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+            data = path.read_bytes()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         except json.JSONDecodeError as e:
-            raise ConfigLoadError(f"Failed to parse JSON file {file_path}: {e}")
+            raise ConfigLoadError(f"Failed to parse JSON file {file_path}: {e}") from e
         except IOError as e:
-            raise ConfigLoadError(f"Failed to read file {file_path}: {e}")
+            raise ConfigLoadError(f"Failed to read file {file_path}: {e}") from e
     
     def load_env(
         self,
         env_file: Optional[str] = None,
-    ) -> Dict[str, str]:
+    ) -> Mapping[str, str]:
         """
         환경 변수 로드
         
@@ -195,18 +272,12 @@ class ConfigLoader:
             env_file: .env 파일 경로 (None이면 기본 경로 사용)
             
         Returns:
-            로드된 환경 변수 딕셔너리
+            현재 환경 변수 (읽기 전용 뷰, 복사하지 않음)
         """
-        env_path = env_file or self.config.env_file
-        
-        # .env 파일 로드 (존재하는 경우)
-        if Path(env_path).exists():
-            load_dotenv(env_path)
+        # .env 파일 로드 (파일이 없으면 load_dotenv가 아무것도 하지 않음)
+        load_dotenv(env_file or self.config.env_file)
         
-        # 현재 환경 변수 캐시
-        self._env_vars = dict(os.environ)
-        
-        return self._env_vars
+        return MappingProxyType(os.environ)
     
     def get_env(
         self,
@@ -238,15 +309,8 @@ class ConfigLoader:
         Returns:
             API 키 또는 None
         """
-        key_map = {
-            "openai": "OPENAI_API_KEY",
-            "anthropic": "ANTHROPIC_API_KEY",
-            "gemini": "GOOGLE_API_KEY",
-        }
-        env_key = key_map.get(provider.lower())
-        if env_key:
-            return self.get_env(env_key)
-        return None
+        env_key = _PROVIDER_ENV_KEYS.get(provider.lower())
+        return os.environ.get(env_key) if env_key else None
     
     def merge_configs(
         self,
@@ -265,13 +329,19 @@ class ConfigLoader:
         """
         result = base.copy()
         
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                # 딕셔너리는 재귀적으로 병합
-                result[key] = self.merge_configs(result[key], value)
-            else:
-                # 그 외는 오버라이드
-                result[key] = value
+        # (병합 대상, 오버라이드) 스택으로 반복 처리 - 오버라이드가 닿는 하위 dict만 복사
+        stack = [(result, override)]
+        while stack:
+            target, changes = stack.pop()
+            for key, value in changes.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    # 딕셔너리는 복사본에 이어서 병합 (원본 base는 수정하지 않음)
+                    target[key] = current = current.copy()
+                    stack.append((current, value))
+                else:
+                    # 그 외는 오버라이드
+                    target[key] = value
         
         return result
     
@@ -301,16 +371,17 @@ class ConfigLoader:
         Returns:
             프로젝트 이름 목록
         """
-        projects_path = Path(self.config.projects_dir)
-        if not projects_path.exists():
+        try:
+            entries = os.scandir(self.config.projects_dir)
+        except (FileNotFoundError, NotADirectoryError):
             return []
         
         projects = []
-        for item in projects_path.iterdir():
-            if item.is_dir():
-                # project.yaml 또는 project.yml 존재 확인
-                if (item / "project.yaml").exists() or (item / "project.yml").exists():
-                    projects.append(item.name)
+        with entries:
+            for entry in entries:
+                # 디렉토리 여부는 scandir 결과로 확인 (추가 stat 없음)
+                if entry.is_dir() and self._find_project_config(entry.path) is not None:
+                    projects.append(entry.name)
         
         return sorted(projects)
     
@@ -327,7 +398,7 @@ class ConfigLoader:
         Returns:
             존재 여부
         """
-        return project_name in self.list_projects()
+        return self._find_project_config(self.get_project_path(project_name)) is not None
     
     def get_project_path(
         self,
@@ -372,23 +443,89 @@ class ConfigLoader:
         # 디렉토리 생성
         project_path.mkdir(parents=True, exist_ok=True)
         
-        # 기본 설정 생성
-        if config is None:
+        # 기본 설정 생성 (로더가 직접 만든 설정이므로 검증된 것으로 취급)
+        trusted = config is None
+        if trusted:
             config = self._create_default_project_config(project_name)
         
-        # project.yaml 저장
+        # project.yaml 저장 (libyaml로 UTF-8 바이트를 바로 생성)
         config_file = project_path / "project.yaml"
-        with open(config_file, 'w', encoding='utf-8') as f:
-            f.write(config.to_yaml())
+        content = config.to_yaml_bytes()
+        config_file.write_bytes(content)
+        
+        # 환경 변수 참조가 없으면 다시 로드해도 같은 설정이므로 바로 캐시
+        if b'$' not in content:
+            self._remember_project(
+                self._cache_key(project_path),
+                config_file.stat().st_mtime_ns,
+                config,
+                validated=trusted,
+            )
         
         # request.txt 저장
         if request:
-            request_file = project_path / "request.txt"
-            with open(request_file, 'w', encoding='utf-8') as f:
-                f.write(request)
+            (project_path / "request.txt").write_bytes(request.encode('utf-8'))
         
         return project_path
     
+    @staticmethod
+    def _cache_key(path: Path) -> str:
+        """
+        프로젝트 캐시 키 (심볼릭 링크 해석 없이 경로 문자열만 정규화)
+        
+        Args:
+            path: 프로젝트 디렉토리 경로
+            
+        Returns:
+            정규화된 절대 경로 문자열
+        """
+        return os.path.abspath(os.fspath(path))
+    
+    def _remember_project(
+        self,
+        cache_key: str,
+        mtime_ns: int,
+        project_config: ProjectConfig,
+        validated: bool,
+    ) -> None:
+        """
+        프로젝트 설정 캐시 저장 (크기 초과 시 가장 오래 사용하지 않은 항목 제거)
+        
+        Args:
+            cache_key: 프로젝트 경로 키
+            mtime_ns: 설정 파일 수정 시각
+            project_config: 프로젝트 설정
+            validated: validate_all() 통과 여부
+        """
+        # 기존 항목을 지우고 다시 넣어 맨 뒤로 이동 (다른 스레드가 제거해도 안전)
+        self._loaded_projects.pop(cache_key, None)
+        self._loaded_projects[cache_key] = (mtime_ns, project_config, validated)
+        while len(self._loaded_projects) > self.config.cache_size:
+            self._loaded_projects.popitem(last=False)
+    
+    @staticmethod
+    def _find_project_config(dir_path: Union[str, Path]) -> Optional[Path]:
+        """
+        프로젝트 설정 파일 찾기 (디렉토리를 한 번만 스캔)
+        
+        Args:
+            dir_path: 프로젝트 디렉토리 경로
+            
+        Returns:
+            project.yaml 경로 (없으면 project.yml, 둘 다 없으면 None)
+        """
+        found = None
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.name in _PROJECT_FILE_NAMES and entry.is_file():
+                        if entry.name == _PROJECT_FILE_NAMES[0]:
+                            return Path(entry.path)
+                        found = Path(entry.path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return found
+    
     def _substitute_env_vars(
         self,
         config: Any,
@@ -403,29 +540,7 @@ class ConfigLoader:
         Returns:
             치환된 설정
         """
-        import re
-        
-        if isinstance(config, dict):
-            return {k: self._substitute_env_vars(v) for k, v in config.items()}
-        elif isinstance(config, list):
-            return [self._substitute_env_vars(item) for item in config]
-        elif isinstance(config, str):
-            # ${VAR_NAME} 패턴
-            pattern = r'\$\{([^}]+)\}'
-            
-            def replace(match: re.Match) -> str:
-                var_name = match.group(1)
-                return os.environ.get(var_name, match.group(0))
-            
-            result = re.sub(pattern, replace, config)
-            
-            # $VAR_NAME 패턴 (단어 경계)
-            pattern2 = r'\$([A-Z_][A-Z0-9_]*)'
-            result = re.sub(pattern2, replace, result)
-            
-            return result
-        else:
-            return config
+        return _substitute_env(config)
     
     def _create_default_project_config(
         self,
@@ -440,14 +555,6 @@ class ConfigLoader:
         Returns:
             기본 ProjectConfig
         """
-        from prometheus.config.project_schema import (
-            ProjectMetadata,
-            AgentConfig,
-            AgentType,
-            ToolConfig,
-        )
-        from datetime import datetime
-        
         return ProjectConfig(
             metadata=ProjectMetadata(
                 name=project_name,
@@ -456,12 +563,7 @@ class ConfigLoader:
                 created_at=datetime.now().isoformat(),
             ),
             default_llm=LLMProviderConfig(),
-            agents=[
-                AgentConfig(agent_type=AgentType.PLANNER),
-                AgentConfig(agent_type=AgentType.EXECUTOR),
-                AgentConfig(agent_type=AgentType.WRITER),
-                AgentConfig(agent_type=AgentType.QA),
-            ],
+            agents=[AgentConfig(agent_type=t) for t in _DEFAULT_AGENT_TYPES],
             tools=[
                 ToolConfig(name="python_exec", enabled=True),
             ],
@@ -9,11 +9,32 @@ ProjectSchema - 프로젝트 설정 스키마
 - 설정 유효성 검증
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
+import re
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # libyaml 없이 설치된 PyYAML은 순수 Python 로더/덤퍼 사용
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+
+# 프로젝트 이름: 영문자로 시작, 영문자/숫자/밑줄/하이픈
+_PROJECT_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]*$')
+
+# 앞뒤 공백을 제거한 뒤 비어 있지 않은 문자열 (pydantic-core에서 검증)
+_NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
 
 class LLMProvider(str, Enum):
     """LLM 프로바이더"""
@@ -32,51 +53,39 @@ class AgentType(str, Enum):
     QA = "qa"
 
 
+# Agent 유형별 기본 이름 (예: planner -> PlannerAgent)
+_DEFAULT_AGENT_NAMES: Dict[AgentType, str] = {
+    agent_type: f"{agent_type.value.capitalize()}Agent" for agent_type in AgentType
+}
+
+
 class LLMProviderConfig(BaseModel):
     """LLM 프로바이더 설정"""
     
+    model_config = ConfigDict(frozen=True)
+    
     provider: LLMProvider = LLMProvider.OPENAI
-    model: str = "gpt-4-turbo-preview"
+    model: _NonEmptyStr = "gpt-4-turbo-preview"
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     max_tokens: Optional[int] = None
     api_key_env: str = "OPENAI_API_KEY"
-    
-    @field_validator("temperature")
-    @classmethod
-    def validate_temperature(cls, v: float) -> float:
-        """temperature 유효성 검증"""
-        if not 0.0 <= v <= 2.0:
-            raise ValueError("temperature must be between 0.0 and 2.0")
-        return v
-    
-    @field_validator("model")
-    @classmethod
-    def validate_model(cls, v: str) -> str:
-        """model 유효성 검증"""
-        if not v or not v.strip():
-            raise ValueError("model name cannot be empty")
-        return v.strip()
 
 
 class ToolConfig(BaseModel):
     """Tool 설정"""
     
-    name: str
+    model_config = ConfigDict(frozen=True)
+    
+    name: _NonEmptyStr
     enabled: bool = True
     config: Dict[str, Any] = Field(default_factory=dict)
-    
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """name 유효성 검증"""
-        if not v or not v.strip():
-            raise ValueError("tool name cannot be empty")
-        return v.strip()
 
 
 class AgentConfig(BaseModel):
     """Agent 설정"""
     
+    model_config = ConfigDict(frozen=True)
+    
     agent_type: AgentType
     name: Optional[str] = None
     llm: Optional[LLMProviderConfig] = None
@@ -84,15 +93,20 @@ class AgentConfig(BaseModel):
     system_prompt: Optional[str] = None
     config: Dict[str, Any] = Field(default_factory=dict)
     
-    def model_post_init(self, __context: Any) -> None:
-        """초기화 후 처리 - 이름 자동 설정"""
+    @model_validator(mode="after")
+    def set_default_name(self) -> "AgentConfig":
+        """이름 자동 설정 (없으면 Agent 유형별 기본 이름)"""
         if self.name is None:
-            self.name = f"{self.agent_type.value.capitalize()}Agent"
+            # frozen 모델이므로 검증 중에만 직접 설정
+            object.__setattr__(self, "name", _DEFAULT_AGENT_NAMES[self.agent_type])
+        return self
 
 
 class MemoryConfig(BaseModel):
     """메모리 설정"""
     
+    model_config = ConfigDict(frozen=True)
+    
     type: str = "local"
     vector_store: str = "chroma"
     persist_path: Optional[str] = None
@@ -110,6 +124,8 @@ class MemoryConfig(BaseModel):
 class ProjectMetadata(BaseModel):
     """프로젝트 메타데이터"""
     
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     description: str = ""
     version: str = "1.0.0"
@@ -122,16 +138,16 @@ class ProjectMetadata(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """name 유효성 검증"""
-        if not v or not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError("project name cannot be empty")
         # 프로젝트 이름에 허용되는 문자 검증
-        import re
-        if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', v.strip()):
+        if not _PROJECT_NAME_RE.match(v):
             raise ValueError(
                 "project name must start with a letter and contain only "
                 "letters, numbers, underscores, and hyphens"
             )
-        return v.strip()
+        return v
 
 
 class ProjectConfig(BaseModel):
@@ -140,8 +156,11 @@ class ProjectConfig(BaseModel):
     
     PROMETHEUS 프로젝트의 전체 설정을 정의합니다.
     YAML 파일로부터 로드되어 사용됩니다.
+    로드 후에는 변경할 수 없습니다 (frozen).
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     metadata: ProjectMetadata
     default_llm: LLMProviderConfig = Field(default_factory=LLMProviderConfig)
     agents: List[AgentConfig] = Field(default_factory=list)
@@ -149,6 +168,34 @@ class ProjectConfig(BaseModel):
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
     settings: Dict[str, Any] = Field(default_factory=dict)
     
+    # 조회용 인덱스: (구성에 사용한 목록, 당시 길이, 인덱스)
+    # model_copy(update=...)나 목록 직접 수정 후에도 어긋나지 않도록 조회 시 확인 후 재구성
+    _agent_index: Optional[Tuple[List[AgentConfig], int, Dict[AgentType, AgentConfig]]] = PrivateAttr(default=None)
+    _tool_index: Optional[Tuple[List[ToolConfig], int, Dict[str, ToolConfig]]] = PrivateAttr(default=None)
+    
+    def _agents_by_type(self) -> Dict[AgentType, AgentConfig]:
+        """Agent 타입 → 설정 인덱스 (agents 목록이 바뀌었으면 재구성)"""
+        agents = self.agents
+        cached = self._agent_index
+        if cached is None or cached[0] is not agents or cached[1] != len(agents):
+            # Agent 타입 중복은 검증에서 차단
+            cached = (agents, len(agents), {agent.agent_type: agent for agent in agents})
+            self._agent_index = cached
+        return cached[2]
+    
+    def _tools_by_name(self) -> Dict[str, ToolConfig]:
+        """Tool 이름 → 설정 인덱스 (tools 목록이 바뀌었으면 재구성)"""
+        tools = self.tools
+        cached = self._tool_index
+        if cached is None or cached[0] is not tools or cached[1] != len(tools):
+            # 같은 이름의 Tool은 먼저 나온 설정 우선
+            tool_index: Dict[str, ToolConfig] = {}
+            for tool in tools:
+                tool_index.setdefault(tool.name, tool)
+            cached = (tools, len(tools), tool_index)
+            self._tool_index = cached
+        return cached[2]
+    
     @field_validator("agents")
     @classmethod
     def validate_agents(cls, v: List[AgentConfig]) -> List[AgentConfig]:
@@ -171,10 +218,7 @@ class ProjectConfig(BaseModel):
         Returns:
             Agent 설정 또는 None
         """
-        for agent in self.agents:
-            if agent.agent_type == agent_type:
-                return agent
-        return None
+        return self._agents_by_type().get(agent_type)
     
     def get_tool_config(
         self,
@@ -189,10 +233,7 @@ class ProjectConfig(BaseModel):
         Returns:
             Tool 설정 또는 None
         """
-        for tool in self.tools:
-            if tool.name == tool_name:
-                return tool
-        return None
+        return self._tools_by_name().get(tool_name)
     
     def get_enabled_tools(self) -> List[ToolConfig]:
         """
@@ -229,10 +270,10 @@ class ProjectConfig(BaseModel):
         """
         try:
             # Agent에서 참조하는 Tool이 존재하는지 확인
-            tool_names = {tool.name for tool in self.tools}
+            tool_index = self._tools_by_name()
             for agent in self.agents:
                 for tool_name in agent.tools:
-                    if tool_name not in tool_names:
+                    if tool_name not in tool_index:
                         raise ValueError(
                             f"Agent '{agent.name}' references unknown tool '{tool_name}'"
                         )
@@ -240,15 +281,42 @@ class ProjectConfig(BaseModel):
         except Exception:
             return False
     
-    def to_yaml(self) -> str:
+    def to_yaml(self, exclude_defaults: bool = False) -> str:
         """
         YAML 문자열로 변환
         
+        Args:
+            exclude_defaults: True면 기본값과 같은 필드는 생략 (출력 축소)
+            
         Returns:
             YAML 문자열
         """
-        data = self.model_dump(mode='json')
-        return yaml.dump(data, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        return self._dump_yaml(exclude_defaults, encoding=None)
+    
+    def to_yaml_bytes(self, exclude_defaults: bool = False) -> bytes:
+        """
+        UTF-8 YAML 바이트로 변환 (파일 저장용, 중간 문자열 없이 libyaml이 바로 인코딩)
+        
+        Args:
+            exclude_defaults: True면 기본값과 같은 필드는 생략 (출력 축소)
+            
+        Returns:
+            UTF-8 인코딩된 YAML
+        """
+        return self._dump_yaml(exclude_defaults, encoding='utf-8')
+    
+    def _dump_yaml(self, exclude_defaults: bool, encoding: Optional[str]) -> Any:
+        """YAML 직렬화 (encoding이 있으면 bytes, 없으면 str)"""
+        # Enum 등은 SafeDumper가 표현할 수 없으므로 JSON 호환 값으로 덤프
+        data = self.model_dump(mode='json', exclude_defaults=exclude_defaults)
+        return yaml.dump(
+            data,
+            Dumper=_YamlDumper,
+            allow_unicode=True,
+            default_flow_style=False,
+            sort_keys=False,
+            encoding=encoding,
+        )
     
     @classmethod
     def from_yaml(cls, yaml_str: str) -> "ProjectConfig":
@@ -261,7 +329,7 @@ class ProjectConfig(BaseModel):
         Returns:
             ProjectConfig 인스턴스
         """
-        data = yaml.safe_load(yaml_str)
+        data = yaml.load(yaml_str, Loader=_YamlLoader)
         return cls.model_validate(data)
     
     @classmethod
@@ -276,3 +344,48 @@ class ProjectConfig(BaseModel):
             ProjectConfig 인스턴스
         """
         return cls.model_validate(data)
+    
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "ProjectConfig":
+        """
+        검증 없이 딕셔너리로부터 생성 (to_yaml/model_dump로 직접 만든 데이터 전용)
+        
+        pydantic 검증을 건너뛰고 model_construct로 중첩 모델까지 구성합니다.
+        외부에서 받은 데이터는 반드시 from_dict를 사용하세요.
+        
+        Args:
+            data: ProjectConfig.model_dump(mode='json') 형태의 설정 딕셔너리
+            
+        Returns:
+            ProjectConfig 인스턴스
+        """
+        fields = dict(data)
+        fields["metadata"] = ProjectMetadata.model_construct(**fields["metadata"])
+        if fields.get("default_llm") is not None:
+            fields["default_llm"] = _construct_llm_config(fields["default_llm"])
+        if "agents" in fields:
+            fields["agents"] = [_construct_agent_config(agent) for agent in fields["agents"]]
+        if "tools" in fields:
+            fields["tools"] = [ToolConfig.model_construct(**tool) for tool in fields["tools"]]
+        if fields.get("memory") is not None:
+            fields["memory"] = MemoryConfig.model_construct(**fields["memory"])
+        return cls.model_construct(**fields)
+
+
+def _construct_llm_config(data: Dict[str, Any]) -> LLMProviderConfig:
+    """검증 없이 LLMProviderConfig 생성 (Enum 변환만 수행)"""
+    fields = dict(data)
+    if "provider" in fields:
+        fields["provider"] = LLMProvider(fields["provider"])
+    return LLMProviderConfig.model_construct(**fields)
+
+
+def _construct_agent_config(data: Dict[str, Any]) -> AgentConfig:
+    """검증 없이 AgentConfig 생성 (Enum 변환과 중첩 LLM 설정만 처리)"""
+    fields = dict(data)
+    fields["agent_type"] = AgentType(fields["agent_type"])
+    if fields.get("name") is None:
+        fields["name"] = _DEFAULT_AGENT_NAMES[fields["agent_type"]]
+    if fields.get("llm") is not None:
+        fields["llm"] = _construct_llm_config(fields["llm"])
+    return AgentConfig.model_construct(**fields)
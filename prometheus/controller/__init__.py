@@ -8,34 +8,53 @@ PROMETHEUS의 핵심 컨트롤러 정의들을 포함합니다:
 - LifecycleManager: 생명주기 관리
 """
 
-from prometheus.controller.meta_agent import (
-    MetaAgent,
-    MetaAgentConfig,
-    ExecutionMode,
-    ProjectExecutionResult,
-    run_project,
-)
-from prometheus.controller.agent_factory import (
-    AgentFactory,
-    AgentFactoryError,
-    get_agent_factory,
-)
-from prometheus.controller.router import (
-    Router,
-    RouterConfig,
-    RouteDecision,
-    RoutingStrategy,
-    TaskType,
-)
-from prometheus.controller.lifecycle import (
-    LifecycleManager,
-    LifecycleConfig,
-    LifecycleEvent,
-    AgentState,
-    ProjectState,
-    StateTransition,
-)
+import importlib
 
+# =============================================================================
+# 지연 로딩 (PEP 562)
+# =============================================================================
+
+# 패키지 import 시 Agent/LLM 모듈을 모두 로드하지 않도록, 아래 이름은
+# 처음 접근할 때 해당 모듈을 로드합니다.
+_LAZY_EXPORTS = {
+    **dict.fromkeys(
+        ("MetaAgent", "MetaAgentConfig", "ExecutionMode", "ProjectExecutionResult", "run_project"),
+        "prometheus.controller.meta_agent",
+    ),
+    **dict.fromkeys(
+        ("AgentFactory", "AgentFactoryError", "get_agent_factory"),
+        "prometheus.controller.agent_factory",
+    ),
+    **dict.fromkeys(
+        ("Router", "RouterConfig", "RouteDecision", "RoutingStrategy", "TaskType"),
+        "prometheus.controller.router",
+    ),
+    **dict.fromkeys(
+        (
+            "LifecycleManager", "LifecycleConfig", "LifecycleEvent",
+            "AgentState", "ProjectState", "StateTransition",
+        ),
+        "prometheus.controller.lifecycle",
+    ),
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+# =============================================================================
+# Export
+# =============================================================================
 __all__ = [
     # MetaAgent
     "MetaAgent",
@@ -8,14 +8,14 @@ AgentFactory - Agent 생성 팩토리
 - 프로젝트 설정 기반 Agent 구성
 """
 
-from typing import Any, Dict, List, Optional, Type
-from prometheus.agents.base import BaseAgent, AgentConfig
-from prometheus.agents.planner_agent import PlannerAgent, PlannerConfig
-from prometheus.agents.executor_agent import ExecutorAgent, ExecutorConfig
-from prometheus.agents.writer_agent import WriterAgent, WriterConfig
-from prometheus.agents.qa_agent import QAAgent, QAConfig
-from prometheus.llm.base import BaseLLMClient
-from prometheus.llm.factory import LLMFactory
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type
+import importlib
+import threading
+import weakref
+
 from prometheus.config.project_schema import (
     ProjectConfig,
     AgentConfig as ProjectAgentConfig,
@@ -23,6 +23,33 @@ from prometheus.config.project_schema import (
     LLMProviderConfig,
 )
 
+if TYPE_CHECKING:
+    from prometheus.agents.base import BaseAgent, AgentConfig
+    from prometheus.llm.base import BaseLLMClient
+    from prometheus.llm.factory import LLMFactory
+
+
+# create_all_agents에서 동시에 생성할 최대 Agent 수
+_MAX_PARALLEL_AGENTS = 4
+
+# Agent 타입과 무관한 기본 Config 클래스
+_BASE_CONFIG_PATH = ("prometheus.agents.base", "AgentConfig")
+
+
+@lru_cache(maxsize=None)
+def _import_class(module_name: str, class_name: str) -> type:
+    """
+    클래스 import (처음 요청될 때 모듈 로드, 이후 캐시 재사용)
+    
+    Args:
+        module_name: 모듈 경로
+        class_name: 클래스 이름
+        
+    Returns:
+        클래스
+    """
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 class AgentFactoryError(Exception):
     """Agent Factory 오류"""
@@ -37,44 +64,67 @@ class AgentFactory:
     LLM과 Tool을 자동으로 바인딩합니다.
     """
     
-    # Agent 타입별 클래스 매핑
-    AGENT_TYPE_MAP: Dict[AgentType, Type[BaseAgent]] = {
-        AgentType.PLANNER: PlannerAgent,
-        AgentType.EXECUTOR: ExecutorAgent,
-        AgentType.WRITER: WriterAgent,
-        AgentType.QA: QAAgent,
+    # Agent 타입별 클래스 매핑 (모듈, 클래스 이름) - 사용하는 Agent 모듈만 로드
+    AGENT_TYPE_MAP: Dict[AgentType, Tuple[str, str]] = {
+        AgentType.PLANNER: ("prometheus.agents.planner_agent", "PlannerAgent"),
+        AgentType.EXECUTOR: ("prometheus.agents.executor_agent", "ExecutorAgent"),
+        AgentType.WRITER: ("prometheus.agents.writer_agent", "WriterAgent"),
+        AgentType.QA: ("prometheus.agents.qa_agent", "QAAgent"),
     }
     
-    # Agent 타입별 Config 클래스 매핑
-    CONFIG_TYPE_MAP: Dict[AgentType, Type[AgentConfig]] = {
-        AgentType.PLANNER: PlannerConfig,
-        AgentType.EXECUTOR: ExecutorConfig,
-        AgentType.WRITER: WriterConfig,
-        AgentType.QA: QAConfig,
+    # Agent 타입별 Config 클래스 매핑 (모듈, 클래스 이름)
+    CONFIG_TYPE_MAP: Dict[AgentType, Tuple[str, str]] = {
+        AgentType.PLANNER: ("prometheus.agents.planner_agent", "PlannerConfig"),
+        AgentType.EXECUTOR: ("prometheus.agents.executor_agent", "ExecutorConfig"),
+        AgentType.WRITER: ("prometheus.agents.writer_agent", "WriterConfig"),
+        AgentType.QA: ("prometheus.agents.qa_agent", "QAConfig"),
     }
     
     def __init__(
         self,
-        llm_factory: Optional[LLMFactory] = None,
+        llm_factory: Optional["LLMFactory"] = None,
+        cache_size: int = 128,
     ) -> None:
         """
         AgentFactory 초기화
         
         Args:
             llm_factory: LLM 팩토리 (None이면 새로 생성)
+            cache_size: 캐시할 최대 Agent 수 (초과 시 가장 오래 사용하지 않은 Agent 제거)
         """
-        self._llm_factory = llm_factory or LLMFactory()
+        if llm_factory is None:
+            from prometheus.llm.factory import LLMFactory
+            llm_factory = LLMFactory()
+        self._llm_factory = llm_factory
         self._tools_registry: Dict[str, Any] = {}
-        self._created_agents: Dict[str, BaseAgent] = {}
+        # Agent 타입 -> (Agent 클래스, Config 클래스), 매핑을 처음 사용할 때 해석
+        self._agent_classes: Dict[AgentType, Tuple[type, type]] = {}
+        # Tool 이름 튜플 -> 등록된 Tool 튜플 (Tool 등록 시 초기화)
+        self._tools_cache: Dict[Tuple[str, ...], Tuple[Any, ...]] = {}
+        # Tool 등록 시 증가 (이전 등록 상태로 만든 캐시 Agent 판별용)
+        self._tools_version = 0
+        self._cache_size = cache_size
+        # (project_id, agent_type 값) -> Agent, 최근 사용 순서 유지
+        self._created_agents: "OrderedDict[Tuple[str, str], BaseAgent]" = OrderedDict()
+        # 프로젝트 설정으로 만든 Agent의 생성 조건
+        # (설정 객체, LLM 바인딩, Tool 바인딩, Tool 등록 버전, 바인딩한 LLM 설정)
+        self._agent_sources: Dict[
+            Tuple[str, str],
+            Tuple[ProjectConfig, bool, bool, int, Optional[LLMProviderConfig]],
+        ] = {}
+        # project_id -> 캐시 키 (프로젝트 단위 캐시 삭제용)
+        self._keys_by_project: Dict[str, Set[Tuple[str, str]]] = {}
+        # Agent 캐시 보호 (create_all_agents 병렬 생성)
+        self._cache_lock = threading.RLock()
     
     def create_agent(
         self,
         agent_type: AgentType,
-        config: Optional[AgentConfig] = None,
-        llm: Optional[BaseLLMClient] = None,
+        config: Optional["AgentConfig"] = None,
+        llm: Optional["BaseLLMClient"] = None,
         tools: Optional[List[Any]] = None,
         project_id: Optional[str] = None,
-    ) -> BaseAgent:
+    ) -> "BaseAgent":
         """
         Agent 생성
         
@@ -88,14 +138,11 @@ class AgentFactory:
         Returns:
             생성된 Agent
         """
-        # Agent 클래스 조회
-        agent_class = self.AGENT_TYPE_MAP.get(agent_type)
-        if agent_class is None:
-            raise AgentFactoryError(f"Unknown agent type: {agent_type}")
+        # Agent/Config 클래스 조회
+        agent_class, config_class = self._get_agent_classes(agent_type)
         
-        # Config 클래스 조회 및 생성
+        # Config 생성
         if config is None:
-            config_class = self.CONFIG_TYPE_MAP.get(agent_type, AgentConfig)
             config = config_class()
         
         # Agent 생성
@@ -111,8 +158,7 @@ class AgentFactory:
         
         # 캐싱
         if project_id:
-            cache_key = f"{project_id}_{agent_type.value}"
-            self._created_agents[cache_key] = agent
+            self._cache_agent((project_id, agent_type.value), agent)
         
         return agent
     
@@ -122,7 +168,8 @@ class AgentFactory:
         agent_type: AgentType,
         auto_bind_llm: bool = True,
         auto_bind_tools: bool = True,
-    ) -> BaseAgent:
+        llm_config: Optional[LLMProviderConfig] = None,
+    ) -> "BaseAgent":
         """
         프로젝트 설정으로부터 Agent 생성
         
@@ -131,15 +178,36 @@ class AgentFactory:
             agent_type: Agent 타입
             auto_bind_llm: 자동 LLM 바인딩 여부
             auto_bind_tools: 자동 Tool 바인딩 여부
+            llm_config: 미리 결정한 LLM 설정 (None이면 Agent 설정 또는 프로젝트 기본값)
             
         Returns:
-            생성된 Agent
+            생성된 Agent (같은 설정/옵션으로 이미 만든 Agent가 있으면 재사용)
         """
         # Agent 설정 조회
         agent_config = project_config.get_agent_config(agent_type)
+        if auto_bind_llm:
+            if llm_config is None:
+                llm_config = _resolve_llm_config(project_config, agent_config)
+        else:
+            llm_config = None
+        
+        # 같은 프로젝트 설정 객체와 옵션, Tool 등록 상태, LLM 설정으로 만든 Agent가 캐시에 있으면 재사용
+        cache_key = (project_config.metadata.name, agent_type.value)
+        source = (project_config, auto_bind_llm, auto_bind_tools, self._tools_version, llm_config)
+        with self._cache_lock:
+            cached = self._created_agents.get(cache_key)
+            cached_source = self._agent_sources.get(cache_key)
+            if (
+                cached is not None
+                and cached_source is not None
+                and cached_source[0] is project_config
+                and cached_source[1:] == source[1:]
+            ):
+                self._created_agents.move_to_end(cache_key)
+                return cached
         
         # Agent Config 생성
-        config_class = self.CONFIG_TYPE_MAP.get(agent_type, AgentConfig)
+        _, config_class = self._get_agent_classes(agent_type)
         config_kwargs = {"name": f"{agent_type.value.capitalize()}Agent"}
         
         if agent_config:
@@ -161,7 +229,6 @@ class AgentFactory:
         
         # LLM 바인딩
         if auto_bind_llm:
-            llm_config = agent_config.llm if agent_config and agent_config.llm else project_config.default_llm
             llm = self._llm_factory.create_from_config(
                 llm_config,
                 cache_key=f"{project_config.metadata.name}_{agent_type.value}_llm",
@@ -174,6 +241,10 @@ class AgentFactory:
             if tools:
                 agent.bind_tools(tools)
         
+        with self._cache_lock:
+            # 생성 중 다른 호출이 같은 키를 덮어쓰지 않았을 때만 생성 조건 기록
+            if self._created_agents.get(cache_key) is agent:
+                self._agent_sources[cache_key] = source
         return agent
     
     def create_all_agents(
@@ -181,7 +252,8 @@ class AgentFactory:
         project_config: ProjectConfig,
         auto_bind_llm: bool = True,
         auto_bind_tools: bool = True,
-    ) -> Dict[AgentType, BaseAgent]:
+        parallel: bool = True,
+    ) -> Dict[AgentType, "BaseAgent"]:
         """
         프로젝트의 모든 Agent 생성
         
@@ -189,22 +261,32 @@ class AgentFactory:
             project_config: 프로젝트 설정
             auto_bind_llm: 자동 LLM 바인딩 여부
             auto_bind_tools: 자동 Tool 바인딩 여부
+            parallel: True면 여러 스레드에서 동시에 생성 (LLM 클라이언트 초기화 등 I/O 중첩)
             
         Returns:
-            {AgentType: Agent} 딕셔너리
+            {AgentType: Agent} 딕셔너리 (프로젝트 설정의 Agent 순서 유지)
         """
-        agents = {}
-        
-        for agent_config in project_config.agents:
-            agent = self.create_from_project_config(
+        def create(agent_config: ProjectAgentConfig) -> "BaseAgent":
+            return self.create_from_project_config(
                 project_config=project_config,
                 agent_type=agent_config.agent_type,
                 auto_bind_llm=auto_bind_llm,
                 auto_bind_tools=auto_bind_tools,
+                llm_config=_resolve_llm_config(project_config, agent_config) if auto_bind_llm else None,
             )
-            agents[agent_config.agent_type] = agent
         
-        return agents
+        agent_configs = project_config.agents
+        if parallel and len(agent_configs) > 1:
+            max_workers = min(_MAX_PARALLEL_AGENTS, len(agent_configs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                created = list(executor.map(create, agent_configs))
+        else:
+            created = [create(agent_config) for agent_config in agent_configs]
+        
+        return {
+            agent_config.agent_type: agent
+            for agent_config, agent in zip(agent_configs, created)
+        }
     
     def register_tool(
         self,
@@ -218,7 +300,10 @@ class AgentFactory:
             name: Tool 이름
             tool: Tool 인스턴스
         """
-        self._tools_registry[name] = tool
+        with self._cache_lock:
+            self._tools_registry[name] = tool
+            self._tools_cache.clear()
+            self._tools_version += 1
     
     def register_tools(
         self,
@@ -230,7 +315,10 @@ class AgentFactory:
         Args:
             tools: {이름: Tool} 딕셔너리
         """
-        self._tools_registry.update(tools)
+        with self._cache_lock:
+            self._tools_registry.update(tools)
+            self._tools_cache.clear()
+            self._tools_version += 1
     
     def get_tool(
         self,
@@ -260,7 +348,7 @@ class AgentFactory:
         self,
         project_id: str,
         agent_type: AgentType,
-    ) -> Optional[BaseAgent]:
+    ) -> Optional["BaseAgent"]:
         """
         캐시된 Agent 조회
         
@@ -271,8 +359,12 @@ class AgentFactory:
         Returns:
             Agent 또는 None
         """
-        cache_key = f"{project_id}_{agent_type.value}"
-        return self._created_agents.get(cache_key)
+        cache_key = (project_id, agent_type.value)
+        with self._cache_lock:
+            agent = self._created_agents.get(cache_key)
+            if agent is not None:
+                self._created_agents.move_to_end(cache_key)
+        return agent
     
     def clear_cache(
         self,
@@ -284,15 +376,67 @@ class AgentFactory:
         Args:
             project_id: 프로젝트 ID (None이면 전체)
         """
-        if project_id:
-            keys_to_remove = [
-                k for k in self._created_agents.keys()
-                if k.startswith(f"{project_id}_")
-            ]
-            for key in keys_to_remove:
-                del self._created_agents[key]
-        else:
-            self._created_agents.clear()
+        with self._cache_lock:
+            if project_id:
+                for key in self._keys_by_project.pop(project_id, ()):
+                    del self._created_agents[key]
+                    self._agent_sources.pop(key, None)
+            else:
+                self._created_agents.clear()
+                self._agent_sources.clear()
+                self._keys_by_project.clear()
+    
+    def _cache_agent(
+        self,
+        cache_key: Tuple[str, str],
+        agent: "BaseAgent",
+    ) -> None:
+        """
+        Agent 캐시 저장 (크기 초과 시 가장 오래 사용하지 않은 Agent 제거)
+        
+        Args:
+            cache_key: (project_id, agent_type 값)
+            agent: Agent
+        """
+        with self._cache_lock:
+            # 새로 만든 Agent는 이전 생성 조건과 무관하므로 기록 제거
+            self._agent_sources.pop(cache_key, None)
+            self._created_agents.pop(cache_key, None)
+            self._created_agents[cache_key] = agent
+            self._keys_by_project.setdefault(cache_key[0], set()).add(cache_key)
+            while len(self._created_agents) > self._cache_size:
+                evicted, _ = self._created_agents.popitem(last=False)
+                self._agent_sources.pop(evicted, None)
+                project_keys = self._keys_by_project[evicted[0]]
+                project_keys.discard(evicted)
+                if not project_keys:
+                    del self._keys_by_project[evicted[0]]
+    
+    def _get_agent_classes(
+        self,
+        agent_type: AgentType,
+    ) -> Tuple[Type["BaseAgent"], Type["AgentConfig"]]:
+        """
+        Agent 타입별 (Agent 클래스, Config 클래스) 조회 (처음 한 번만 매핑 해석)
+        
+        Args:
+            agent_type: Agent 타입
+            
+        Returns:
+            (Agent 클래스, Config 클래스) - Config 매핑이 없으면 기본 AgentConfig
+            
+        Raises:
+            AgentFactoryError: 알 수 없는 Agent 타입
+        """
+        classes = self._agent_classes.get(agent_type)
+        if classes is None:
+            agent_class_path = self.AGENT_TYPE_MAP.get(agent_type)
+            if agent_class_path is None:
+                raise AgentFactoryError(f"Unknown agent type: {agent_type}")
+            config_class_path = self.CONFIG_TYPE_MAP.get(agent_type, _BASE_CONFIG_PATH)
+            classes = (_import_class(*agent_class_path), _import_class(*config_class_path))
+            self._agent_classes[agent_type] = classes
+        return classes
     
     def _get_tools_for_agent(
         self,
@@ -305,28 +449,80 @@ class AgentFactory:
             tool_names: Tool 이름 목록
             
         Returns:
-            Tool 인스턴스 목록
+            Tool 인스턴스 목록 (호출마다 새 리스트)
         """
-        tools = []
-        for name in tool_names:
-            tool = self._tools_registry.get(name)
-            if tool:
-                tools.append(tool)
-        return tools
+        key = tuple(tool_names)
+        tools = self._tools_cache.get(key)
+        if tools is None:
+            registry = self._tools_registry
+            tools = tuple(tool for tool in map(registry.get, key) if tool)
+            self._tools_cache[key] = tools
+        return list(tools)
+
+
+# 값이 같은 LLM 설정은 하나의 인스턴스로 공유 (설정 모델은 frozen이므로 안전)
+_interned_llm_configs: "weakref.WeakValueDictionary[Tuple[Any, ...], LLMProviderConfig]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _intern_llm_config(llm_config: LLMProviderConfig) -> LLMProviderConfig:
+    """
+    동일한 값의 LLM 설정 인스턴스 반환 (처음 보는 값이면 그대로 등록)
+    
+    Args:
+        llm_config: LLM 설정
+        
+    Returns:
+        공유 LLM 설정
+    """
+    key = (
+        llm_config.provider,
+        llm_config.model,
+        llm_config.temperature,
+        llm_config.max_tokens,
+        llm_config.api_key_env,
+    )
+    return _interned_llm_configs.setdefault(key, llm_config)
+
+
+def _resolve_llm_config(
+    project_config: ProjectConfig,
+    agent_config: Optional[ProjectAgentConfig],
+) -> LLMProviderConfig:
+    """
+    Agent에 적용할 LLM 설정 결정 (Agent 설정 우선, 없으면 프로젝트 기본값)
+    
+    Args:
+        project_config: 프로젝트 설정
+        agent_config: 프로젝트의 Agent 설정
+        
+    Returns:
+        공유 LLM 설정
+    """
+    if agent_config is not None and agent_config.llm is not None:
+        return _intern_llm_config(agent_config.llm)
+    return _intern_llm_config(project_config.default_llm)
 
 
 # 전역 팩토리 인스턴스
 _default_factory: Optional[AgentFactory] = None
+_default_factory_lock = threading.Lock()
 
 
 def get_agent_factory() -> AgentFactory:
     """
-    기본 AgentFactory 인스턴스 획득
+    기본 AgentFactory 인스턴스 획득 (여러 스레드에서 호출해도 하나만 생성)
     
     Returns:
         AgentFactory 인스턴스
     """
     global _default_factory
-    if _default_factory is None:
-        _default_factory = AgentFactory()
-    return _default_factory
+    factory = _default_factory
+    if factory is None:
+        # 이중 확인 잠금 - 생성 이후 호출은 잠금 없이 반환
+        with _default_factory_lock:
+            if _default_factory is None:
+                _default_factory = AgentFactory()
+            factory = _default_factory
+    return factory
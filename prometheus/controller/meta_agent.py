@@ -21,7 +21,7 @@ from prometheus.controller.lifecycle import LifecycleManager, AgentState, Projec
 from prometheus.config.project_schema import ProjectConfig, AgentType
 from prometheus.config.loader import ConfigLoader
 from prometheus.agents.base import BaseAgent, AgentInput, AgentOutput
-from prometheus.agents.planner_agent import ExecutionPlan, TaskStatus
+from prometheus.agents.planner_agent import ExecutionPlan, PlanStep, TaskStatus
 from prometheus.llm.base import BaseLLMClient
 
 
@@ -217,37 +217,34 @@ class MetaAgent:
         accumulated_context = dict(context)
         accumulated_context["plan"] = plan.model_dump()
         
+        # Agent 인스턴스는 실행 중 메시지/Tool 호출 이력을 공유하므로
+        # 같은 Agent를 사용하는 단계는 순차 실행
+        agent_locks: Dict[int, asyncio.Lock] = {}
+        
         iteration = 0
         while not plan.is_completed() and iteration < self.config.max_iterations:
-            step = plan.get_next_step()
-            if step is None:
-                break
-            
-            # Agent 선택
-            target_agent = agents.get(AgentType(step.agent_type))
-            if target_agent is None:
-                target_agent = executor
-            
-            # 단계 실행
-            step_input = AgentInput(
-                task=step.description,
-                context={
-                    "step": step.model_dump(),
-                    "previous_results": accumulated_context,
-                },
+            # 의존성이 충족된 단계들을 동시에 실행
+            ready_steps = plan.get_all_ready_steps(
+                limit=self.config.max_iterations - iteration,
             )
+            if not ready_steps:
+                break
             
-            step_output = await target_agent.run(step_input)
-            step_results.append(step_output)
+            step_outputs = await asyncio.gather(*[
+                self._run_plan_step(step, agents, executor, accumulated_context, agent_locks)
+                for step in ready_steps
+            ])
             
             # 상태 업데이트
-            if step_output.success:
-                plan.update_step_status(step.step_id, TaskStatus.COMPLETED)
-                accumulated_context[step.step_id] = step_output.result
-            else:
-                plan.update_step_status(step.step_id, TaskStatus.FAILED)
+            for step, step_output in zip(ready_steps, step_outputs):
+                step_results.append(step_output)
+                if step_output.success:
+                    plan.update_step_status(step.step_id, TaskStatus.COMPLETED)
+                    accumulated_context[step.step_id] = step_output.result
+                else:
+                    plan.update_step_status(step.step_id, TaskStatus.FAILED)
             
-            iteration += 1
+            iteration += len(ready_steps)
         
         # 3. 문서 작성 (Writer)
         final_document = None
@@ -291,6 +288,44 @@ class MetaAgent:
             quality_report=quality_report,
         )
     
+    async def _run_plan_step(
+        self,
+        step: PlanStep,
+        agents: Dict[AgentType, BaseAgent],
+        executor: Optional[BaseAgent],
+        accumulated_context: Dict[str, Any],
+        agent_locks: Dict[int, asyncio.Lock],
+    ) -> AgentOutput:
+        """
+        계획 단계 하나 실행
+        
+        Args:
+            step: 실행할 단계
+            agents: Agent 딕셔너리
+            executor: 기본 Executor Agent
+            accumulated_context: 이전 단계 결과
+            agent_locks: Agent 인스턴스별 실행 잠금
+            
+        Returns:
+            단계 실행 결과
+        """
+        # Agent 선택
+        target_agent = agents.get(AgentType(step.agent_type))
+        if target_agent is None:
+            target_agent = executor
+        
+        step_input = AgentInput(
+            task=step.description,
+            context={
+                "step": step.model_dump(),
+                "previous_results": accumulated_context,
+            },
+        )
+        
+        lock = agent_locks.setdefault(id(target_agent), asyncio.Lock())
+        async with lock:
+            return await target_agent.run(step_input)
+    
     async def _execute_sequential(
         self,
         request: str,
@@ -31,6 +31,7 @@ class AnthropicConfig(LLMConfig):
     model: str = "claude-3-opus-20240229"
     max_tokens: int = 4096
     base_url: Optional[str] = None
+    prompt_caching: bool = True  # system prompt에 cache_control 지정
 
 
 class AnthropicClient(BaseLLMClient):
@@ -135,7 +136,7 @@ class AnthropicClient(BaseLLMClient):
         
         # system prompt 설정
         if system_prompt:
-            params["system"] = system_prompt
+            params["system"] = self._format_system(system_prompt)
         
         # tools 처리
         tools = kwargs.get("tools")
@@ -180,7 +181,7 @@ class AnthropicClient(BaseLLMClient):
         }
         
         if system_prompt:
-            params["system"] = system_prompt
+            params["system"] = self._format_system(system_prompt)
         
         try:
             async with client.messages.stream(**params) as stream:
@@ -292,6 +293,28 @@ class AnthropicClient(BaseLLMClient):
         
         return system_prompt, formatted
     
+    def _format_system(self, system_prompt: str) -> Any:
+        """
+        system 파라미터 생성
+        
+        프롬프트 캐싱이 켜져 있으면 고정된 system prompt를 캐시 가능한
+        content block으로 전달합니다. 요청마다 바뀌는 내용은 user 메시지에
+        두어야 캐시된 접두부가 재사용됩니다.
+        
+        Args:
+            system_prompt: system 메시지 내용
+            
+        Returns:
+            문자열 또는 content block 목록
+        """
+        if not getattr(self.config, "prompt_caching", False):
+            return system_prompt
+        return [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }]
+    
     def _format_tools(
         self,
         tools: List[Dict[str, Any]],
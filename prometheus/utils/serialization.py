@@ -0,0 +1,97 @@
+"""
+Serialization - JSON 직렬화 유틸리티
+
+이 파일의 책임:
+- 프롬프트에 삽입되는 컨텍스트/보고서의 JSON 직렬화
+- 반복되는 동일 데이터의 직렬화 결과 캐싱 (표준 json 사용 시)
+"""
+
+from functools import lru_cache
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+_DICT_MARK = "__dict__"
+_LIST_MARK = "__list__"
+_NUMBER_TYPES = (bool, int, float)
+
+
+def _freeze(value: Any) -> Any:
+    """
+    JSON 호환 데이터를 해시 가능한 형태로 변환 (키 순서 유지)
+
+    Raises:
+        TypeError: dict/list/tuple/str/숫자/None 이외의 값이 포함된 경우
+    """
+    if isinstance(value, dict):
+        return (_DICT_MARK, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (_LIST_MARK, tuple(_freeze(v) for v in value))
+    if value is None or value.__class__ is str:
+        return value
+    if value.__class__ in _NUMBER_TYPES:
+        # True == 1 == 1.0 처럼 같은 값으로 취급되는 스칼라를 구분하기 위해 타입을 함께 저장
+        return (value.__class__, value)
+    # 그 외 객체는 내용이 바뀔 수 있으므로 캐시하지 않음
+    raise TypeError(f"Uncacheable value type: {type(value).__name__}")
+
+
+def _thaw(value: Any) -> Any:
+    """_freeze의 역변환"""
+    if value.__class__ is tuple:
+        mark, payload = value
+        if mark == _DICT_MARK:
+            return {_thaw(k): _thaw(v) for k, v in payload}
+        if mark == _LIST_MARK:
+            return [_thaw(v) for v in payload]
+        return payload
+    return value
+
+
+def _encode(value: Any, indent: bool) -> str:
+    """JSON 문자열 생성 (orjson 우선)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(value, default=str, option=option).decode()
+        except TypeError:
+            # 64비트 범위를 넘는 정수 등은 표준 json으로 처리
+            pass
+    return json.dumps(value, ensure_ascii=False, indent=2 if indent else None, default=str)
+
+
+@lru_cache(maxsize=128)
+def _encode_frozen(frozen: Any, indent: bool) -> str:
+    """해시 가능한 형태의 데이터 직렬화 (캐시됨)"""
+    return _encode(_thaw(frozen), indent)
+
+
+def dumps_cached(value: Any, indent: bool = False) -> str:
+    """
+    JSON 직렬화 (동일 데이터 반복 시 캐시 재사용)
+
+    orjson이 있으면 캐시 키 생성(데이터 전체 순회)보다 직렬화가 빠르므로 바로 직렬화합니다.
+    표준 json을 쓸 때는 dict/list/문자열/숫자/None으로 구성된 데이터를 내용 기준으로
+    캐싱하고, 그 외 객체가 포함되면 캐시 없이 직렬화합니다 (str()로 변환).
+
+    Args:
+        value: 직렬화할 데이터
+        indent: True면 2칸 들여쓰기
+
+    Returns:
+        JSON 문자열 (ensure_ascii=False와 동일하게 유니코드 유지)
+    """
+    if orjson is not None:
+        return _encode(value, indent)
+    try:
+        frozen = _freeze(value)
+    except TypeError:
+        return _encode(value, indent)
+    return _encode_frozen(frozen, indent)
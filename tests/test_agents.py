@@ -44,6 +44,18 @@ class TestAgentImports:
         assert QAResult is not None
         assert QAIssue is not None
     
+    def test_lazy_domain_agent_import(self):
+        """SWMM/Visualization Agent는 처음 접근 시 로드"""
+        import prometheus.agents as agents
+        from prometheus.agents import SWMMAgent, VisualizationOutput, create_visualization_agent
+        from prometheus.agents.swmm import SWMMAgent as ModuleSWMMAgent
+        assert SWMMAgent is ModuleSWMMAgent
+        assert VisualizationOutput is not None
+        assert callable(create_visualization_agent)
+        assert "SWMMAgent" in dir(agents)
+        with pytest.raises(AttributeError):
+            agents.UnknownAgent
+    
     def test_factory_functions_import(self):
         """팩토리 함수 import"""
         from prometheus.agents import (
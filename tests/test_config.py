@@ -60,6 +60,15 @@ class TestProjectMetadata:
         for name in valid_names:
             metadata = ProjectMetadata(name=name)
             assert metadata.name == name
+    
+    def test_name_stripped_before_format_check(self) -> None:
+        """앞뒤 공백은 제거 후 형식 검증, 중간 공백은 오류"""
+        assert ProjectMetadata(name="  flood_2024 ").name == "flood_2024"
+        
+        with pytest.raises(ValueError, match="cannot be empty"):
+            ProjectMetadata(name="   ")
+        with pytest.raises(ValueError, match="must start with a letter"):
+            ProjectMetadata(name="flood 2024")
 
 
 class TestLLMProviderConfig:
@@ -81,6 +90,16 @@ class TestLLMProviderConfig:
         with pytest.raises(ValueError):
             LLMProviderConfig(temperature=3.0)
     
+    def test_model_and_tool_name_stripped(self) -> None:
+        """model/Tool 이름은 공백 제거 후 비어 있으면 오류"""
+        assert LLMProviderConfig(model="  gpt-4o  ").model == "gpt-4o"
+        assert ToolConfig(name=" python_exec ").name == "python_exec"
+        
+        with pytest.raises(ValueError):
+            LLMProviderConfig(model="   ")
+        with pytest.raises(ValueError):
+            ToolConfig(name="")
+    
     def test_different_providers(self) -> None:
         """다양한 프로바이더 설정"""
         for provider in LLMProvider:
@@ -101,6 +120,18 @@ class TestAgentConfig:
         config = AgentConfig(agent_type=AgentType.EXECUTOR, name="MyExecutor")
         assert config.name == "MyExecutor"
     
+    def test_auto_name_all_types(self) -> None:
+        """모든 유형의 기본 이름 (검증 없는 생성 경로 포함)"""
+        for agent_type in AgentType:
+            expected = f"{agent_type.value.capitalize()}Agent"
+            assert AgentConfig(agent_type=agent_type).name == expected
+            assert AgentConfig.model_validate({"agent_type": agent_type.value}).name == expected
+        
+        trusted = ProjectConfig.from_trusted_dict(
+            {"metadata": {"name": "p"}, "agents": [{"agent_type": "qa"}]}
+        )
+        assert trusted.agents[0].name == "QaAgent"
+    
     def test_with_tools(self) -> None:
         """Tool 설정"""
         config = AgentConfig(
@@ -185,6 +216,52 @@ class TestProjectConfig:
         unknown_tool = config.get_tool_config("unknown")
         assert unknown_tool is None
     
+    def test_lookup_index_duplicate_tool_names(self) -> None:
+        """같은 이름의 Tool은 먼저 나온 설정 조회"""
+        config = ProjectConfig(
+            metadata=ProjectMetadata(name="test"),
+            tools=[ToolConfig(name="dup"), ToolConfig(name="dup", enabled=False)],
+        )
+        
+        assert config.get_tool_config("dup").enabled is True
+        assert "_tool_index" not in config.model_dump()
+    
+    def test_config_is_frozen(self) -> None:
+        """로드된 설정은 변경 불가 (조회 인덱스가 어긋나지 않도록)"""
+        from pydantic import ValidationError
+        
+        config = ProjectConfig(
+            metadata=ProjectMetadata(name="test"),
+            agents=[AgentConfig(agent_type=AgentType.QA)],
+        )
+        
+        with pytest.raises(ValidationError):
+            config.agents = []
+        with pytest.raises(ValidationError):
+            config.agents[0].name = "Other"
+        assert config.agents[0].name == "QaAgent"
+    
+    def test_lookup_index_follows_model_copy(self) -> None:
+        """model_copy(update=...) / 목록 직접 추가 후에도 조회 인덱스가 최신 상태"""
+        config = ProjectConfig(
+            metadata=ProjectMetadata(name="test"),
+            agents=[AgentConfig(agent_type=AgentType.PLANNER)],
+        )
+        assert config.get_agent_config(AgentType.PLANNER) is not None
+        
+        copied = config.model_copy(update={
+            "agents": [AgentConfig(agent_type=AgentType.EXECUTOR, tools=["python_exec"])],
+            "tools": [ToolConfig(name="python_exec")],
+        })
+        assert copied.get_agent_config(AgentType.PLANNER) is None
+        assert copied.get_agent_config(AgentType.EXECUTOR) is not None
+        assert copied.get_tool_config("python_exec") is not None
+        assert copied.validate_all() is True
+        assert config.get_agent_config(AgentType.PLANNER) is not None
+        
+        config.agents.append(AgentConfig(agent_type=AgentType.QA))
+        assert config.get_agent_config(AgentType.QA) is config.agents[-1]
+    
     def test_yaml_serialization(self) -> None:
         """YAML 직렬화/역직렬화"""
         original = ProjectConfig(
@@ -197,6 +274,56 @@ class TestProjectConfig:
         
         assert restored.metadata.name == original.metadata.name
         assert len(restored.agents) == len(original.agents)
+    
+    def test_to_yaml_bytes_and_exclude_defaults(self) -> None:
+        """바이트 출력은 문자열 출력의 UTF-8, 기본값 생략 출력도 같은 설정으로 복원"""
+        original = ProjectConfig(
+            metadata=ProjectMetadata(name="yaml_test", description="침수 분석"),
+            agents=[AgentConfig(agent_type=AgentType.QA)],
+        )
+        
+        assert original.to_yaml_bytes() == original.to_yaml().encode("utf-8")
+        
+        compact = original.to_yaml(exclude_defaults=True)
+        assert "memory" not in compact and "version" not in compact
+        assert ProjectConfig.from_yaml(compact) == original
+    
+    def test_from_trusted_dict_matches_validated(self) -> None:
+        """직접 만든 데이터는 검증 없이 생성해도 from_dict와 동일"""
+        original = ProjectConfig(
+            metadata=ProjectMetadata(name="trusted", tags=["a"]),
+            default_llm=LLMProviderConfig(provider=LLMProvider.ANTHROPIC, model="claude"),
+            agents=[
+                AgentConfig(agent_type=AgentType.PLANNER),
+                AgentConfig(
+                    agent_type=AgentType.EXECUTOR,
+                    llm=LLMProviderConfig(provider=LLMProvider.GEMINI, model="gemini"),
+                    tools=["python_exec"],
+                ),
+            ],
+            tools=[ToolConfig(name="python_exec")],
+            settings={"k": 1},
+        )
+        data = original.model_dump(mode="json")
+        
+        trusted = ProjectConfig.from_trusted_dict(data)
+        
+        assert trusted == ProjectConfig.from_dict(data) == original
+        assert trusted.get_agent_config(AgentType.EXECUTOR).llm.provider is LLMProvider.GEMINI
+        assert trusted.get_tool_config("python_exec") is trusted.tools[0]
+    
+    def test_yaml_round_trip_unicode(self) -> None:
+        """한글 값과 필드 순서를 유지한 채 YAML 왕복"""
+        original = ProjectConfig(
+            metadata=ProjectMetadata(name="yaml_test", description="강우 유출 분석"),
+            tools=[ToolConfig(name="python_exec", config={"timeout": 30})],
+        )
+        
+        yaml_str = original.to_yaml()
+        
+        assert "강우 유출 분석" in yaml_str
+        assert yaml_str.startswith("metadata:")
+        assert ProjectConfig.from_yaml(yaml_str) == original
 
 
 class TestConfigLoader:
@@ -255,6 +382,103 @@ tools:
         projects = loader.list_projects()
         assert "sample_project" in projects
     
+    def test_find_project_config(self, tmp_path: Path) -> None:
+        """project.yaml 우선, 없으면 project.yml, 디렉토리/누락은 None"""
+        find = ConfigLoader._find_project_config
+        (tmp_path / "both").mkdir()
+        (tmp_path / "both" / "project.yml").write_text("a: 1")
+        (tmp_path / "both" / "project.yaml").write_text("a: 1")
+        (tmp_path / "yml").mkdir()
+        (tmp_path / "yml" / "project.yml").write_text("a: 1")
+        (tmp_path / "dir").mkdir()
+        (tmp_path / "dir" / "project.yaml").mkdir()
+        
+        assert find(tmp_path / "both") == tmp_path / "both" / "project.yaml"
+        assert find(tmp_path / "yml") == tmp_path / "yml" / "project.yml"
+        assert find(tmp_path / "dir") is None
+        assert find(tmp_path / "missing") is None
+    
+    def test_load_project_cache_follows_mtime(self, temp_project_dir: Path) -> None:
+        """설정 파일이 바뀌면 캐시 대신 다시 로드"""
+        loader = ConfigLoader(
+            config=LoaderConfig(projects_dir=str(temp_project_dir)),
+            auto_load_env=False,
+        )
+        config_file = temp_project_dir / "sample_project" / "project.yaml"
+        
+        first = loader.load_project("sample_project")
+        assert loader.load_project("sample_project") is first
+        
+        config_file.write_text(config_file.read_text().replace("Test project", "Edited"))
+        os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+        
+        reloaded = loader.load_project("sample_project")
+        assert reloaded is not first
+        assert reloaded.metadata.description == "Edited"
+    
+    def test_load_project_cache_key_is_normalized(self, temp_project_dir: Path) -> None:
+        """이름과 경로 표기가 달라도 같은 프로젝트면 캐시 공유"""
+        loader = ConfigLoader(
+            config=LoaderConfig(projects_dir=str(temp_project_dir)),
+            auto_load_env=False,
+        )
+        
+        first = loader.load_project("sample_project")
+        dotted = temp_project_dir / "sample_project" / ".." / "sample_project"
+        
+        assert loader.load_project(str(dotted)) is first
+    
+    def test_load_project_cache_is_bounded(self, temp_project_dir: Path) -> None:
+        """캐시 크기를 넘으면 가장 오래 사용하지 않은 프로젝트 제거"""
+        loader = ConfigLoader(
+            config=LoaderConfig(projects_dir=str(temp_project_dir), cache_size=1),
+            auto_load_env=False,
+        )
+        loader.create_project("other_project")
+        
+        loader.load_project("sample_project")
+        loader.load_project("other_project")
+        
+        assert len(loader._loaded_projects) == 1
+        assert next(iter(loader._loaded_projects)).endswith("other_project")
+    
+    def test_load_yaml_utf8(self, tmp_path: Path) -> None:
+        """UTF-8 YAML 로드 (빈 파일은 빈 dict)"""
+        loader = ConfigLoader(auto_load_env=False)
+        (tmp_path / "a.yaml").write_bytes("설명: 한글 값\n".encode("utf-8"))
+        (tmp_path / "empty.yaml").write_bytes(b"")
+        
+        assert loader.load_yaml(str(tmp_path / "a.yaml")) == {"설명": "한글 값"}
+        assert loader.load_yaml(str(tmp_path / "empty.yaml")) == {}
+    
+    def test_load_json(self, tmp_path: Path) -> None:
+        """JSON 로드 (파싱 실패는 ConfigLoadError)"""
+        loader = ConfigLoader(auto_load_env=False)
+        (tmp_path / "a.json").write_bytes('{"이름": [1, 2.5, null]}'.encode("utf-8"))
+        (tmp_path / "bad.json").write_text("{not json")
+        
+        assert loader.load_json(str(tmp_path / "a.json")) == {"이름": [1, 2.5, None]}
+        with pytest.raises(ConfigLoadError, match="Failed to parse JSON"):
+            loader.load_json(str(tmp_path / "bad.json"))
+    
+    def test_list_projects_skips_non_projects(self, temp_project_dir: Path) -> None:
+        """설정 파일 없는 디렉토리와 파일은 제외하고, 디렉토리가 없으면 빈 목록"""
+        (temp_project_dir / "empty_dir").mkdir()
+        (temp_project_dir / "yml_project").mkdir()
+        (temp_project_dir / "yml_project" / "project.yml").write_text("metadata:\n  name: yml_project\n")
+        (temp_project_dir / "notes.txt").write_text("x")
+        loader = ConfigLoader(
+            config=LoaderConfig(projects_dir=str(temp_project_dir)),
+            auto_load_env=False,
+        )
+        missing = ConfigLoader(
+            config=LoaderConfig(projects_dir=str(temp_project_dir / "missing")),
+            auto_load_env=False,
+        )
+        
+        assert loader.list_projects() == ["sample_project", "yml_project"]
+        assert missing.list_projects() == []
+    
     def test_project_exists(self, temp_project_dir: Path) -> None:
         """프로젝트 존재 여부 확인"""
         loader = ConfigLoader(
@@ -275,6 +499,22 @@ tools:
         with pytest.raises(ConfigLoadError):
             loader.load_project("nonexistent")
     
+    def test_load_project_invalid_yaml_keeps_cause(self, tmp_path: Path) -> None:
+        """YAML 파싱 오류는 ConfigLoadError로 감싸되 원인 예외 유지"""
+        import yaml
+        
+        (tmp_path / "bad").mkdir()
+        (tmp_path / "bad" / "project.yaml").write_text("metadata: [unclosed\n")
+        loader = ConfigLoader(
+            config=LoaderConfig(projects_dir=str(tmp_path)),
+            auto_load_env=False,
+        )
+        
+        with pytest.raises(ConfigLoadError, match="Failed to parse YAML file") as exc_info:
+            loader.load_project("bad")
+        
+        assert isinstance(exc_info.value.__cause__.__cause__, yaml.YAMLError)
+    
     def test_merge_configs(self) -> None:
         """설정 병합 테스트"""
         loader = ConfigLoader(auto_load_env=False)
@@ -296,6 +536,40 @@ tools:
         assert merged["settings"]["b"] == 3
         assert merged["settings"]["c"] == 4
     
+    def test_merge_configs_deep_does_not_mutate(self) -> None:
+        """깊은 병합은 원본을 수정하지 않고, 오버라이드가 없는 하위 dict는 그대로 공유"""
+        loader = ConfigLoader(auto_load_env=False)
+        base = {"a": {"b": {"c": 1, "d": 2}}, "untouched": {"x": 1}, "scalar": {"y": 1}}
+        override = {"a": {"b": {"c": 10}}, "scalar": 5, "new": {"z": 1}}
+        
+        merged = loader.merge_configs(base, override)
+        
+        assert merged == {
+            "a": {"b": {"c": 10, "d": 2}},
+            "untouched": {"x": 1},
+            "scalar": 5,
+            "new": {"z": 1},
+        }
+        assert base["a"]["b"] == {"c": 1, "d": 2}
+        assert merged["untouched"] is base["untouched"]
+    
+    def test_load_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """.env 로드 후 환경 변수의 읽기 전용 뷰 반환 (파일이 없어도 동작)"""
+        # 테스트 후 .env에서 들어온 값도 정리되도록 monkeypatch에 기록
+        monkeypatch.setenv("PROMETHEUS_DOTENV_VAR", "")
+        monkeypatch.delenv("PROMETHEUS_DOTENV_VAR")
+        (tmp_path / ".env").write_text("PROMETHEUS_DOTENV_VAR=from_file\n")
+        loader = ConfigLoader(auto_load_env=False)
+        
+        env = loader.load_env(str(tmp_path / ".env"))
+        monkeypatch.setenv("PROMETHEUS_DOTENV_LATER", "later")
+        
+        assert env["PROMETHEUS_DOTENV_VAR"] == "from_file"
+        assert env["PROMETHEUS_DOTENV_LATER"] == "later"
+        with pytest.raises(TypeError):
+            env["PROMETHEUS_DOTENV_VAR"] = "changed"
+        assert loader.load_env(str(tmp_path / "missing.env"))["PROMETHEUS_DOTENV_VAR"] == "from_file"
+    
     def test_env_var_substitution(self) -> None:
         """환경 변수 치환 테스트"""
         loader = ConfigLoader(auto_load_env=False)
@@ -316,6 +590,49 @@ tools:
         
         del os.environ["TEST_VAR"]
     
+    def test_env_var_substitution_keeps_unknown_refs(self) -> None:
+        """정의되지 않은 변수 참조와 참조 없는 값은 그대로 유지"""
+        loader = ConfigLoader(auto_load_env=False)
+        os.environ.pop("PROMETHEUS_UNSET_VAR", None)
+        
+        result = loader._substitute_env_vars({
+            "missing": "${PROMETHEUS_UNSET_VAR}/$PROMETHEUS_UNSET_VAR",
+            "plain": "no refs",
+            "items": [1, None, "$lower"],
+        })
+        
+        assert result == {
+            "missing": "${PROMETHEUS_UNSET_VAR}/$PROMETHEUS_UNSET_VAR",
+            "plain": "no refs",
+            "items": [1, None, "$lower"],
+        }
+    
+    def test_env_var_values_are_not_expanded_again(self) -> None:
+        """치환된 값 안의 변수 참조는 다시 치환하지 않음"""
+        loader = ConfigLoader(auto_load_env=False)
+        os.environ["PROMETHEUS_OUTER_VAR"] = "$PROMETHEUS_INNER_VAR"
+        os.environ["PROMETHEUS_INNER_VAR"] = "inner"
+        
+        try:
+            result = loader._substitute_env_vars("${PROMETHEUS_OUTER_VAR}-$PROMETHEUS_INNER_VAR")
+        finally:
+            del os.environ["PROMETHEUS_OUTER_VAR"]
+            del os.environ["PROMETHEUS_INNER_VAR"]
+        
+        assert result == "$PROMETHEUS_INNER_VAR-inner"
+    
+    def test_get_api_key_reads_current_env(self, monkeypatch) -> None:
+        """API 키는 호출 시점의 환경 변수에서 조회"""
+        loader = ConfigLoader(auto_load_env=False)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "first")
+        
+        assert loader.get_api_key("Anthropic") == "first"
+        
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "second")
+        
+        assert loader.get_api_key("anthropic") == "second"
+        assert loader.get_api_key("unknown") is None
+    
     def test_create_project(self, temp_project_dir: Path) -> None:
         """새 프로젝트 생성"""
         loader = ConfigLoader(
@@ -330,7 +647,15 @@ tools:
         
         assert project_path.exists()
         assert (project_path / "project.yaml").exists()
-        assert (project_path / "request.txt").exists()
+        assert (project_path / "request.txt").read_text(encoding="utf-8") == "Test request"
+        assert (project_path / "project.yaml").read_text(encoding="utf-8") == (
+            loader.load_project("new_project").to_yaml()
+        )
+        
+        config = loader.load_project("new_project")
+        assert [a.agent_type for a in config.agents] == [
+            AgentType.PLANNER, AgentType.EXECUTOR, AgentType.WRITER, AgentType.QA,
+        ]
     
     def test_create_existing_project(self, temp_project_dir: Path) -> None:
         """이미 존재하는 프로젝트 생성 시도"""
@@ -341,6 +666,39 @@ tools:
         
         with pytest.raises(ConfigLoadError):
             loader.create_project("sample_project")
+    
+    def test_created_project_is_cached(self, temp_project_dir: Path) -> None:
+        """생성한 프로젝트는 YAML을 다시 파싱하지 않고 캐시에서 로드"""
+        from unittest.mock import patch
+        
+        loader = ConfigLoader(
+            config=LoaderConfig(projects_dir=str(temp_project_dir)),
+            auto_load_env=False,
+        )
+        loader.create_project("new_project")
+        
+        with patch.object(ConfigLoader, "load_yaml") as load_yaml, \
+                patch.object(ProjectConfig, "validate_all") as validate_all:
+            config = loader.load_project("new_project")
+        
+        load_yaml.assert_not_called()
+        validate_all.assert_not_called()
+        assert config.metadata.name == "new_project"
+    
+    def test_created_custom_project_validated_on_load(self, temp_project_dir: Path) -> None:
+        """직접 넘긴 설정은 처음 로드할 때 한 번 검증"""
+        loader = ConfigLoader(
+            config=LoaderConfig(projects_dir=str(temp_project_dir)),
+            auto_load_env=False,
+        )
+        config = ProjectConfig(
+            metadata=ProjectMetadata(name="broken_project"),
+            agents=[AgentConfig(agent_type=AgentType.EXECUTOR, tools=["missing"])],
+        )
+        loader.create_project("broken_project", config=config)
+        
+        with pytest.raises(ConfigLoadError, match="validation failed"):
+            loader.load_project("broken_project")
 
 
 class TestValidation:
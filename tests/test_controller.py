@@ -108,6 +108,243 @@ class TestAgentFactory:
         
         assert agent.agent_type == "planner"
     
+    def test_create_from_project_config_reuses_cached_agent(self) -> None:
+        """같은 설정 객체/옵션이면 캐시된 Agent 재사용, 설정이나 옵션이 바뀌면 새로 생성"""
+        factory = AgentFactory()
+        project_config = ProjectConfig(
+            metadata=ProjectMetadata(name="test_project"),
+            agents=[ProjAgentConfig(agent_type=AgentType.PLANNER)],
+        )
+        
+        first = factory.create_from_project_config(
+            project_config, AgentType.PLANNER, auto_bind_llm=False,
+        )
+        
+        assert factory.create_from_project_config(
+            project_config, AgentType.PLANNER, auto_bind_llm=False,
+        ) is first
+        assert factory.create_all_agents(
+            project_config, auto_bind_llm=False,
+        ) == {AgentType.PLANNER: first}
+        assert factory.create_from_project_config(
+            project_config.model_copy(deep=True), AgentType.PLANNER, auto_bind_llm=False,
+        ) is not first
+        
+        factory.clear_cache("test_project")
+        assert factory.get_cached_agent("test_project", AgentType.PLANNER) is None
+    
+    def test_register_tool_invalidates_cached_agent(self) -> None:
+        """Tool을 새로 등록하면 캐시된 Agent 대신 Tool이 바인딩된 Agent 생성"""
+        factory = AgentFactory()
+        project_config = ProjectConfig(
+            metadata=ProjectMetadata(name="test_project"),
+            agents=[ProjAgentConfig(agent_type=AgentType.EXECUTOR, tools=["t"])],
+        )
+        
+        first = factory.create_from_project_config(
+            project_config, AgentType.EXECUTOR, auto_bind_llm=False,
+        )
+        assert "t" not in first.tools
+        
+        tool = MagicMock()
+        tool.name = "t"
+        factory.register_tool("t", tool)
+        second = factory.create_from_project_config(
+            project_config, AgentType.EXECUTOR, auto_bind_llm=False,
+        )
+        
+        assert second is not first
+        assert "t" in second.tools
+        assert factory.create_from_project_config(
+            project_config, AgentType.EXECUTOR, auto_bind_llm=False,
+        ) is second
+    
+    def test_agent_cache_is_bounded(self) -> None:
+        """캐시 크기를 넘으면 가장 오래 사용하지 않은 Agent 제거"""
+        factory = AgentFactory(cache_size=2)
+        
+        planner = factory.create_agent(AgentType.PLANNER, project_id="p")
+        factory.create_agent(AgentType.QA, project_id="p")
+        assert factory.get_cached_agent("p", AgentType.PLANNER) is planner
+        factory.create_agent(AgentType.WRITER, project_id="p")
+        
+        assert factory.get_cached_agent("p", AgentType.QA) is None
+        assert factory.get_cached_agent("p", AgentType.PLANNER) is planner
+    
+    def test_import_does_not_load_agent_modules(self, project_root) -> None:
+        """agent_factory import 시 Agent/LLM 모듈은 Agent 생성 전까지 로드하지 않음"""
+        import subprocess
+        import sys
+        
+        code = (
+            "import sys, prometheus.controller.agent_factory; "
+            "print(any(m.startswith(('prometheus.agents', 'prometheus.llm')) for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(project_root),
+            capture_output=True,
+            text=True,
+        )
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False"
+    
+    def test_clear_cache_only_matching_project(self) -> None:
+        """프로젝트 단위 캐시 삭제는 이름이 접두어로 겹치는 다른 프로젝트에 영향 없음"""
+        factory = AgentFactory(cache_size=3)
+        factory.create_agent(AgentType.PLANNER, project_id="flood")
+        kept = factory.create_agent(AgentType.PLANNER, project_id="flood_2024")
+        factory.create_agent(AgentType.QA, project_id="flood")
+        factory.create_agent(AgentType.WRITER, project_id="flood")  # PLANNER(flood) 제거
+        
+        factory.clear_cache("flood")
+        
+        assert factory.get_cached_agent("flood", AgentType.QA) is None
+        assert factory.get_cached_agent("flood_2024", AgentType.PLANNER) is kept
+        assert factory._keys_by_project == {"flood_2024": {("flood_2024", "planner")}}
+    
+    def test_tools_for_agent_follow_registry(self) -> None:
+        """Agent Tool 목록은 캐시되지만 Tool 등록 시 갱신"""
+        factory = AgentFactory()
+        first_tool, second_tool = MagicMock(), MagicMock()
+        factory.register_tool("first", first_tool)
+        
+        tools = factory._get_tools_for_agent(["first", "second"])
+        assert tools == [first_tool]
+        tools.append("mutated")
+        assert factory._get_tools_for_agent(["first", "second"]) == [first_tool]
+        
+        factory.register_tools({"second": second_tool})
+        assert factory._get_tools_for_agent(["first", "second"]) == [first_tool, second_tool]
+    
+    def test_default_factory_created_once_across_threads(self, monkeypatch) -> None:
+        """여러 스레드가 동시에 요청해도 기본 팩토리는 하나만 생성"""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from prometheus.controller import agent_factory
+        
+        created = []
+        
+        class SlowFactory:
+            def __init__(self) -> None:
+                time.sleep(0.01)
+                created.append(self)
+        
+        monkeypatch.setattr(agent_factory, "_default_factory", None)
+        monkeypatch.setattr(agent_factory, "AgentFactory", SlowFactory)
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: agent_factory.get_agent_factory(), range(16)))
+        
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+    
+    def test_create_all_agents_shares_llm_config(self) -> None:
+        """값이 같은 LLM 설정은 Agent 간에 하나의 인스턴스로 전달"""
+        llm_factory = MagicMock()
+        factory = AgentFactory(llm_factory=llm_factory)
+        project_config = ProjectConfig(
+            metadata=ProjectMetadata(name="shared_llm"),
+            default_llm=LLMProviderConfig(provider=LLMProvider.ANTHROPIC, model="claude"),
+            agents=[
+                ProjAgentConfig(agent_type=AgentType.PLANNER),
+                ProjAgentConfig(
+                    agent_type=AgentType.QA,
+                    llm=LLMProviderConfig(provider=LLMProvider.ANTHROPIC, model="claude"),
+                ),
+                ProjAgentConfig(
+                    agent_type=AgentType.WRITER,
+                    llm=LLMProviderConfig(provider=LLMProvider.GEMINI, model="gemini"),
+                ),
+            ],
+        )
+        
+        factory.create_all_agents(project_config)
+        
+        configs = [call.args[0] for call in llm_factory.create_from_config.call_args_list]
+        assert configs[0] is configs[1]
+        assert configs[2].provider is LLMProvider.GEMINI
+        assert [call.kwargs["cache_key"] for call in llm_factory.create_from_config.call_args_list] == [
+            "shared_llm_planner_llm", "shared_llm_qa_llm", "shared_llm_writer_llm",
+        ]
+    
+    def test_different_llm_config_creates_new_agent(self) -> None:
+        """llm_config가 다르면 캐시된 Agent를 재사용하지 않음"""
+        llm_factory = MagicMock()
+        factory = AgentFactory(llm_factory=llm_factory)
+        project_config = ProjectConfig(
+            metadata=ProjectMetadata(name="llm_switch"),
+            agents=[ProjAgentConfig(agent_type=AgentType.PLANNER)],
+        )
+        
+        first = factory.create_from_project_config(project_config, AgentType.PLANNER)
+        assert factory.create_from_project_config(
+            project_config, AgentType.PLANNER, llm_config=project_config.default_llm,
+        ) is first
+        
+        other = LLMProviderConfig(model="other")
+        second = factory.create_from_project_config(
+            project_config, AgentType.PLANNER, llm_config=other,
+        )
+        
+        assert second is not first
+        assert llm_factory.create_from_config.call_args.args[0] == other
+    
+    def test_create_all_agents_parallel(self) -> None:
+        """병렬 생성도 설정 순서대로 반환하고 모두 캐시 (parallel=False와 동일 결과)"""
+        import threading
+        import time
+        
+        active = []
+        peak = []
+        lock = threading.Lock()
+        
+        def create_llm(llm_config, cache_key):
+            with lock:
+                active.append(cache_key)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(cache_key)
+            return MockLLMClient()
+        
+        llm_factory = MagicMock()
+        llm_factory.create_from_config.side_effect = create_llm
+        project_config = ProjectConfig(
+            metadata=ProjectMetadata(name="parallel"),
+            agents=[ProjAgentConfig(agent_type=agent_type) for agent_type in AgentType],
+        )
+        
+        factory = AgentFactory(llm_factory=llm_factory)
+        agents = factory.create_all_agents(project_config)
+        
+        assert list(agents) == list(AgentType)
+        assert max(peak) > 1
+        for agent_type, agent in agents.items():
+            assert factory.get_cached_agent("parallel", agent_type) is agent
+        assert factory.create_all_agents(project_config) == agents
+        
+        serial = AgentFactory(llm_factory=llm_factory).create_all_agents(
+            project_config, parallel=False,
+        )
+        assert list(serial) == list(agents)
+    
+    def test_agent_classes_resolved_once(self) -> None:
+        """Agent/Config 클래스는 타입별로 한 번만 해석, 알 수 없는 타입은 오류"""
+        from prometheus.agents.qa_agent import QAAgent, QAConfig
+        
+        factory = AgentFactory()
+        
+        assert factory._get_agent_classes(AgentType.QA) == (QAAgent, QAConfig)
+        assert factory._get_agent_classes(AgentType.QA) is factory._get_agent_classes(AgentType.QA)
+        assert isinstance(factory.create_agent(AgentType.QA).config, QAConfig)
+        
+        factory.AGENT_TYPE_MAP = {}
+        factory._agent_classes.clear()
+        with pytest.raises(AgentFactoryError):
+            factory.create_agent(AgentType.PLANNER)
+    
     def test_tool_registry(self) -> None:
         """Tool 등록"""
         factory = AgentFactory()
@@ -369,6 +606,51 @@ class TestMetaAgent:
         assert meta.config.enable_qa is False
         assert meta.config.max_iterations == 100
 
+    
+    @pytest.mark.asyncio
+    async def test_plan_steps_sharing_agent_run_sequentially(self) -> None:
+        """같은 Agent를 사용하는 단계는 동시에 실행되지 않음"""
+        import asyncio
+        from prometheus.agents.base import AgentOutput
+        from prometheus.agents.planner_agent import ExecutionPlan, PlanStep
+        
+        class TrackingAgent:
+            def __init__(self, result=None):
+                self.result = result
+                self.running = 0
+                self.max_running = 0
+            
+            async def run(self, agent_input):
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+                await asyncio.sleep(0.01)
+                self.running -= 1
+                return AgentOutput.success_output(self.result)
+        
+        plan = ExecutionPlan(
+            plan_id="plan_1",
+            title="계획",
+            description="",
+            steps=[
+                PlanStep(step_id="a", title="A", description="A"),
+                PlanStep(step_id="b", title="B", description="B"),
+                PlanStep(step_id="c", title="C", description="C", agent_type="qa"),
+            ],
+        )
+        executor = TrackingAgent()
+        qa = TrackingAgent()
+        agents = {
+            AgentType.PLANNER: TrackingAgent(plan),
+            AgentType.EXECUTOR: executor,
+            AgentType.QA: qa,
+        }
+        
+        meta = MetaAgent(config=MetaAgentConfig(enable_qa=False))
+        result = await meta._execute_with_plan("요청", "proj1", agents)
+        
+        assert result.success
+        assert executor.max_running == 1
+        assert [s.status for s in plan.steps] == ["completed"] * 3
 
 class TestIntegration:
     """통합 테스트"""
@@ -0,0 +1,96 @@
+"""
+SWMMAgent / VisualizationAgent 테스트
+"""
+
+from unittest.mock import MagicMock, patch
+
+from prometheus.agents.swmm import SWMMAgent, SWMMOutput
+from prometheus.agents.visualization import (
+    VisualizationAgent,
+    VisualizationOutput,
+    create_visualization_agent,
+)
+
+
+SWMM_RESULT = {
+    "project_name": "태화강",
+    "simulation_period": "2024-08-01",
+    "rainfall": {"name": "30년", "duration": 1.0, "total_depth": 80.0, "peak_intensity": 80.0},
+    "total_precipitation": 80.0,
+    "total_runoff": 1200.0,
+    "peak_runoff": 3.5,
+    "runoff_coefficient": 0.6,
+}
+
+
+class TestSWMMAgent:
+    """SWMMAgent 테스트"""
+
+    def test_simulate_input_text(self):
+        """입력 섹션은 주어진 항목만 순서대로 포함"""
+        agent = SWMMAgent(llm=MagicMock())
+
+        with patch.object(SWMMAgent, "invoke", return_value=SWMM_RESULT) as invoke:
+            result = agent.simulate(
+                "태화강",
+                "울산 중구",
+                {"depth": 80},
+                network_data={"conduits": 12},
+                context={"typhoon": "힌남노"},
+            )
+
+        assert isinstance(result, SWMMOutput)
+        assert result.rainfall.total_depth == 80.0
+        assert invoke.call_args[0][0] == (
+            "## 프로젝트\n태화강\n\n## 연구 지역\n울산 중구\n\n"
+            "## 강우 조건\n- 지속시간: 60분\n- 강우량: 80mm\n- 재현기간: 30년\n"
+            "\n## 배수관망 데이터\n{'conduits': 12}"
+            "\n## 태풍 정보\n힌남노"
+            "\n\nSWMM 시뮬레이션을 수행하고 결과를 분석해주세요."
+        )
+
+    def test_simulate_error_output(self):
+        """잘못된 결과는 오류 내용을 담은 기본 출력으로 대체"""
+        agent = SWMMAgent(llm=MagicMock())
+
+        with patch.object(SWMMAgent, "invoke", return_value={"project_name": "x"}):
+            result = agent.simulate("태화강", "울산 중구", {})
+
+        assert result.project_name == "태화강"
+        assert result.recommendations[0].startswith("시뮬레이션 중 오류 발생")
+
+
+class TestVisualizationAgent:
+    """VisualizationAgent 테스트"""
+
+    def test_visualize_input_text(self):
+        """차트 유형 목록과 컨텍스트를 입력에 포함"""
+        agent = VisualizationAgent(llm=MagicMock())
+
+        with patch.object(
+            VisualizationAgent,
+            "invoke",
+            return_value={"title": "강우", "python_code": "plt.plot()"},
+        ) as invoke:
+            result = agent.visualize(
+                "시간별 강우량",
+                chart_types=["line", "bar"],
+                academic_style=False,
+                context={"language": "ko"},
+            )
+
+        assert isinstance(result, VisualizationOutput)
+        assert result.python_code == "plt.plot()"
+        assert invoke.call_args[0][0] == (
+            "## 데이터 설명\n시간별 강우량\n\n## 스타일\n- 학술 스타일: 아니오\n"
+            "\n## 원하는 차트 유형\n- line\n- bar\n"
+            "\n## 언어\nko"
+            "\n\n시각화 코드를 생성해주세요."
+        )
+
+    def test_create_uses_cached_llm_factory(self):
+        """LLM은 팩토리 캐시를 통해 생성"""
+        with patch("prometheus.agents.visualization.create_llm", return_value=MagicMock()) as create_llm:
+            create_visualization_agent(provider="openai", model="gpt-4o-mini")
+
+        create_llm.assert_called_once_with("openai", model="gpt-4o-mini", temperature=0.5)
@@ -0,0 +1,545 @@
+"""
+PlannerAgent / ExecutionPlan 테스트
+"""
+
+import json
+import re
+import sys
+
+import pytest
+from prometheus.agents.planner_agent import (
+    ExecutionPlan,
+    PlannerAgent,
+    PlannerConfig,
+    PlanStep,
+    TaskPriority,
+    TaskStatus,
+    _topo_critical_path,
+)
+from prometheus.llm.base import LLMResponse
+
+
+class CountingLLMClient:
+    """호출 횟수를 기록하는 Mock LLM"""
+
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = 0
+
+    async def generate(self, messages, **kwargs):
+        self.calls += 1
+        self.last_messages = messages
+        return LLMResponse(content=self.response, model="mock")
+
+
+PLAN_RESPONSE = json.dumps({
+    "plan_id": "plan_1",
+    "title": "분석 계획",
+    "description": "데이터 분석",
+    "steps": [
+        {"step_id": "step_1", "title": "로드", "description": "데이터 로드"},
+        {"step_id": "step_2", "title": "분석", "description": "분석", "dependencies": ["step_1"]},
+    ],
+})
+
+
+def make_plan(*steps: PlanStep) -> ExecutionPlan:
+    """테스트용 계획 생성"""
+    return ExecutionPlan(
+        plan_id="plan_test",
+        title="Test Plan",
+        description="테스트 계획",
+        steps=list(steps),
+    )
+
+
+def make_step(step_id: str, *dependencies: str, **kwargs) -> PlanStep:
+    """테스트용 단계 생성"""
+    return PlanStep(
+        step_id=step_id,
+        title=step_id,
+        description=f"{step_id} 설명",
+        dependencies=list(dependencies),
+        **kwargs,
+    )
+
+
+class TestExecutionPlanScheduling:
+    """ExecutionPlan 스케줄링 테스트"""
+
+    def test_next_step_respects_dependencies(self):
+        """의존성이 완료된 단계만 반환"""
+        plan = make_plan(
+            make_step("step_1"),
+            make_step("step_2", "step_1"),
+            make_step("step_3", "step_2"),
+        )
+
+        order = []
+        while (step := plan.get_next_step()) is not None:
+            order.append(step.step_id)
+            plan.update_step_status(step.step_id, TaskStatus.COMPLETED)
+
+        assert order == ["step_1", "step_2", "step_3"]
+        assert plan.is_completed()
+
+    def test_next_step_prefers_priority(self):
+        """실행 가능한 단계 중 우선순위가 높은 단계를 먼저 반환"""
+        plan = make_plan(
+            make_step("low", priority=TaskPriority.LOW),
+            make_step("high", priority=TaskPriority.HIGH),
+        )
+        assert plan.get_next_step().step_id == "high"
+
+    def test_next_step_prefers_critical_path(self):
+        """후속 단계가 많이 남은(임계 경로가 긴) 단계를 먼저 반환"""
+        plan = make_plan(
+            make_step("short", priority=TaskPriority.HIGH),
+            make_step("long_1"),
+            make_step("long_2", "long_1"),
+            make_step("long_3", "long_2"),
+        )
+        assert plan.get_critical_path_length("long_1") == 3.0
+        assert plan.get_critical_path_length("short") == 1.0
+        assert plan.get_next_step().step_id == "long_1"
+
+    def test_topological_order(self):
+        """위상 순서"""
+        plan = make_plan(
+            make_step("c", "b"),
+            make_step("b", "a"),
+            make_step("a"),
+        )
+        assert [s.step_id for s in plan.get_topological_order()] == ["a", "b", "c"]
+
+    def test_failed_step_blocks_dependents(self):
+        """실패한 단계의 후속 단계는 실행되지 않음"""
+        plan = make_plan(
+            make_step("step_1"),
+            make_step("step_2", "step_1"),
+        )
+        plan.update_step_status("step_1", TaskStatus.FAILED)
+        assert plan.get_next_step() is None
+
+    def test_reopened_step_is_rescheduled(self):
+        """완료된 단계를 다시 대기 상태로 돌리면 재스케줄"""
+        plan = make_plan(
+            make_step("step_1"),
+            make_step("step_2", "step_1"),
+        )
+        plan.update_step_status("step_1", TaskStatus.COMPLETED)
+        assert plan.get_next_step().step_id == "step_2"
+
+        plan.update_step_status("step_1", TaskStatus.PENDING)
+        assert plan.get_next_step().step_id == "step_1"
+
+    def test_progress_tracks_status_transitions(self):
+        """진행률은 상태 전환에 따라 갱신"""
+        plan = make_plan(make_step("step_1"), make_step("step_2"))
+        assert plan.get_progress() == 0.0
+
+        plan.update_step_status("step_1", TaskStatus.COMPLETED)
+        plan.update_step_status("step_1", TaskStatus.COMPLETED)
+        assert plan.get_progress() == 0.5
+
+        plan.update_step_status("step_2", TaskStatus.SKIPPED)
+        assert plan.get_progress() == 1.0
+        assert plan.is_completed()
+
+        plan.update_step_status("step_2", TaskStatus.FAILED)
+        assert plan.get_progress() == 0.5
+        assert not plan.is_completed()
+
+    def test_all_ready_steps_marks_in_progress(self):
+        """동시에 실행 가능한 단계를 모두 반환하고 IN_PROGRESS로 표시"""
+        plan = make_plan(
+            make_step("a"),
+            make_step("b"),
+            make_step("c", "a", "b"),
+        )
+        ready = plan.get_all_ready_steps()
+        assert [s.step_id for s in ready] == ["a", "b"]
+        assert all(s.status == TaskStatus.IN_PROGRESS for s in ready)
+        assert plan.get_all_ready_steps() == []
+
+        plan.update_step_status("a", TaskStatus.COMPLETED)
+        assert plan.get_all_ready_steps() == []
+        plan.update_step_status("b", TaskStatus.COMPLETED)
+        assert [s.step_id for s in plan.get_all_ready_steps()] == ["c"]
+
+    def test_all_ready_steps_limit(self):
+        """limit 초과 단계는 대기 상태 유지"""
+        plan = make_plan(make_step("a"), make_step("b"))
+        assert [s.step_id for s in plan.get_all_ready_steps(limit=1)] == ["a"]
+        assert plan.get_step("b").status == TaskStatus.PENDING
+        assert [s.step_id for s in plan.get_all_ready_steps()] == ["b"]
+
+    def test_get_step(self):
+        """단계 조회"""
+        plan = make_plan(make_step("step_1"))
+        assert plan.get_step("step_1").title == "step_1"
+        assert plan.get_step("missing") is None
+
+    def test_append_and_remove_step(self):
+        """단계 추가/제거 시 인덱스 동기화"""
+        plan = make_plan(make_step("step_1"))
+        plan.append_step(make_step("step_2", "step_1"))
+        assert plan.total_steps == 2
+        assert plan.get_step("step_2") is not None
+
+        plan.update_step_status("step_1", TaskStatus.COMPLETED)
+        assert plan.get_next_step().step_id == "step_2"
+
+        assert plan.remove_step("step_2")
+        assert plan.get_step("step_2") is None
+        assert plan.get_next_step() is None
+        assert not plan.remove_step("step_2")
+
+    def test_reassigned_steps_reindex(self):
+        """같은 길이의 새 steps 목록을 할당해도 새 단계 기준으로 스케줄링"""
+        plan = make_plan(make_step("a"))
+        assert plan.get_next_step().step_id == "a"
+
+        plan.steps = [make_step("b")]
+        assert plan.get_next_step().step_id == "b"
+        assert plan.get_step("a") is None
+
+    def test_direct_status_assignment_needs_rebuild(self):
+        """상태를 직접 할당한 경우 rebuild_index() 후 후속 단계로 진행"""
+        plan = make_plan(make_step("a"), make_step("b", "a"))
+        assert plan.get_next_step().step_id == "a"
+
+        plan.steps[0].status = TaskStatus.COMPLETED
+        plan.rebuild_index()
+        assert plan.get_next_step().step_id == "b"
+
+    def test_topo_critical_path_kernel(self):
+        """정수 인덱스 커널: 순환 단계는 위상 순서에서 제외"""
+        # 0 → 1 → 2, 3 ⇄ 4
+        successors = [[1], [2], [], [4], [3]]
+        indegree = [0, 1, 1, 1, 1]
+        order, cp = _topo_critical_path(successors, indegree, [1.0, 2.0, 3.0, 1.0, 1.0])
+
+        assert order == [0, 1, 2]
+        assert cp == [6.0, 5.0, 3.0, 1.0, 1.0]
+
+
+class TestPlanValidation:
+    """계획 유효성 검증 테스트"""
+
+    def test_valid_plan(self):
+        """유효한 계획"""
+        plan = make_plan(
+            make_step("step_1"),
+            make_step("step_2", "step_1"),
+            make_step("step_3", "step_1", "step_2"),
+        )
+        assert PlannerAgent().validate_plan(plan) == []
+
+    def test_shared_dependency_is_not_a_cycle(self):
+        """여러 경로로 도달하는 공통 의존성은 순환이 아님"""
+        plan = make_plan(
+            make_step("root"),
+            make_step("left", "root"),
+            make_step("right", "root"),
+            make_step("join", "left", "right"),
+        )
+        assert PlannerAgent().validate_plan(plan) == []
+
+    def test_circular_dependency(self):
+        """순환 의존성 검출"""
+        plan = make_plan(
+            make_step("step_1", "step_3"),
+            make_step("step_2", "step_1"),
+            make_step("step_3", "step_2"),
+        )
+        errors = PlannerAgent().validate_plan(plan)
+        assert any("Circular dependency" in e for e in errors)
+
+    def test_deep_chain_exceeds_recursion_limit(self):
+        """재귀 한도보다 깊은 의존성 체인도 검증 가능"""
+        depth = sys.getrecursionlimit() + 500
+        steps = [make_step("step_0")] + [
+            make_step(f"step_{i}", f"step_{i - 1}") for i in range(1, depth)
+        ]
+        plan = make_plan(*steps)
+        assert PlannerAgent().validate_plan(plan) == []
+
+        steps[0].dependencies = [f"step_{depth - 1}"]
+        errors = PlannerAgent().validate_plan(plan)
+        assert any("Circular dependency" in e for e in errors)
+
+    def test_duplicate_and_missing_ids(self):
+        """중복 ID / 존재하지 않는 의존성 검출"""
+        plan = make_plan(
+            make_step("step_1"),
+            make_step("step_1"),
+            make_step("step_2", "step_9"),
+        )
+        errors = PlannerAgent().validate_plan(plan)
+        assert "Duplicate step ID found: step_1" in errors
+        assert "Step step_2 depends on non-existent step: step_9" in errors
+
+
+class TestPlanCache:
+    """계획 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_skips_llm(self):
+        """동일 요청은 LLM을 다시 호출하지 않음"""
+        llm = CountingLLMClient(PLAN_RESPONSE)
+        agent = PlannerAgent(llm=llm)
+
+        first = await agent.create_plan("데이터를 분석해줘", context={"a": 1})
+        second = await agent.create_plan("데이터를  분석해줘 ", context={"a": 1})
+
+        assert llm.calls == 1
+        assert second.plan_id == first.plan_id
+        assert [s.step_id for s in second.steps] == ["step_1", "step_2"]
+
+    @pytest.mark.asyncio
+    async def test_history_shares_sent_user_message(self):
+        """히스토리에 LLM으로 보낸 사용자 메시지 객체를 그대로 저장"""
+        llm = CountingLLMClient(PLAN_RESPONSE)
+        agent = PlannerAgent(llm=llm)
+
+        await agent.create_plan("데이터를 분석해줘")
+
+        assert agent.messages[0] is llm.last_messages[1]
+        assert len(agent.messages) == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_plan_is_isolated(self):
+        """반환된 계획의 상태 변경이 캐시에 영향을 주지 않음"""
+        llm = CountingLLMClient(PLAN_RESPONSE)
+        agent = PlannerAgent(llm=llm)
+
+        first = await agent.create_plan("데이터를 분석해줘")
+        first.update_step_status("step_1", TaskStatus.COMPLETED)
+
+        second = await agent.create_plan("데이터를 분석해줘")
+        assert second.get_step("step_1").status == TaskStatus.PENDING
+        assert second.get_next_step().step_id == "step_1"
+
+    @pytest.mark.asyncio
+    async def test_cached_plan_drains_its_own_steps(self):
+        """캐시에서 반환된 계획을 실행하면 자신의 steps 상태가 갱신됨"""
+        llm = CountingLLMClient(PLAN_RESPONSE)
+        agent = PlannerAgent(llm=llm)
+
+        await agent.create_plan("데이터를 분석해줘")
+        plan = await agent.create_plan("데이터를 분석해줘")
+        assert llm.calls == 1
+
+        while not plan.is_completed():
+            ready = plan.get_all_ready_steps()
+            assert ready
+            for step in ready:
+                plan.update_step_status(step.step_id, TaskStatus.COMPLETED)
+
+        assert plan.get_progress() == 1.0
+        assert all(s.status == TaskStatus.COMPLETED for s in plan.steps)
+        assert all(
+            s["status"] == TaskStatus.COMPLETED for s in plan.model_dump()["steps"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_tool_binding_changes_prompt(self):
+        """Tool 바인딩이 바뀌면 프롬프트와 캐시 키가 갱신됨"""
+        llm = CountingLLMClient(PLAN_RESPONSE)
+        agent = PlannerAgent(llm=llm)
+
+        await agent.create_plan("데이터를 분석해줘")
+        assert "Available tools: none" in agent.messages[0].content
+
+        agent.bind_tool(type("Tool", (), {"name": "python_exec"})())
+        await agent.create_plan("데이터를 분석해줘")
+        assert llm.calls == 2
+        assert "Available tools: python_exec" in agent.messages[2].content
+
+    @pytest.mark.asyncio
+    async def test_rebinding_llm_misses(self):
+        """다른 모델/클라이언트를 바인딩하면 이전 모델의 계획을 재사용하지 않음"""
+        llm = CountingLLMClient(PLAN_RESPONSE)
+        llm.config = type("Config", (), {"model": "model-a"})()
+        agent = PlannerAgent(llm=llm)
+        await agent.create_plan("데이터를 분석해줘")
+
+        other = CountingLLMClient(PLAN_RESPONSE)
+        other.config = type("Config", (), {"model": "model-b"})()
+        agent.bind_llm(other)
+        await agent.create_plan("데이터를 분석해줘")
+
+        assert llm.calls == 1
+        assert other.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_different_context_misses(self):
+        """컨텍스트가 다르면 새로 계획 수립"""
+        llm = CountingLLMClient(PLAN_RESPONSE)
+        agent = PlannerAgent(llm=llm)
+
+        await agent.create_plan("데이터를 분석해줘", context={"a": 1})
+        await agent.create_plan("데이터를 분석해줘", context={"a": 2})
+        assert llm.calls == 2
+
+
+class TestCreateExecutionPlan:
+    """LLM 응답 → ExecutionPlan 변환 테스트"""
+
+    def test_normalizes_llm_data(self):
+        """검증 없이 생성하되 타입은 정규화"""
+        plan = PlannerAgent()._create_execution_plan({
+            "plan_id": "plan_x",
+            "steps": [
+                {"step_id": 1, "title": "A", "priority": "high", "agent_type": "unknown"},
+                {"step_id": 2, "title": "B", "dependencies": [1]},
+            ],
+        })
+        assert plan.total_steps == 2
+        assert plan.steps[0].step_id == "1"
+        assert plan.steps[0].priority == TaskPriority.HIGH
+        assert plan.steps[0].agent_type == "executor"
+        assert plan.steps[1].dependencies == ["1"]
+        assert plan.get_next_step().step_id == "1"
+
+    def test_invalid_priority(self):
+        """잘못된 우선순위는 오류"""
+        with pytest.raises(ValueError):
+            PlannerAgent()._create_execution_plan({
+                "steps": [{"step_id": "s", "priority": "urgent"}],
+            })
+
+    def test_duplicate_step_ids_are_renamed(self):
+        """중복 단계 ID는 고유 ID로 바꿔 모든 단계가 실행됨"""
+        plan = PlannerAgent()._create_execution_plan({
+            "steps": [{"step_id": "s"}, {"step_id": "s"}, {"step_id": "s_2"}],
+        })
+        assert [s.step_id for s in plan.steps] == ["s", "s_2", "s_2_2"]
+
+        executed = []
+        while not plan.is_completed():
+            ready = plan.get_all_ready_steps()
+            assert ready
+            for step in ready:
+                executed.append(step.step_id)
+                plan.update_step_status(step.step_id, TaskStatus.COMPLETED)
+        assert sorted(executed) == ["s", "s_2", "s_2_2"]
+
+    def test_strict_mode_validates(self):
+        """strict 모드에서는 Pydantic 검증 경로 사용"""
+        agent = PlannerAgent(config=PlannerConfig(strict_plan_validation=True))
+        plan = agent._create_execution_plan({"steps": [{"step_id": "s"}]})
+        assert plan.steps[0].step_id == "s"
+        assert plan.get_next_step() is plan.steps[0]
+
+
+class TestDecomposeTemplateCache:
+    """작업 분해 템플릿 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_same_template_reuses_steps(self):
+        """구체적인 값만 다른 작업은 LLM 없이 분해"""
+        llm = CountingLLMClient("```json\n%s\n```" % json.dumps([
+            {"step_id": "step_1", "title": "Load /data/2023.csv", "description": "Read /data/2023.csv"},
+            {"step_id": "step_2", "title": "Summarize", "description": "Write the 'sales' section"},
+        ]))
+        agent = PlannerAgent(llm=llm)
+
+        await agent.decompose_task("Summarize /data/2023.csv into the 'sales' section")
+        steps = await agent.decompose_task("Summarize /data/2024.csv into the 'costs' section")
+
+        assert llm.calls == 1
+        assert steps[0].title == "Load /data/2024.csv"
+        assert steps[1].description == "Write the 'costs' section"
+
+    @pytest.mark.asyncio
+    async def test_numbers_are_not_slots(self):
+        """우연히 일치하는 숫자가 다른 요청의 값으로 바뀌지 않도록 숫자는 템플릿화하지 않음"""
+        llm = CountingLLMClient(json.dumps([
+            {"step_id": "step_1", "title": "Rolling mean",
+             "description": "Compute 3-day rolling mean for each of the 3 rivers"},
+        ]))
+        agent = PlannerAgent(llm=llm)
+
+        await agent.decompose_task("Compare 3 rivers using data/2024.csv")
+        steps = await agent.decompose_task("Compare 7 rivers using data/2024.csv")
+
+        assert llm.calls == 2
+        assert steps[0].description == "Compute 3-day rolling mean for each of the 3 rivers"
+
+    @pytest.mark.asyncio
+    async def test_different_template_calls_llm(self):
+        """다른 유형의 작업은 새로 분해"""
+        llm = CountingLLMClient("```json\n%s\n```" % json.dumps([
+            {"step_id": "step_1", "title": "Do it", "description": "Do it"},
+        ]))
+        agent = PlannerAgent(llm=llm)
+
+        await agent.decompose_task("Summarize report 1")
+        await agent.decompose_task("Translate report 1")
+        assert llm.calls == 2
+
+
+class ChainDependencyLLMClient:
+    """프롬프트에 포함된 단계들을 순차 의존성으로 응답하는 Mock LLM"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, messages, **kwargs):
+        self.calls += 1
+        step_ids = re.findall(r'"step_id": "(step_\d+)"', messages[-1].content)
+        deps = {sid: ([step_ids[i - 1]] if i else []) for i, sid in enumerate(step_ids)}
+        return LLMResponse(content=json.dumps(deps), model="mock")
+
+
+class TestAnalyzeDependencies:
+    """의존성 분석 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_small_plan_single_call(self):
+        """작은 계획은 한 번만 호출"""
+        llm = ChainDependencyLLMClient()
+        agent = PlannerAgent(llm=llm)
+        steps = [make_step(f"step_{i}") for i in range(3)]
+
+        await agent.analyze_dependencies(steps)
+
+        assert llm.calls == 1
+        assert steps[2].dependencies == ["step_1"]
+
+    @pytest.mark.asyncio
+    async def test_large_plan_uses_overlapping_windows(self):
+        """큰 계획은 겹치는 윈도우로 나누어 병합"""
+        llm = ChainDependencyLLMClient()
+        agent = PlannerAgent(llm=llm)
+        steps = [make_step(f"step_{i}") for i in range(20)]
+
+        await agent.analyze_dependencies(steps)
+
+        assert llm.calls == 2
+        assert steps[0].dependencies == []
+        # 두 번째 윈도우의 시작 단계(step_9)도 겹친 구간 덕분에 이전 단계와 연결됨
+        assert all(
+            steps[i].dependencies == [f"step_{i - 1}"] for i in range(1, 20)
+        )
+
+
+class TestExtractJson:
+    """LLM 응답 JSON 추출 테스트"""
+
+    def test_fenced_block(self):
+        """코드 블록 내 JSON"""
+        text = 'Plan:\n```json\n{"a": 1}\n```\nDone'
+        assert PlannerAgent()._extract_json(text) == '{"a": 1}'
+
+    def test_array_with_prose(self):
+        """설명 문장에 둘러싸인 배열"""
+        text = 'Steps: [{"title": "a}"}, {"title": "b"}] Let me know {if needed}.'
+        assert PlannerAgent()._extract_json(text) == '[{"title": "a}"}, {"title": "b"}]'
+
+    def test_parse_plan_response_fallback(self):
+        """파싱 불가 응답은 기본 계획 반환"""
+        data = PlannerAgent()._parse_plan_response("no json here")
+        assert data["plan_id"] == "plan_fallback"
@@ -0,0 +1,116 @@
+"""
+PROMETHEUS CLI 테스트 (prometheus.cli)
+"""
+
+import subprocess
+import sys
+
+
+class TestStartup:
+    """CLI 시작 테스트"""
+
+    def test_import_does_not_load_agents(self, project_root):
+        """CLI 모듈 import 시 LangChain Agent 모듈을 로드하지 않음"""
+        code = (
+            "import sys, prometheus.cli; "
+            "print('langchain_core' in sys.modules, 'prometheus.agents' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(project_root),
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False False"
+
+    def test_package_exports_load_on_access(self):
+        """패키지 공개 이름은 접근 시 로드"""
+        import prometheus
+        from prometheus.agents.writer import WriterAgent
+
+        assert prometheus.WriterAgent is WriterAgent
+        assert "WriterAgent" in dir(prometheus)
+
+
+class TestParser:
+    """CLI 파서 테스트"""
+
+    @staticmethod
+    def _commands(parser):
+        return set(parser._subparsers._group_actions[0].choices)
+
+    def test_builds_only_requested_subparser(self):
+        """명령을 지정하면 해당 서브파서만 구성"""
+        from prometheus.cli import create_parser
+
+        parser = create_parser("list")
+        args = parser.parse_args(["list", "--verbose"])
+
+        assert self._commands(parser) == {"list"}
+        assert args.command == "list" and args.verbose is True
+
+    def test_full_parser(self):
+        """명령을 지정하지 않으면 전체 명령 구성"""
+        from prometheus.cli import create_parser
+
+        parser = create_parser()
+
+        assert self._commands(parser) == {
+            "new", "run", "list", "status", "config", "init", "agents", "tools",
+        }
+        assert parser.parse_args(["agents"]).command == "agents"
+
+
+    def test_command_tables_match(self):
+        """모든 서브파서에 처리 함수가 있고 run 모드는 ExecutionMode 값"""
+        from prometheus import cli
+        from prometheus.controller.meta_agent import ExecutionMode
+
+        assert set(cli._COMMANDS) == set(cli._SUBPARSERS)
+        assert [ExecutionMode(mode) for mode in cli._RUN_MODES] == [
+            ExecutionMode.AUTO, ExecutionMode.SEQUENTIAL, ExecutionMode.PLAN_BASED,
+        ]
+
+class TestCommands:
+    """CLI 명령 테스트"""
+
+    def test_list_verbose_keeps_project_order(self, capsys):
+        """설정은 동시에 로드하되 출력은 프로젝트 순서대로, 실패는 개별 표시"""
+        from argparse import Namespace
+        from unittest.mock import MagicMock, patch
+        from prometheus.cli import cmd_list
+
+        def load_project(name):
+            if name == "broken":
+                raise ValueError("bad yaml")
+            config = MagicMock()
+            config.metadata.description = f"{name} 설명"
+            config.agents = [object()] * 2
+            return config
+
+        loader = MagicMock()
+        loader.list_projects.return_value = ["alpha", "broken", "gamma"]
+        loader.load_project.side_effect = load_project
+
+        with patch("prometheus.config.loader.ConfigLoader", return_value=loader):
+            assert cmd_list(Namespace(verbose=True)) == 0
+
+        lines = [line.strip() for line in capsys.readouterr().out.splitlines()]
+        assert [line for line in lines if line.startswith("📁")] == [
+            "📁 alpha", "📁 broken (error loading)", "📁 gamma",
+        ]
+        assert "Description: gamma 설명" in lines
+
+    def test_json_preview_matches_truncated_dump(self):
+        """결과 미리보기는 전체 JSON을 잘라낸 것과 동일 (orjson 유무 무관)"""
+        import json
+        from unittest.mock import patch
+        from prometheus import cli
+
+        value = {"요약": "강우 " * 1000, "steps": [1, 2.5, {"ok": None}], 3: "x"}
+        expected = json.dumps(value, indent=2, ensure_ascii=False, default=str)[:1000]
+
+        assert cli._json_preview(value, 1000) == expected
+        with patch.object(cli, "orjson", None):
+            assert cli._json_preview(value, 1000) == expected
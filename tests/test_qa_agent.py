@@ -0,0 +1,550 @@
+"""
+QAAgent / QualityReport 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+from prometheus.agents.qa_agent import (
+    QAAgent,
+    QAConfig,
+    QualityDimension,
+    QualityLevel,
+    QualityReport,
+    QualityScore,
+)
+from prometheus.agents.base import AgentInput
+from prometheus.llm.base import LLMResponse
+
+
+class CountingLLMClient:
+    """호출 횟수를 기록하는 Mock LLM"""
+
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = 0
+
+    async def generate(self, messages, **kwargs):
+        self.calls += 1
+        self.last_messages = messages
+        return LLMResponse(content=self.response, model="mock")
+
+
+REVIEW_RESPONSE = json.dumps({
+    "dimension_scores": [
+        {"dimension": "accuracy", "score": 0.9, "feedback": "정확함"},
+        {"dimension": "clarity", "score": 0.7},
+    ],
+    "issues": [
+        {"severity": "high", "category": "completeness", "description": "X 누락"},
+    ],
+    "strengths": ["구성이 좋음"],
+    "summary": "양호",
+})
+
+
+class TestParseReviewResponse:
+    """리뷰 응답 파싱 테스트"""
+
+    def test_builds_report_from_json(self):
+        """정상 응답은 차원 점수로 전체 점수를 계산"""
+        agent = QAAgent(llm=CountingLLMClient(""))
+        report = agent._parse_review_response(
+            REVIEW_RESPONSE.replace('"summary"', '"overall_score": 0, "summary"')
+        )
+
+        assert [s.dimension for s in report.dimension_scores] == [
+            QualityDimension.ACCURACY,
+            QualityDimension.CLARITY,
+        ]
+        assert report.overall_score == pytest.approx(0.8)
+        assert report.overall_level == QualityLevel.GOOD
+        assert report.get_critical_issues()[0].description == "X 누락"
+        assert report.strengths == ["구성이 좋음"]
+
+    def test_scores_are_clamped(self):
+        """범위를 벗어난 점수는 0.0 ~ 1.0으로 보정"""
+        agent = QAAgent(llm=CountingLLMClient(""))
+        report = agent._parse_review_response(json.dumps({
+            "overall_score": 1.4,
+            "dimension_scores": [{"dimension": "format", "score": "-0.2"}],
+        }))
+
+        assert report.overall_score == 1.0
+        assert report.dimension_scores[0].score == 0.0
+
+    def test_null_issue_fields_are_normalized(self):
+        """빈 값이 있는 이슈 목록은 항목별 정규화로 기본값을 채움"""
+        agent = QAAgent(llm=CountingLLMClient(""))
+        report = agent._parse_review_response(json.dumps({
+            "issues": [
+                {"severity": None, "description": "근거 부족", "extra": 1},
+                {"category": "clarity", "description": "문장이 김"},
+            ],
+        }))
+
+        assert [(i.severity, i.category) for i in report.issues] == [
+            ("medium", "general"),
+            ("medium", "clarity"),
+        ]
+
+    def test_invalid_response_falls_back(self):
+        """알 수 없는 차원이나 잘못된 JSON은 기본 보고서로 대체"""
+        agent = QAAgent(llm=CountingLLMClient(""))
+
+        bad_dimension = agent._parse_review_response(
+            json.dumps({"dimension_scores": [{"dimension": "style", "score": 0.5}]})
+        )
+        not_json = agent._parse_review_response("리뷰 불가")
+
+        assert bad_dimension.overall_score == 0.5
+        assert not_json.summary == "리뷰 불가"
+
+    def test_constructed_report_matches_validated_report(self):
+        """검증 없이 생성한 보고서도 직렬화 결과가 동일"""
+        agent = QAAgent(llm=CountingLLMClient(""))
+        report = agent._parse_review_response(REVIEW_RESPONSE)
+
+        validated = QualityReport.model_validate(report.model_dump())
+        assert validated.model_dump() == report.model_dump()
+
+
+class TestExtractJson:
+    """_extract_json 테스트"""
+
+    def test_whole_response_is_json(self):
+        """응답 전체가 JSON 배열이면 그대로 반환 (내부 객체만 잘라내지 않음)"""
+        agent = QAAgent(llm=CountingLLMClient(""))
+        text = '\n["첫째", {"note": "둘째"}]\n'
+
+        assert json.loads(agent._extract_json(text)) == ["첫째", {"note": "둘째"}]
+
+    def test_fenced_and_embedded_json(self):
+        """코드 블록 또는 설명문에 포함된 JSON 추출"""
+        agent = QAAgent(llm=CountingLLMClient(""))
+
+        assert agent._extract_json('결과:\n```json\n{"a": 1}\n```') == '{"a": 1}'
+        assert agent._extract_json('결과는 {"a": 1} 입니다') == '{"a": 1}'
+        assert agent._extract_json("결과: [1, 2] 끝") == "[1, 2]"
+        assert agent._extract_json("JSON 없음") == "JSON 없음"
+
+
+class TestReview:
+    """review() 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_pass_threshold(self):
+        """통과 기준 점수에 따라 passed 결정"""
+        llm = CountingLLMClient(REVIEW_RESPONSE)
+        agent = QAAgent(config=QAConfig(pass_threshold=0.9), llm=llm)
+
+        report = await agent.review("내용", original_request="요청")
+
+        assert llm.calls == 1
+        assert report.passed is False
+
+    @pytest.mark.asyncio
+    async def test_prompt_prefix_is_stable(self):
+        """요청별 내용은 user 메시지에만 들어가고 system 메시지는 고정"""
+        llm = CountingLLMClient(REVIEW_RESPONSE)
+        agent = QAAgent(llm=llm)
+
+        await agent.review("첫 번째 내용", dimensions=[QualityDimension.CLARITY, QualityDimension.ACCURACY])
+        first_system, first_user = llm.last_messages
+        await agent.review("두 번째 내용", dimensions=[QualityDimension.ACCURACY, QualityDimension.CLARITY])
+        second_system, second_user = llm.last_messages
+
+        assert first_system is second_system
+        assert first_system.content == second_system.content
+        assert "내용" not in first_system.content
+        assert "accuracy, clarity" in first_user.content
+        assert first_user.content.replace("첫", "두") == second_user.content
+
+    @pytest.mark.asyncio
+    async def test_strict_mode_fails_on_critical_issue(self):
+        """엄격 모드에서는 심각한 이슈가 있으면 실패"""
+        response = REVIEW_RESPONSE.replace('"summary"', '"overall_score": 0.95, "summary"')
+        agent = QAAgent(config=QAConfig(strict_mode=True), llm=CountingLLMClient(response))
+
+        report = await agent.review("내용")
+
+        assert report.overall_score == 0.95
+        assert report.passed is False
+
+
+class TestQualityReport:
+    """QualityReport 모델 테스트"""
+
+    def test_overall_score_from_dimensions(self):
+        """전체 점수 미지정 시 차원 점수 평균 사용"""
+        report = QualityReport(dimension_scores=[
+            QualityScore(dimension=QualityDimension.ACCURACY, score=1.0),
+            QualityScore(dimension=QualityDimension.CLARITY, score=0.8),
+        ])
+
+        assert report.overall_score == pytest.approx(0.9)
+        assert report.overall_level == QualityLevel.EXCELLENT
+
+
+class TestResponseCache:
+    """응답 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_review_skips_llm(self):
+        """동일 리뷰는 LLM을 다시 호출하지 않고 새 보고서를 반환"""
+        llm = CountingLLMClient(REVIEW_RESPONSE)
+        agent = QAAgent(llm=llm)
+
+        first = await agent.review("내용", original_request="요청")
+        first.summary = "변경됨"
+        second = await agent.review("내용", original_request="요청")
+
+        assert llm.calls == 1
+        assert second is not first
+        assert second.summary == "양호"
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_calls_are_not_cached(self):
+        """temperature가 기준보다 높은 호출은 캐시하지 않음"""
+        llm = CountingLLMClient('["예시 추가"]')
+        agent = QAAgent(llm=llm)
+
+        await agent.suggest_improvements("개선점을 찾을 보고서 내용")
+        await agent.suggest_improvements("개선점을 찾을 보고서 내용")
+
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_disabled(self):
+        """캐시 크기 0이면 매번 LLM 호출"""
+        llm = CountingLLMClient(REVIEW_RESPONSE)
+        agent = QAAgent(config=QAConfig(response_cache_size=0), llm=llm)
+
+        await agent.compare_versions("원본", "수정본")
+        await agent.compare_versions("원본", "수정본")
+
+        assert llm.calls == 2
+
+
+    @pytest.mark.parametrize("score, level", [
+        (0.0, QualityLevel.POOR),
+        (0.39, QualityLevel.POOR),
+        (0.4, QualityLevel.NEEDS_IMPROVEMENT),
+        (0.6, QualityLevel.ACCEPTABLE),
+        (0.75, QualityLevel.GOOD),
+        (0.89, QualityLevel.GOOD),
+        (0.9, QualityLevel.EXCELLENT),
+        (1.0, QualityLevel.EXCELLENT),
+    ])
+    def test_score_to_level_boundaries(self, score, level):
+        """경계 점수는 상위 수준에 포함"""
+        assert QualityReport._score_to_level(score) == level
+
+    def test_classify_batch_matches_single_conversion(self):
+        """일괄 변환은 보고서별 변환과 같은 결과"""
+        scores = [0.0, 0.39, 0.4, 0.6, 0.75, 0.89, 0.9, 1.0]
+
+        assert QAAgent.classify_batch(scores) == [
+            QualityReport._score_to_level(s) for s in scores
+        ]
+        assert QAAgent.classify_batch([]) == []
+
+
+class TestQualityReportMarkdown:
+    """QualityReport.to_markdown 테스트"""
+
+    def test_sections(self):
+        """항목이 있는 섹션만 출력"""
+        report = QualityReport(
+            overall_score=0.8,
+            passed=False,
+            dimension_scores=[QualityScore(dimension=QualityDimension.ACCURACY, score=0.8, feedback="정확")],
+            strengths=["구성"],
+            summary="요약",
+        )
+
+        assert report.to_markdown() == "\n".join([
+            "# Quality Report\n",
+            "**Overall Level**: good",
+            "**Overall Score**: 0.80",
+            "**Status**: ❌ Failed\n",
+            "## Summary",
+            "요약",
+            "",
+            "## Dimension Scores",
+            "- **accuracy**: 0.80 - 정확",
+            "",
+            "## Strengths",
+            "- 구성",
+            "",
+        ])
+
+    def test_markdown_is_cached_until_field_assignment(self):
+        """반복 호출은 캐시를 재사용하고, 필드 할당 시 다시 생성"""
+        report = QualityReport(overall_score=0.8, summary="요약")
+
+        first = report.to_markdown()
+        assert report.to_markdown() is first
+        assert "markdown" not in report.model_dump()
+
+        report.passed = False
+        assert "❌ Failed" in report.to_markdown()
+
+    def test_model_copy_renders_updated_fields(self):
+        """model_copy(update=...)로 만든 복사본은 새 필드로 다시 생성"""
+        report = QualityReport(overall_score=0.5, summary="요약")
+        report.to_markdown()
+
+        copied = report.model_copy(update={"overall_score": 0.9})
+        assert "**Overall Score**: 0.90" in copied.to_markdown()
+        assert "**Overall Score**: 0.50" in report.to_markdown()
+
+
+class TestStructuredResults:
+    """검증/비교 결과 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_validation_fills_missing_keys(self):
+        """응답에 없는 키는 기본값으로 채움"""
+        agent = QAAgent(llm=CountingLLMClient('{"passed": true, "score": 0.9}'))
+
+        result = await agent.validate_against_request("요청을 검증할 보고서 내용", "요청")
+
+        assert result["passed"] is True
+        assert result["score"] == 0.9
+        assert result["missing_requirements"] == []
+        assert result["feedback"] == ""
+
+    @pytest.mark.asyncio
+    async def test_comparison_fallback(self):
+        """JSON 객체가 아닌 응답은 기본값과 원문 요약으로 대체"""
+        agent = QAAgent(llm=CountingLLMClient("개선됨"))
+
+        result = await agent.compare_versions("원본", "수정본")
+        result["changes"].append("변경")
+        again = await agent.compare_versions("원본2", "수정본2")
+
+        assert result["improved"] is False
+        assert result["summary"] == "개선됨"
+        assert again["changes"] == []
+
+
+class TestReviewPromptSchema:
+    """리뷰 프롬프트 스키마 테스트"""
+
+    def test_schema_lists_only_llm_fields(self):
+        """프롬프트 스키마는 LLM이 작성하는 필드와 설명을 포함"""
+        from prometheus.agents.qa_agent import _review_response_schema
+
+        schema = json.loads(_review_response_schema())
+
+        assert set(schema["properties"]) == {
+            "overall_score", "dimension_scores", "issues", "strengths", "improvements", "summary",
+        }
+        assert schema["properties"]["summary"]["description"]
+        assert "QualityLevel" not in schema["$defs"]
+        assert _review_response_schema() in QAAgent.REVIEW_SYSTEM_PROMPT
+
+    def test_example_is_parseable_report(self):
+        """프롬프트 예시는 모델에서 생성되어 그대로 파싱 가능"""
+        from prometheus.agents.qa_agent import _review_response_example
+
+        example = _review_response_example()
+        report = QAAgent(llm=CountingLLMClient(""))._parse_review_response(example)
+
+        assert example in QAAgent.REVIEW_SYSTEM_PROMPT
+        assert report.overall_score == 0.85
+        assert report.issues[0].suggestion == "Add a section covering X"
+
+
+class StructuredLLM:
+    """with_structured_output을 지원하는 Mock 채팅 모델"""
+
+    def __init__(self, report):
+        self.report = report
+        self.schema = None
+        self.inputs = []
+
+    def with_structured_output(self, schema):
+        self.schema = schema
+        return self
+
+    async def ainvoke(self, messages):
+        self.inputs.append(messages)
+        return self.report
+
+
+class TestStructuredOutput:
+    """구조화 출력 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_review_uses_structured_llm(self):
+        """구조화 출력 LLM의 결과를 JSON 파싱 없이 보고서로 사용"""
+        llm = StructuredLLM(QualityReport(
+            overall_score=0.65,
+            passed=True,
+            dimension_scores=[QualityScore(dimension=QualityDimension.CLARITY, score=0.65)],
+            summary="보통",
+        ))
+        agent = QAAgent(llm=llm)
+
+        report = await agent.review("검토할 보고서 내용", original_request="요청")
+
+        assert llm.schema is QualityReport
+        assert [role for role, _ in llm.inputs[0]] == ["system", "user"]
+        assert report.overall_score == 0.65
+        assert report.passed is False  # 통과 여부는 Agent 기준으로 다시 판정
+        assert report.summary == "보통"
+        assert json.loads(agent._messages[-1].content)["summary"] == "보통"
+
+    @pytest.mark.asyncio
+    async def test_structured_llm_follows_bind_llm(self):
+        """생성 후 bind_llm으로 연결한 LLM도 구조화 출력 사용"""
+        agent = QAAgent()
+        llm = StructuredLLM(QualityReport(overall_score=0.9, summary="첫 번째"))
+        agent.bind_llm(llm)
+        assert (await agent.review("내용")).summary == "첫 번째"
+
+        other = StructuredLLM(QualityReport(overall_score=0.9, summary="두 번째"))
+        agent.bind_llm(other)
+        assert (await agent.review("내용")).summary == "두 번째"
+        assert len(llm.inputs) == 1
+
+    @pytest.mark.asyncio
+    async def test_structured_failure_falls_back_to_text(self):
+        """구조화 출력 실패 시 텍스트 응답을 파싱"""
+
+        class FailingStructuredLLM(StructuredLLM):
+            async def ainvoke(self, messages):
+                raise ValueError("schema mismatch")
+
+            async def generate(self, messages, **kwargs):
+                return LLMResponse(
+                    content=json.dumps({"overall_score": 0.8, "summary": "텍스트"}),
+                    model="mock",
+                )
+
+        agent = QAAgent(llm=FailingStructuredLLM(None))
+        report = await agent.review("내용")
+
+        assert report.summary == "텍스트"
+        assert report.overall_score == 0.8
+
+
+class DimensionLLMClient:
+    """차원별 응답을 돌려주고 동시 호출 수를 기록하는 Mock LLM"""
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def generate(self, messages, **kwargs):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+        dimension = messages[-1].content.split("\n")[1]
+        return LLMResponse(content=json.dumps({
+            "score": self.scores[dimension],
+            "feedback": f"{dimension} 평가",
+            "suggestions": ["예시 추가"],
+            "issues": [{"severity": "high", "description": f"{dimension} 문제"}],
+        }), model="mock")
+
+
+class TestReviewParallel:
+    """차원별 병렬 리뷰 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_merges_dimension_results(self):
+        """차원별 결과를 하나의 보고서로 병합"""
+        llm = DimensionLLMClient({"accuracy": 1.0, "clarity": 0.6})
+        agent = QAAgent(llm=llm)
+
+        report = await agent.review_parallel(
+            "내용", dimensions=[QualityDimension.CLARITY, QualityDimension.ACCURACY]
+        )
+
+        assert llm.calls == 2
+        assert llm.max_active == 2
+        assert [s.dimension for s in report.dimension_scores] == [
+            QualityDimension.ACCURACY,
+            QualityDimension.CLARITY,
+        ]
+        assert report.overall_score == pytest.approx(0.8)
+        assert report.overall_level == QualityLevel.GOOD
+        assert [i.category for i in report.issues] == ["accuracy", "clarity"]
+        assert report.improvements == ["예시 추가"]
+        assert report.passed is True
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """동시 호출 수 제한"""
+        scores = {d.value: 0.5 for d in QualityDimension}
+        llm = DimensionLLMClient(scores)
+        agent = QAAgent(config=QAConfig(max_parallel_dimensions=2), llm=llm)
+
+        await agent.review_parallel("내용", dimensions=list(QualityDimension))
+
+        assert llm.calls == len(QualityDimension)
+        assert llm.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_run_uses_parallel_review_when_enabled(self):
+        """parallel_dimensions 설정 시 run()이 병렬 리뷰 사용"""
+        scores = {d.value: 0.9 for d in QualityDimension}
+        llm = DimensionLLMClient(scores)
+        agent = QAAgent(config=QAConfig(parallel_dimensions=True), llm=llm)
+
+        output = await agent.run(AgentInput(task="병렬로 검토할 보고서 내용입니다"))
+
+        assert llm.calls == len(agent.config.dimensions)
+        assert output.result.overall_level == QualityLevel.EXCELLENT
+
+
+class TestShortContent:
+    """짧은 내용 단축 처리 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("task", ["", "   ", "짧음"])
+    async def test_run_skips_llm(self, task):
+        """빈/짧은 내용은 LLM 호출 없이 불합격"""
+        llm = CountingLLMClient(REVIEW_RESPONSE)
+        agent = QAAgent(llm=llm)
+
+        output = await agent.run(AgentInput(task=task))
+
+        assert llm.calls == 0
+        assert output.success is False
+        assert output.result.passed is False
+        assert output.result.overall_score == 0.0
+        assert output.metadata["skipped"] == "content_too_short"
+
+    @pytest.mark.asyncio
+    async def test_validation_skips_llm(self):
+        """요청이 비었거나 내용이 짧으면 LLM 호출 없이 기본 결과"""
+        llm = CountingLLMClient('{"passed": true}')
+        agent = QAAgent(llm=llm)
+
+        no_request = await agent.validate_against_request("충분히 긴 보고서 내용입니다", "  ")
+        short = await agent.validate_against_request("짧음", "요청")
+
+        assert llm.calls == 0
+        assert no_request["passed"] is False
+        assert no_request["feedback"] == "Original request is empty"
+        assert short["missing_requirements"] == []
+
+    @pytest.mark.asyncio
+    async def test_suggestions_skip_llm(self):
+        """짧은 내용은 개선점 없이 반환"""
+        llm = CountingLLMClient('["예시 추가"]')
+        agent = QAAgent(config=QAConfig(min_content_length=3), llm=llm)
+
+        assert await agent.suggest_improvements("ab") == []
+        assert await agent.suggest_improvements("abc") == ["예시 추가"]
+        assert llm.calls == 1
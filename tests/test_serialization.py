@@ -0,0 +1,42 @@
+"""
+JSON 직렬화 유틸리티 테스트
+"""
+
+import json
+from datetime import date
+
+from prometheus.utils.serialization import dumps_cached
+
+
+class TestDumpsCached:
+    """dumps_cached 테스트"""
+
+    def test_matches_stdlib_json(self):
+        """표준 json과 동일한 데이터로 직렬화"""
+        data = {"이름": "울산", "values": [1, 2.5, None, True], "nested": {"k": (1, 2)}}
+        assert json.loads(dumps_cached(data)) == json.loads(json.dumps(data))
+        assert "울산" in dumps_cached(data)
+
+    def test_equal_scalars_are_not_confused(self):
+        """True / 1 / 1.0 은 서로 다른 결과"""
+        assert dumps_cached({"a": True}) != dumps_cached({"a": 1})
+        assert dumps_cached({"a": 1}) != dumps_cached({"a": 1.0})
+
+    def test_indent_and_uncacheable_values(self):
+        """들여쓰기 및 캐시 불가능한 값 처리"""
+        assert dumps_cached({"a": 1}, indent=True) == '{\n  "a": 1\n}'
+        assert json.loads(dumps_cached({"d": date(2024, 1, 2)})) == {"d": "2024-01-02"}
+
+    def test_stdlib_fallback_reuses_cache(self, monkeypatch):
+        """orjson이 없으면 동일 데이터의 직렬화 결과를 캐시에서 재사용"""
+        from prometheus.utils import serialization
+
+        monkeypatch.setattr(serialization, "orjson", None)
+        serialization._encode_frozen.cache_clear()
+        data = {"plan": ["a", "b"], "n": 1}
+
+        first = dumps_cached(data, indent=True)
+        second = dumps_cached(dict(data), indent=True)
+
+        assert first == second == json.dumps(data, ensure_ascii=False, indent=2)
+        assert serialization._encode_frozen.cache_info().hits == 1
@@ -0,0 +1,439 @@
+"""
+WriterAgent 테스트 (LangChain / 레거시)
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+from prometheus.agents.base import AgentInput
+from prometheus.agents.langchain_base import AgentConfig
+from prometheus.agents.writer import (
+    Citation,
+    RateLimiter,
+    ReportOutput,
+    WriterAgent as LCWriterAgent,
+    create_writer_agent,
+)
+from prometheus.agents.writer_agent import GeneratedDocument, WriterAgent, WriterConfig, _split_into_chunks
+from prometheus.llm.base import LLMResponse
+from prometheus.llm.cache import clear_response_cache
+
+
+class EchoLLMClient:
+    """마지막 user 메시지 일부를 돌려주고 동시 호출 수를 기록하는 Mock LLM"""
+
+    def __init__(self):
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def generate(self, messages, **kwargs):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return LLMResponse(content=f"문서 {messages[-1].content[-40:]}", model="mock")
+
+
+class TestReportWriter:
+    """LangChain WriterAgent 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_abatch_reports_uses_chain_batch(self):
+        """여러 보고서를 한 번의 체인 배치로 작성하고 실패 항목은 기본 보고서로 대체"""
+        agent = LCWriterAgent(llm=MagicMock())
+        agent.chain = MagicMock()
+
+        async def fake_abatch(input_dicts, config=None, **kwargs):
+            assert kwargs["return_exceptions"] is True
+            return [
+                {"title": input_dicts[0]["input"].split("\n")[1], "summary": "요약", "content": "본문"},
+                RuntimeError("boom"),
+            ]
+
+        agent.chain.abatch = fake_abatch
+        reports = await agent.abatch_reports([
+            {"request": f"요청 {i}", "plan": {"task_summary": f"계획 {i}"}, "execution_result": {}}
+            for i in range(2)
+        ])
+
+        assert reports[0].title == "요청 0"
+        assert reports[1].summary == "계획 1"
+
+    def test_write_reports_applies_max_concurrency(self):
+        """배치 실행 시 Agent 설정의 최대 동시 호출 수 적용"""
+        agent = LCWriterAgent(llm=MagicMock())
+        agent.config.max_concurrency = 4
+        agent.chain = MagicMock()
+        agent.chain.batch.return_value = [
+            ReportOutput(title="제목", summary="요약", content="본문"),
+        ]
+
+        reports = agent.write_reports([{"request": "요청", "plan": {}, "execution_result": {}}])
+
+        assert reports[0].title == "제목"
+        assert agent.chain.batch.call_args.kwargs["config"] == {"max_concurrency": 4}
+
+    @pytest.mark.asyncio
+    async def test_awrite_report_falls_back_on_error(self):
+        """비동기 작성 실패 시 기본 보고서 반환"""
+        agent = LCWriterAgent(llm=MagicMock())
+
+        with patch.object(LCWriterAgent, "ainvoke", side_effect=RuntimeError("boom")):
+            report = await agent.awrite_report("요청", {"task_summary": "계획 요약"}, {"ok": True})
+
+        assert isinstance(report, ReportOutput)
+        assert report.summary == "계획 요약"
+
+    def test_system_prompt_is_sent_verbatim(self):
+        """스키마 예시의 중괄호가 템플릿 변수로 해석되지 않음"""
+        prompt = '응답 예시: {"title": "제목", "summary": "요약"}'
+        agent = LCWriterAgent(llm=MagicMock(), config=AgentConfig(system_prompt=prompt))
+
+        messages = agent.chain.first.invoke({"input": "요청"}).to_messages()
+
+        assert messages[0].content == prompt
+        assert messages[1].content == "요청"
+
+    def test_prompt_caching_marks_system_block(self):
+        """프롬프트 캐싱 시 시스템 프롬프트에 cache_control 지정"""
+        agent = LCWriterAgent(llm=MagicMock(), prompt_caching=True)
+
+        system = agent.chain.first.invoke({"input": "요청"}).to_messages()[0]
+
+        assert system.content == [{
+            "type": "text",
+            "text": agent._get_system_prompt(),
+            "cache_control": {"type": "ephemeral"},
+        }]
+
+    def test_write_report_reuses_cached_output(self):
+        """같은 입력의 보고서는 캐시에서 복사본으로 반환"""
+        clear_response_cache()
+        agent = LCWriterAgent(llm=MagicMock())
+        output = ReportOutput(title="제목", summary="요약", content="본문", conclusions=["결론"])
+
+        with patch.object(LCWriterAgent, "invoke", return_value=output) as invoke:
+            first = agent.write_report("요청", {"a": 1}, {"b": 2})
+            first.conclusions.append("변경")
+            second = agent.write_report("요청", {"a": 1}, {"b": 2})
+            agent.write_report("다른 요청", {"a": 1}, {"b": 2})
+
+        assert invoke.call_count == 2
+        assert second.conclusions == ["결론"]
+        clear_response_cache()
+
+    @pytest.mark.asyncio
+    async def test_astream_report_yields_partial_fields(self):
+        """스트리밍 청크를 부분 보고서 dict로 전달"""
+        agent = LCWriterAgent(llm=MagicMock())
+        agent.chain = MagicMock()
+        received = {}
+
+        async def fake_astream(input_dict, config=None, **kwargs):
+            received.update(input_dict)
+            yield {"title": "제목"}
+            yield ReportOutput(title="제목", summary="요약", content="본문")
+
+        agent.chain.astream = fake_astream
+        chunks = [c async for c in agent.astream_report("요청", {}, {})]
+
+        assert received["input"].startswith("## 원본 요청\n요청")
+        assert chunks[0] == {"title": "제목"}
+        assert chunks[-1]["summary"] == "요약"
+
+    def test_schema_prompt_is_built_once_per_schema(self):
+        """출력 스키마 설명은 스키마 클래스별로 한 번만 생성"""
+        from prometheus.agents.langchain_base import StructuredOutputAgent, _schema_info
+
+        _schema_info.cache_clear()
+        with patch.object(ReportOutput, "model_json_schema", return_value={"title": "ReportOutput"}) as schema:
+            first = StructuredOutputAgent(llm=MagicMock(), output_schema=ReportOutput)
+            second = StructuredOutputAgent(llm=MagicMock(), output_schema=ReportOutput)
+            prompts = [first._get_system_prompt(), second._get_system_prompt()]
+        _schema_info.cache_clear()
+
+        assert schema.call_count == 1
+        assert prompts[0] == prompts[1]
+        assert prompts[0].endswith("[Output Schema]\n{'title': 'ReportOutput'}")
+
+    def test_write_markdown(self):
+        """항목이 있는 섹션만 Markdown에 포함"""
+        agent = LCWriterAgent(llm=MagicMock())
+        report = ReportOutput(
+            title="제목",
+            summary="요약",
+            content="본문",
+            conclusions=["결론 1", "결론 2"],
+            citations=[Citation(source="문서", content="인용")],
+        )
+
+        with patch.object(LCWriterAgent, "write_report", return_value=report):
+            md = agent.write_markdown("요청", {}, {})
+
+        assert md == (
+            "# 제목\n\n## 요약\n요약\n\n## 상세 내용\n본문\n\n"
+            "## 결론\n- 결론 1\n- 결론 2\n\n"
+            "## 참고 자료\n- [문서] 인용\n\n"
+        )
+
+    def test_report_input_text(self):
+        """입력 텍스트는 계획/결과 JSON과 추가 컨텍스트를 포함"""
+        agent = LCWriterAgent(llm=MagicMock())
+
+        text = agent._build_report_input("요청", {"a": 1}, {"b": "결과"}, "참고")
+
+        assert text == (
+            '## 원본 요청\n요청\n\n## 실행 계획\n{\n  "a": 1\n}\n\n'
+            '## 실행 결과\n{\n  "b": "결과"\n}\n'
+            "\n## 추가 컨텍스트\n참고"
+            "\n\n위 정보를 바탕으로 전문적인 보고서를 작성해주세요."
+        )
+
+
+    def test_report_word_count_is_computed(self):
+        """단어 수는 본문에서 계산하고 직렬화에 포함"""
+        report = ReportOutput(title="제목", summary="요약", content="첫 번째\n  문단 ", word_count=100)
+
+        assert report.word_count == 3
+        assert report.model_dump()["word_count"] == 3
+        assert "word_count" not in ReportOutput.model_json_schema()["properties"]
+
+    def test_report_copy_recounts_words(self):
+        """model_copy(update=...)로 바꾼 본문의 단어 수를 다시 계산"""
+        report = ReportOutput(title="제목", summary="요약", content="하나 둘")
+        assert report.word_count == 2
+
+        assert report.model_copy(update={"content": "하나"}).word_count == 1
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_request_window(self):
+        """윈도우당 요청 수를 넘으면 가장 오래된 요청이 빠질 때까지 대기"""
+        limiter = RateLimiter(requests_per_minute=2, window=0.05)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+        assert loop.time() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_token_budget(self):
+        """토큰 한도를 넘지 않으면 바로 허용하고, 빈 윈도우는 큰 요청도 허용"""
+        limiter = RateLimiter(tokens_per_minute=100)
+
+        await asyncio.wait_for(limiter.acquire(500), timeout=0.1)
+
+        limiter = RateLimiter(tokens_per_minute=100)
+        await limiter.acquire(60)
+        await asyncio.wait_for(limiter.acquire(40), timeout=0.1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(1), timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_abatch_reports_goes_through_limiter(self):
+        """속도 제한이 있으면 보고서마다 한도를 확인하고 실행"""
+        limiter = RateLimiter(requests_per_minute=10)
+        agent = LCWriterAgent(llm=MagicMock(), rate_limiter=limiter)
+        output = ReportOutput(title="제목", summary="요약", content="본문")
+
+        with patch("prometheus.agents.writer.StructuredOutputAgent.ainvoke", return_value=output) as ainvoke:
+            reports = await agent.abatch_reports([
+                {"request": f"요청 {i}", "plan": {}, "execution_result": {}} for i in range(3)
+            ])
+
+        assert [r.title for r in reports] == ["제목"] * 3
+        assert ainvoke.call_count == 3
+        assert len(limiter._events) == 3
+
+
+class TestCreateWriterAgent:
+    """create_writer_agent 테스트"""
+
+    def test_uses_cached_llm_factory(self):
+        """LLM은 팩토리 캐시를 통해 생성하고 Anthropic이면 프롬프트 캐싱 사용"""
+        with patch("prometheus.agents.writer.create_llm", return_value=MagicMock()) as create_llm:
+            agent = create_writer_agent(provider="anthropic")
+
+        create_llm.assert_called_once_with(
+            "anthropic", model="claude-sonnet-4-20250514", temperature=0.7,
+        )
+        assert agent.config.prompt_caching is True
+        assert agent._rate_limiter.requests_per_minute == 50
+
+    def test_given_llm_determines_limits(self):
+        """전달받은 LLM이 있으면 provider 인자 대신 LLM 클래스로 판별"""
+        ChatAnthropic = type("ChatAnthropic", (), {
+            "__module__": "langchain_anthropic.chat_models",
+            "with_structured_output": lambda self, schema: MagicMock(),
+        })
+
+        agent = create_writer_agent(llm=ChatAnthropic())
+        assert agent.config.prompt_caching is True
+        assert agent._rate_limiter.requests_per_minute == 50
+
+        agent = create_writer_agent(llm=MagicMock(), provider="anthropic")
+        assert agent.config.prompt_caching is False
+        assert agent._rate_limiter.requests_per_minute is None
+
+    def test_unknown_provider(self):
+        """알 수 없는 프로바이더는 ValueError"""
+        with pytest.raises(ValueError, match="Unknown provider"):
+            create_writer_agent(provider="unknown")
+
+
+class TestDocumentWriter:
+    """레거시 WriterAgent 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_run_batch(self):
+        """여러 입력을 동시에 처리하고 입력 순서대로 반환"""
+        llm = EchoLLMClient()
+        agent = WriterAgent(llm=llm)
+
+        outputs = await agent.run_batch([
+            AgentInput(task=f"소스 {i}", context={"title": f"제목 {i}"}) for i in range(3)
+        ])
+
+        assert [o.success for o in outputs] == [True, True, True]
+        assert [o.result.title for o in outputs] == ["제목 0", "제목 1", "제목 2"]
+        assert llm.calls == 3
+        assert llm.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_generate_document_uses_response_cache(self):
+        """같은 문서 요청은 LLM을 다시 호출하지 않음"""
+        llm = EchoLLMClient()
+        agent = WriterAgent(llm=llm)
+
+        first = await agent.generate_document("제목", "소스 내용")
+        second = await agent.generate_document("제목", "소스 내용")
+
+        assert llm.calls == 1
+        assert second.content == first.content
+
+    @pytest.mark.asyncio
+    async def test_apply_template_fills_placeholders_locally(self):
+        """모든 플레이스홀더가 채워지면 LLM 없이 완성 (값 안의 중괄호는 다시 치환하지 않음)"""
+        llm = EchoLLMClient()
+        agent = WriterAgent(llm=llm)
+        agent.register_template("보고", "# {{title}}\n{{body}} / {{title}}")
+
+        document = await agent.apply_template("보고", {"title": "제목", "body": "{{title}} 본문"})
+
+        assert document.content == "# 제목\n{{title}} 본문 / 제목"
+        assert llm.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_apply_template_uses_registered_defaults(self):
+        """data에 없는 플레이스홀더는 기본값으로 채우고 LLM을 호출하지 않음"""
+        llm = EchoLLMClient()
+        agent = WriterAgent(llm=llm)
+        agent.register_template("보고", "# {{title}}\n{{summary}}{{footer}}")
+        agent.set_template_default("summary", "요약 없음")
+        agent.set_template_default("footer", "")
+
+        document = await agent.apply_template("보고", {"title": "제목", "footer": "\n끝"})
+
+        assert document.content == "# 제목\n요약 없음\n끝"
+        assert document.metadata["llm_filled"] is False
+        assert llm.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_apply_template_uses_llm_for_missing_keys(self):
+        """채울 수 없는 플레이스홀더가 남으면 LLM으로 완성"""
+        llm = EchoLLMClient()
+        agent = WriterAgent(llm=llm)
+        agent.register_template("보고", "# {{title}}\n{{summary}}")
+
+        document = await agent.apply_template("보고", {"title": "제목"})
+
+        assert llm.calls == 1
+        assert document.metadata["llm_filled"] is True
+
+    def test_document_word_count_is_lazy(self):
+        """단어 수는 처음 접근할 때 계산하고 문서는 변경 불가"""
+        document = GeneratedDocument(title="제목", content="하나 둘 셋")
+
+        assert "word_count" not in document.__dict__
+        assert document.word_count == 3
+        assert document.model_dump()["word_count"] == 3
+        with pytest.raises(ValidationError):
+            document.content = "하나"
+
+    def test_document_copy_recounts_words(self):
+        """model_copy(update=...)로 바꾼 본문의 단어 수를 다시 계산"""
+        document = GeneratedDocument(title="제목", content="하나 둘")
+        assert document.word_count == 2
+
+        copied = document.model_copy(update={"content": "one two three four"})
+        assert copied.word_count == 4
+        assert document.word_count == 2
+
+    def test_document_copy_rerenders_html(self):
+        """model_copy(update=...)로 바꾼 제목과 본문으로 HTML을 다시 생성"""
+        document = GeneratedDocument(title="Old", content="old body")
+        assert "Old" in document.to_html()
+
+        copied = document.model_copy(update={"title": "New", "content": "new body"})
+        html_text = copied.to_html()
+        assert "<title>New</title>" in html_text
+        assert "new body" in html_text
+        assert "Old" not in html_text
+
+    def test_split_into_chunks_packs_paragraphs(self):
+        """연속된 문단을 토큰 예산 안에서 묶고 짧은 내용은 그대로 유지"""
+        content = "가" * 30 + "\n\n" + "나" * 30 + "\n\n\n" + "다" * 60
+
+        assert _split_into_chunks(content, 25) == ["가" * 30 + "\n\n" + "나" * 30, "다" * 60]
+        assert _split_into_chunks(content, 1000) == [content]
+        assert _split_into_chunks(content, 0) == [content]
+
+    @pytest.mark.asyncio
+    async def test_translate_processes_chunks_concurrently(self):
+        """긴 내용은 청크별로 동시에 번역하고 원문 순서대로 합침"""
+        llm = EchoLLMClient()
+        agent = WriterAgent(llm=llm, config=WriterConfig(chunk_max_tokens=15, max_parallel_chunks=2))
+        paragraphs = [f"문단 {i} " + "내용" * 10 for i in range(3)]
+
+        translated = await agent.translate("\n\n".join(paragraphs), "ko", "en")
+
+        assert llm.calls == 3
+        assert llm.max_active == 2
+        assert translated.index("문단 0") < translated.index("문단 1") < translated.index("문단 2")
+
+    @pytest.mark.asyncio
+    async def test_summarize_reduces_chunk_summaries(self):
+        """여러 청크 요약은 한 번 더 요약"""
+        llm = EchoLLMClient()
+        agent = WriterAgent(llm=llm, config=WriterConfig(chunk_max_tokens=15))
+
+        await agent.summarize("\n\n".join("내용" * 20 for _ in range(2)))
+
+        assert llm.calls == 3
+
+    def test_register_template_precompiles_parts(self):
+        """템플릿은 등록 시 리터럴/플레이스홀더 조각으로 분해되고 제거 시 함께 삭제"""
+        agent = WriterAgent(llm=EchoLLMClient())
+        agent.register_template("보고", "# {{title}}\n{{body}}")
+
+        assert agent._compiled_templates["보고"] == [("# ", "title"), ("\n", "body"), ("", None)]
+        assert agent.remove_template("보고") is True
+        assert "보고" not in agent._compiled_templates
+
+    def test_to_html_escapes_title(self):
+        """제목은 이스케이프하고 변환 결과는 재사용"""
+        document = GeneratedDocument(title="<b>제목</b>", content="첫 줄\n둘째 줄")
+
+        html = document.to_html()
+
+        assert "<title>&lt;b&gt;제목&lt;/b&gt;</title>" in html
+        assert "<h1>&lt;b&gt;제목&lt;/b&gt;</h1>\n첫 줄<br>\n둘째 줄\n</body>" in html
+        assert document.to_html() is html